@@ -2,15 +2,74 @@
 JWT token handling for authentication.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+from typing import Optional, Dict, Any, Tuple
+import jwt
+from jwt import DecodeError, InvalidTokenError
 from config import settings
+import hashlib
 import logging
+import orjson
+import time
 
 logger = logging.getLogger(__name__)
 
 
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT with orjson for the claims (de)serialization."""
+    
+    def _encode_payload(self, payload, headers=None, json_encoder=None) -> bytes:
+        return orjson.dumps(payload)
+    
+    def _decode_payload(self, decoded):
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+# Signing parameters, read from settings once instead of per call
+_SECRET_KEY = settings.jwt_secret_key
+_ALGORITHM = settings.jwt_algorithm
+_ALGORITHMS = [_ALGORITHM]
+_ACCESS_EXPIRE_SECONDS = settings.jwt_access_token_expire_minutes * 60
+_REFRESH_EXPIRE_SECONDS = settings.jwt_refresh_token_expire_days * 24 * 60 * 60
+
+# Verified-token cache: blake2b(token) -> (payload, expires_at epoch seconds).
+# Clients reuse the same bearer token for its whole lifetime, so a hit skips
+# the HMAC check and payload parsing. Raw tokens are never stored.
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache: Dict[bytes, Tuple[Dict[str, Any], float]] = {}
+
+# Upper bound for a well-formed token; anything longer is rejected unparsed
+_MAX_TOKEN_LENGTH = 8192
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _cache_verified_token(key: bytes, payload: Dict[str, Any]):
+    """Cache a verified payload, never past the token's own expiry."""
+    now = time.time()
+    exp = payload.get("exp")
+    expires_at = now + _TOKEN_CACHE_TTL_SECONDS
+    if exp is not None:
+        expires_at = min(expires_at, float(exp))
+    if expires_at <= now:
+        return
+    
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _token_cache.pop(next(iter(_token_cache)))
+    _token_cache[key] = (payload, expires_at)
+
+
 def create_access_token(data: Dict[str, Any]) -> str:
     """
     Create JWT access token.
@@ -22,13 +81,13 @@ def create_access_token(data: Dict[str, Any]) -> str:
         JWT token string
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+    expire = int(time.time()) + _ACCESS_EXPIRE_SECONDS
     to_encode.update({"exp": expire, "type": "access"})
     
-    encoded_jwt = jwt.encode(
+    encoded_jwt = _jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm
+        _SECRET_KEY,
+        algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -44,13 +103,13 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
         JWT token string
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.jwt_refresh_token_expire_days)
+    expire = int(time.time()) + _REFRESH_EXPIRE_SECONDS
     to_encode.update({"exp": expire, "type": "refresh"})
     
-    encoded_jwt = jwt.encode(
+    encoded_jwt = _jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm
+        _SECRET_KEY,
+        algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -66,11 +125,27 @@ def verify_token(token: str, token_type: str = "access") -> Optional[Dict[str, A
     Returns:
         Decoded payload or None if invalid
     """
+    # Reject obviously malformed tokens before hashing or crypto
+    if not token or len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
+        logger.error("JWT verification failed: malformed token")
+        return None
+    
+    cache_key = _token_cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        payload, expires_at = cached
+        if expires_at > time.time():
+            if payload.get("type") != token_type:
+                logger.warning(f"Invalid token type: expected {token_type}, got {payload.get('type')}")
+                return None
+            return payload
+        _token_cache.pop(cache_key, None)
+    
     try:
-        payload = jwt.decode(
+        payload = _jwt.decode(
             token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm]
+            _SECRET_KEY,
+            algorithms=_ALGORITHMS
         )
         
         # Verify token type
@@ -78,15 +153,11 @@ def verify_token(token: str, token_type: str = "access") -> Optional[Dict[str, A
             logger.warning(f"Invalid token type: expected {token_type}, got {payload.get('type')}")
             return None
         
-        # Check expiration
-        exp = payload.get("exp")
-        if exp and datetime.fromtimestamp(exp) < datetime.utcnow():
-            logger.warning("Token has expired")
-            return None
-        
+        # Expiration is enforced by jwt.decode (ExpiredSignatureError)
+        _cache_verified_token(cache_key, payload)
         return payload
     
-    except JWTError as e:
+    except InvalidTokenError as e:
         logger.error(f"JWT verification failed: {str(e)}")
         return None
 
@@ -102,9 +173,9 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
         Decoded payload
     """
     try:
-        return jwt.decode(
+        return _jwt.decode(
             token,
             options={"verify_signature": False}
         )
-    except JWTError:
+    except InvalidTokenError:
         return None
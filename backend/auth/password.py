@@ -2,7 +2,49 @@
 Password hashing and verification using bcrypt.
 """
 
+import asyncio
+import logging
+import time
 import bcrypt
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Work factor for new hashes; verification reads the cost from the hash
+_rounds = settings.bcrypt_cost
+_MAX_ROUNDS = 16
+
+
+def calibrate_rounds(target_ms: float) -> int:
+    """
+    Pick the bcrypt cost so one hash takes about target_ms on this host.
+    
+    Never goes below settings.bcrypt_cost. Only affects new hashes;
+    existing hashes keep verifying at the cost they were created with.
+    
+    Args:
+        target_ms: Desired hashing time in milliseconds
+    
+    Returns:
+        Selected cost
+    """
+    global _rounds, _dummy_hash
+    
+    rounds = settings.bcrypt_cost
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=rounds))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    # Each extra round doubles the work
+    while rounds < _MAX_ROUNDS and elapsed_ms * 2 <= target_ms:
+        rounds += 1
+        elapsed_ms *= 2
+    
+    _rounds = rounds
+    # Rehash at the new cost so unknown-email logins stay as slow as real ones
+    _dummy_hash = hash_password(_DUMMY_PASSWORD)
+    logger.info(f"bcrypt cost calibrated to {rounds} (~{elapsed_ms:.0f} ms per hash)")
+    return rounds
 
 
 def hash_password(password: str) -> str:
@@ -18,7 +60,7 @@ def hash_password(password: str) -> str:
     # Convert password to bytes
     password_bytes = password.encode('utf-8')
     # Generate salt and hash
-    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
+    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=_rounds))
     # Return as string
     return hashed.decode('utf-8')
 
@@ -39,3 +81,47 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     hashed_bytes = hashed_password.encode('utf-8')
     # Check password
     return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+_DUMMY_PASSWORD = "dummy-password-for-timing"
+
+
+def get_dummy_hash() -> str:
+    """
+    Hash to verify against when the login email is unknown.
+    
+    Both paths then do the same bcrypt work, so response timing does not
+    reveal which accounts exist. Recreated by calibrate_rounds whenever
+    the cost changes.
+    """
+    return _dummy_hash
+
+
+_dummy_hash = hash_password(_DUMMY_PASSWORD)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on a worker thread so the event loop is not blocked.
+    
+    Args:
+        password: Plain text password
+    
+    Returns:
+        Hashed password
+    """
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on a worker thread so the event loop is not blocked.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+    
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
@@ -4,23 +4,28 @@ Uses raw asyncpg to avoid SQLAlchemy pooling conflicts.
 """
 import asyncio
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import asyncpg
-import bcrypt  # Uses direct bcrypt instead of passlib
 
 # Add parent directory to path to import from backend
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import settings
+from auth.password import hash_password
+from db_models import UserRole
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt directly."""
-    password_bytes = password.encode('utf-8')
-    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
-    return hashed.decode('utf-8')
-
-async def create_user_raw(conn, email, password, full_name, role):
-    # Check valid enum values
+async def fetch_role_map(conn):
+    """
+    Read the 'userrole' enum labels once per run.
+    
+    Args:
+        conn: asyncpg connection
+        
+    Returns:
+        Dict mapping lowercase role name to the label stored in the DB
+        (empty if the enum could not be read)
+    """
     try:
         enums = await conn.fetch("""
             SELECT e.enumlabel
@@ -28,31 +33,76 @@ async def create_user_raw(conn, email, password, full_name, role):
             JOIN pg_enum e ON t.oid = e.enumtypid
             WHERE t.typname = 'userrole'
         """)
-        valid_roles = [r['enumlabel'] for r in enums]
-        print(f"ℹ️ Valid 'userrole' values in DB: {valid_roles}")
-        
-        # Adjust role to match case if found
-        for r_val in valid_roles:
-            if r_val.lower() == role.lower():
-                print(f"🔄 Adjusting role '{role}' to '{r_val}'")
-                role = r_val
-                break
+        role_map = {r['enumlabel'].lower(): r['enumlabel'] for r in enums}
+        print(f"ℹ️ Valid 'userrole' values in DB: {list(role_map.values())}")
+        return role_map
     except Exception as e:
         print(f"⚠️ Could not check enums: {e}")
+        return {}
 
-    # Check if exists
-    exists = await conn.fetchval("SELECT id FROM users WHERE email = $1", email)
-    if exists:
-        print(f"❌ User '{email}' already exists.")
-        return
+def resolve_role(role_map, role):
+    """
+    Match a role name to the case used by the DB enum.
+    
+    Args:
+        role_map: Mapping from fetch_role_map()
+        role: Role name as given by the caller
+        
+    Returns:
+        DB enum label, falling back to the UserRole value from db_models
+    """
+    if role_map:
+        return role_map.get(role.lower(), role)
+    try:
+        return UserRole[role.upper()].value
+    except KeyError:
+        return role
+
+async def hash_passwords(passwords):
+    """
+    Hash passwords in parallel across CPU cores.
+    
+    Args:
+        passwords: Iterable of plain text passwords
+        
+    Returns:
+        List of bcrypt hashes in input order
+    """
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor() as pool:
+        return await asyncio.gather(*[
+            loop.run_in_executor(pool, hash_password, p) for p in passwords
+        ])
+
+async def create_users_raw(conn, role_map, users):
+    """
+    Create users in a single INSERT ... ON CONFLICT round-trip.
+    
+    Args:
+        conn: asyncpg connection
+        role_map: Role mapping from fetch_role_map()
+        users: List of (email, password, full_name, role) tuples
+    """
+    emails = [u[0] for u in users]
+    names = [u[2] for u in users]
+    roles = [resolve_role(role_map, u[3]) for u in users]
+    hashes = await hash_passwords(u[1] for u in users)
 
-    hashed = hash_password(password)
-    await conn.execute("""
+    created = await conn.fetch("""
         INSERT INTO users (id, email, hashed_password, full_name, role, is_active, created_at, updated_at)
-        VALUES (gen_random_uuid(), $1, $2, $3, $4, true, now(), now())
-    """, email, hashed, full_name, role)
+        SELECT gen_random_uuid(), u.email, u.hashed_password, u.full_name, u.role::userrole, true, now(), now()
+        FROM unnest($1::text[], $2::text[], $3::text[], $4::text[])
+            AS u(email, hashed_password, full_name, role)
+        ON CONFLICT (email) DO NOTHING
+        RETURNING email, role
+    """, emails, hashes, names, roles)
     
-    print(f"✅ User '{email}' created successfully ({role}).")
+    created_roles = {r['email']: r['role'] for r in created}
+    for email in emails:
+        if email in created_roles:
+            print(f"✅ User '{email}' created successfully ({created_roles[email]}).")
+        else:
+            print(f"❌ User '{email}' already exists.")
 
 async def main():
     print("🚀 Creating users with raw asyncpg...")
@@ -70,8 +120,8 @@ async def main():
     ]
 
     try:
-        for email, pwd, name, role in users:
-            await create_user_raw(conn, email, pwd, name, role)
+        role_map = await fetch_role_map(conn)
+        await create_users_raw(conn, role_map, users)
     finally:
         await conn.close()
 
@@ -4,7 +4,7 @@ Database connection and session management.
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 from config import settings
 import logging
 
@@ -18,16 +18,42 @@ def _get_start_name(*args):
     return f"stmt_{uuid.uuid4().hex}"
 
 # Create async engine
-# using NullPool to avoid "prepared statement already exists" errors with Supabase Transaction Mode
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.app_debug,
-    poolclass=NullPool,
-    connect_args={
-        "statement_cache_size": 0,
-        "prepared_statement_name_func": _get_start_name
-    }
-)
+if settings.db_transaction_pooler:
+    # Transaction pooler hands out a different backend per transaction, so
+    # connections cannot be pooled and prepared statement names must be unique
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.app_debug,
+        poolclass=NullPool,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": _get_start_name
+        }
+    )
+else:
+    # Session pooler / direct connection: reuse connections across requests
+    # and keep asyncpg's prepared statement cache. Pre-ping (a SELECT 1 per
+    # checkout) is opt-in; stale connections are recycled and kept alive by
+    # TCP keepalives, and lost connections are invalidated by the dialect.
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.app_debug,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args={
+            "command_timeout": settings.db_command_timeout,
+            "server_settings": {
+                "jit": "off",
+                "tcp_keepalives_idle": "60",
+                "tcp_keepalives_interval": "10",
+                "tcp_keepalives_count": "5"
+            }
+        }
+    )
 
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -61,8 +87,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def init_db():
-    """Initialize database tables."""
+async def init_db(force: bool = False):
+    """
+    Initialize database tables.
+    
+    create_all probes the catalog for every table, so it only runs in debug,
+    when DB_AUTO_CREATE_TABLES is set, or when forced (e.g. reset_db.py).
+    
+    Args:
+        force: Create tables regardless of settings
+    """
+    if not (force or settings.app_debug or settings.db_auto_create_tables):
+        logger.info("Skipping table creation (DB_AUTO_CREATE_TABLES is off)")
+        return
+    
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created")
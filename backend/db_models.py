@@ -2,7 +2,8 @@
 SQLAlchemy database models.
 """
 
-from sqlalchemy import Column, String, Boolean, Integer, Float, Text, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, Integer, Float, Text, DateTime, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy import text as sql_text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -38,7 +39,32 @@ class ParticipantRole(str, enum.Enum):
     STAFF = "staff"
 
 
+def _pg_enum(enum_cls):
+    """
+    Native Postgres ENUM column type for a Python enum.
+    
+    The type name is pinned to the lowercased class name (what create_all
+    and existing databases already use) and string values are not
+    re-validated in Python.
+    
+    Args:
+        enum_cls: Python enum class
+        
+    Returns:
+        SQLAlchemy Enum type
+    """
+    return SQLEnum(
+        enum_cls,
+        name=enum_cls.__name__.lower(),
+        native_enum=True,
+        validate_strings=False
+    )
+
+
 # ==================== MODELS ====================
+# High-write tables (participants, transcripts, AI responses) let Postgres
+# generate their ids; low-write tables keep a client-side uuid4 so the id is
+# known before flush.
 
 class User(Base):
     """Staff user model."""
@@ -47,7 +73,7 @@ class User(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.AGENT)
+    role = Column(_pg_enum(UserRole), nullable=False, default=UserRole.AGENT)
     full_name = Column(String(255))
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -67,6 +93,8 @@ class Lead(Base):
     notes = Column(Text)
     sms_sent = Column(Boolean, default=False)
     sms_sent_at = Column(DateTime)
+    sms_sid = Column(String(64), index=True)
+    sms_status = Column(String(20))  # queued, sent, delivered, failed, ...
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -76,13 +104,18 @@ class Lead(Base):
 class Booking(Base):
     """Meeting booking model."""
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Newest-first listing, optionally by status, and reminder range scans
+        Index("ix_bookings_status_scheduled", "status", sql_text("scheduled_time DESC")),
+        Index("ix_bookings_scheduled", sql_text("scheduled_time DESC")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id"))
     customer_email = Column(String(255), nullable=False)
     scheduled_time = Column(DateTime, nullable=False)
     duration_minutes = Column(Integer, default=30)
-    status = Column(SQLEnum(BookingStatus), default=BookingStatus.PENDING)
+    status = Column(_pg_enum(BookingStatus), default=BookingStatus.PENDING)
     ms_booking_id = Column(String(255))  # Microsoft Bookings ID
     session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"))
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -100,7 +133,7 @@ class Session(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     zoom_meeting_id = Column(String(255))
     zoom_meeting_password = Column(String(255))
-    status = Column(SQLEnum(SessionStatus), default=SessionStatus.PENDING)
+    status = Column(_pg_enum(SessionStatus), default=SessionStatus.PENDING)
     created_at = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime, nullable=False)
     ended_at = Column(DateTime)
@@ -116,9 +149,9 @@ class SessionParticipant(Base):
     """Session participant model."""
     __tablename__ = "session_participants"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=sql_text("gen_random_uuid()"))
     session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), nullable=False)
-    role = Column(SQLEnum(ParticipantRole), nullable=False)
+    role = Column(_pg_enum(ParticipantRole), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     name = Column(String(255))
     joined_at = Column(DateTime, default=datetime.utcnow)
@@ -132,7 +165,7 @@ class Transcript(Base):
     """Conversation transcript model."""
     __tablename__ = "transcripts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=sql_text("gen_random_uuid()"))
     session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), nullable=False)
     speaker = Column(String(50), nullable=False)  # customer, staff, speaker_0, etc.
     text = Column(Text, nullable=False)
@@ -147,7 +180,7 @@ class AIResponse(Base):
     """AI-generated response model."""
     __tablename__ = "ai_responses"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=sql_text("gen_random_uuid()"))
     session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), nullable=False)
     query = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
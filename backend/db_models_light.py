@@ -0,0 +1,28 @@
+"""
+Lightweight row types for hot-path inserts.
+
+ORM instances carry identity-map and attribute-event bookkeeping that is
+wasted on rows that are written once and discarded. These slotted
+dataclasses mirror the insertable columns of their db_models counterparts.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+import uuid
+
+
+@dataclass(slots=True)
+class TranscriptRow:
+    """In-flight row for the transcripts table."""
+    session_id: uuid.UUID
+    speaker: str
+    text: str
+    confidence: float
+    timestamp: datetime
+
+    # Column order of as_record(), for COPY
+    COLUMNS = ("session_id", "speaker", "text", "confidence", "timestamp")
+
+    def as_record(self) -> tuple:
+        """Return the row as a tuple in COLUMNS order."""
+        return (self.session_id, self.speaker, self.text, self.confidence, self.timestamp)
@@ -4,18 +4,26 @@ FastAPI main application.
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from config import settings
 from database import init_db, close_db
 from websocket.manager import connection_manager
+from services.transcript_writer import transcript_writer
 from websocket.handlers import (
     handle_transcription_event,
     handle_participant_join,
-    handle_participant_leave
+    handle_participant_leave,
+    handle_start_transcription
 )
+from services.deepgram_service import deepgram_service
+from services.http_client import get_http_client, close_http_client
+from services.redis_client import close_redis
 from middleware.error_handler import register_error_handlers
 from middleware.rate_limiter import setup_rate_limiting, limiter
+import asyncio
 import logging
+import orjson
 
 # Import routers
 from routes import sessions, zoom, leads, ai, auth, twilio_webhooks, bookings, rag
@@ -27,6 +35,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-request access lines are noise at production traffic levels
+if settings.is_production:
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,6 +51,32 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
     
+    if settings.bcrypt_target_ms:
+        from auth.password import calibrate_rounds
+        await asyncio.to_thread(calibrate_rounds, settings.bcrypt_target_ms)
+    
+    # Connect external clients concurrently instead of at import time;
+    # failures are logged and retried lazily on first use
+    from rag.pinecone_client import get_pinecone_client
+    from services.ai_factory import get_ai_service
+    await asyncio.gather(
+        asyncio.to_thread(get_pinecone_client),
+        asyncio.to_thread(get_ai_service),
+        return_exceptions=True
+    )
+    get_http_client()
+    logger.info("External clients initialized")
+    
+    from middleware.twilio_signature import warn_if_unconfigured
+    warn_if_unconfigured()
+    
+    from services.sms_dispatcher import sms_dispatcher
+    from services.sms_status_buffer import sms_status_buffer
+    from services.msal_service import msal_service
+    sms_dispatcher.start()
+    sms_status_buffer.start()
+    msal_service.start()
+    
     # Start Background Scheduler for RAG Pipeline
     from services.scheduler import scheduler_service
     scheduler_service.start()
@@ -48,6 +86,11 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down application...")
+    await sms_dispatcher.stop()
+    await sms_status_buffer.stop()
+    await msal_service.stop()
+    await close_http_client()
+    await close_redis()
     await close_db()
     logger.info("Application stopped")
 
@@ -57,17 +100,28 @@ app = FastAPI(
     title="AI-Assisted Insurance Meeting System",
     description="Backend API for AI-powered insurance consultations via Zoom",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
+# Explicit lists instead of "*": Starlette then answers preflights from a
+# fixed header set rather than echoing each request's headers back.
+CORS_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"]
+CORS_HEADERS = [
+    "Authorization",
+    "Content-Type",
+    "X-Requested-With",
+    "ngrok-skip-browser-warning",  # Sent by the frontend API client
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins if not settings.is_production else settings.cors_origins,
-    allow_origin_regex="https://.*\\.vercel\\.app" if settings.is_production else None,
+    allow_origins=settings.cors_origins,
+    allow_origin_regex=r"https://.*\.vercel\.app" if settings.is_production else None,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_METHODS,
+    allow_headers=CORS_HEADERS,
 )
 
 # Setup error handlers
@@ -106,6 +160,78 @@ async def health_check(request: Request):
         "websocket_connections": connection_manager.get_connection_count()
     }
 
+# WebSocket control events -> handler(session_id, data)
+HANDLERS = {
+    "transcription.new": handle_transcription_event,
+    "participant.joined": handle_participant_join,
+    "participant.left": handle_participant_leave,
+}
+
+
+# Audio chunks buffered per connection before the receive loop waits on
+# Deepgram (backpressure on the client instead of unbounded memory)
+AUDIO_QUEUE_SIZE = 64
+
+
+async def _audio_writer(session_id: str, audio_q: asyncio.Queue):
+    """
+    Forward queued audio to Deepgram, coalescing whatever has piled up
+    since the last send into a single send_audio call. Starts the Deepgram
+    stream on first audio so the receive loop never waits on it.
+    Exits after sending everything queued before the None sentinel.
+    
+    Args:
+        session_id: Session identifier
+        audio_q: Per-connection queue of audio chunks
+    """
+    while True:
+        chunk = await audio_q.get()
+        if chunk is None:
+            return
+        
+        chunks = [chunk]
+        stop = False
+        while not audio_q.empty():
+            chunk = audio_q.get_nowait()
+            if chunk is None:
+                stop = True
+                break
+            chunks.append(chunk)
+        
+        # Lazy-load transcription service if not running
+        if not deepgram_service.is_connected(session_id):
+            logger.debug("Starting transcription for %s", session_id)
+            try:
+                await handle_start_transcription(session_id)
+            except Exception as e:
+                logger.error(f"Failed to start transcription for {session_id}: {e}", exc_info=True)
+        
+        await deepgram_service.send_audio(
+            session_id,
+            chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        )
+        
+        if stop:
+            return
+
+
+async def _close_audio_writer(audio_q: asyncio.Queue, audio_task: asyncio.Task):
+    """
+    Let the audio writer drain what is already queued, then stop it.
+    
+    Args:
+        audio_q: Per-connection queue of audio chunks
+        audio_task: Writer task started for the connection
+    """
+    if audio_task.done():
+        return
+    try:
+        await asyncio.wait_for(audio_q.put(None), timeout=5)
+        await asyncio.wait_for(audio_task, timeout=5)
+    except asyncio.TimeoutError:
+        audio_task.cancel()
+
+
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -122,15 +248,17 @@ async def websocket_endpoint(
     await connection_manager.connect(websocket, session_id, role)
     
     # Transcription will lazy-load on first audio packet
+    audio_q: asyncio.Queue = asyncio.Queue(maxsize=AUDIO_QUEUE_SIZE)
+    audio_task = asyncio.create_task(_audio_writer(session_id, audio_q))
     
     try:
         # Send welcome message
-        await websocket.send_json({
+        await websocket.send_text(orjson.dumps({
             "event_type": "connection.established",
             "session_id": session_id,
             "role": role,
             "message": "Connected successfully"
-        })
+        }).decode())
         
         logger.info(f"WebSocket connected: session={session_id}, role={role}")
         
@@ -138,59 +266,48 @@ async def websocket_endpoint(
         while True:
             # We use receive() instead of receive_json() to handle both text(json) and bytes(audio)
             message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            
+            text = message.get("text")
+            audio_data = message.get("bytes")
             
-            if "text" in message:
-                import json
+            if text is not None:
                 try:
-                    data = json.loads(message["text"])
+                    data = orjson.loads(text)
                     event_type = data.get('event_type')
                     
                     # Route events to handlers
-                    if event_type == 'transcription.new':
-                        await handle_transcription_event(session_id, data.get('data', {}))
-                    
-                    elif event_type == 'participant.joined':
-                        await handle_participant_join(session_id, data.get('data', {}))
-                    
-                    elif event_type == 'participant.left':
-                        await handle_participant_leave(session_id, data.get('data', {}))
-                    
+                    handler = HANDLERS.get(event_type)
+                    if handler:
+                        await handler(session_id, data.get('data', {}))
                     else:
                         logger.warning(f"Unknown event type: {event_type}")
 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error("Failed to decode JSON message")
 
-            elif "bytes" in message:
+            elif audio_data is not None:
                 # Handle binary audio data
-                audio_data = message["bytes"]
-                print(f"DEBUG: Received audio bytes: {len(audio_data)}") # UNCOMMENTED
+                logger.debug("Received audio bytes: %d", len(audio_data))
                 
-                # Lazy-load transcription service if not running
-                print(f"DEBUG: About to start transcription for {session_id}")
-                try:
-                    from websocket.handlers import handle_start_transcription
-                    await handle_start_transcription(session_id)
-                    print(f"DEBUG: handle_start_transcription completed")
-                except Exception as e:
-                    print(f"DEBUG: ERROR starting transcription: {e}")
-                    import traceback
-                    traceback.print_exc()
-                
-                from services.deepgram_service import deepgram_service
-                await deepgram_service.send_audio(session_id, audio_data)
+                # Waits only when the writer is AUDIO_QUEUE_SIZE chunks behind
+                await audio_q.put(audio_data)
             
             else:
-                print(f"DEBUG: Received unknown message type: {message.keys()}")
+                logger.debug("Received unknown message type: %s", message.keys())
     
     except WebSocketDisconnect:
         connection_manager.disconnect(websocket, session_id, role)
         logger.info(f"WebSocket disconnected: session={session_id}, role={role}")
         
         # Clean up Deepgram connection for this session
-        from services.deepgram_service import deepgram_service
+        await _close_audio_writer(audio_q, audio_task)
         await deepgram_service.stop_transcription(session_id)
-        print(f"DEBUG: Cleaned up Deepgram connection for {session_id}")
+        logger.debug("Cleaned up Deepgram connection for %s", session_id)
+        
+        # Write out any buffered transcript rows
+        await transcript_writer.close(session_id)
     
     
     except Exception as e:
@@ -198,9 +315,11 @@ async def websocket_endpoint(
         connection_manager.disconnect(websocket, session_id, role)
         
         # Clean up Deepgram connection
-        from services.deepgram_service import deepgram_service
+        await _close_audio_writer(audio_q, audio_task)
         await deepgram_service.stop_transcription(session_id)
-        print(f"DEBUG: Cleaned up Deepgram connection for {session_id} (error case)")
+        logger.debug("Cleaned up Deepgram connection for %s (error case)", session_id)
+        
+        await transcript_writer.close(session_id)
 
 
 if __name__ == "__main__":
@@ -209,7 +328,12 @@ if __name__ == "__main__":
         "main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=settings.app_debug
+        reload=settings.app_debug,
+        workers=None if settings.app_debug else settings.uvicorn_workers,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=False  # Audio frames don't compress; skip the zlib pass
     )
 
  
@@ -5,12 +5,12 @@ Authentication middleware and dependencies.
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional
+from typing import Any, Dict, Optional
 from database import get_db
 from db_models import User, UserRole
 from auth.jwt_handler import verify_token
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
@@ -54,8 +54,16 @@ async def get_current_user(
             detail="Invalid token payload",
         )
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+    
+    # Primary-key lookup: identity map first, no select() compilation
+    user = await db.get(User, user_uuid)
     
     if not user:
         raise HTTPException(
@@ -72,6 +80,41 @@ async def get_current_user(
     return user
 
 
+async def get_current_user_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Dict[str, Any]:
+    """
+    Dependency returning the verified access-token claims without a DB lookup.
+    
+    Use it where identity (user_id, email, role, full_name) is enough; use
+    get_current_user where the live User row matters (e.g. deactivation).
+    
+    Args:
+        credentials: HTTP Bearer credentials
+    
+    Returns:
+        Decoded token payload
+    
+    Raises:
+        HTTPException: If token is invalid
+    """
+    payload = verify_token(credentials.credentials, token_type="access")
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    if not payload.get("user_id"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+    
+    return payload
+
+
 async def get_current_admin(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -122,10 +165,12 @@ async def get_optional_user(
         if not user_id:
             return None
         
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        user = await db.get(User, uuid.UUID(user_id))
+        
+        if not user or not user.is_active:
+            return None
         
-        return user if user and user.is_active else None
+        return user
     
     except Exception as e:
         logger.warning(f"Optional auth failed: {str(e)}")
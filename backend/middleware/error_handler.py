@@ -3,34 +3,57 @@ Global error handler middleware for FastAPI.
 """
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Fixed error bodies, serialized once
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "message": "An unexpected error occurred. Please try again later.",
+    "detail": None
+})
+_DATABASE_ERROR_BODY = orjson.dumps({
+    "error": "Database error",
+    "message": "A database error occurred. Please try again later."
+})
 
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle all unhandled exceptions globally.
     
-    Args:request: FastAPI request
+    Tracebacks are only formatted when debug logging is enabled.
+    
+    Args:
+        request: FastAPI request
         exc: Exception that was raised
     
     Returns:
         JSON error response
     """
-    logger.error(f"Unhandled exception: {type(exc).__name__}: {str(exc)}", exc_info=True)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    logger.error(f"Unhandled exception: {type(exc).__name__}: {str(exc)}", exc_info=debug)
     
-    return JSONResponse(
+    if debug:
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "error": "Internal server error",
+                "message": "An unexpected error occurred. Please try again later.",
+                "detail": str(exc)
+            }
+        )
+    
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Internal server error",
-            "message": "An unexpected error occurred. Please try again later.",
-            "detail": str(exc) if logger.level == logging.DEBUG else None
-        }
+        media_type="application/json"
     )
 
 
@@ -57,7 +80,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> Response:
     """
     Handle database errors.
     
@@ -68,14 +91,12 @@ async def database_exception_handler(request: Request, exc: SQLAlchemyError) ->
     Returns:
         JSON error response
     """
-    logger.error(f"Database error: {str(exc)}", exc_info=True)
+    logger.error(f"Database error: {str(exc)}", exc_info=logger.isEnabledFor(logging.DEBUG))
     
-    return JSONResponse(
+    return Response(
+        content=_DATABASE_ERROR_BODY,
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        content={
-            "error": "Database error",
-            "message": "A database error occurred. Please try again later."
-        }
+        media_type="application/json"
     )
 
 
@@ -6,16 +6,20 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
+from config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Create limiter instance
+# With REDIS_URL set, counters are shared by all workers and the moving
+# window is maintained atomically by a Redis Lua script (one round-trip per
+# check). Without it, each process keeps its own in-memory counters.
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["100/minute"],  # Default rate limit
-    storage_uri="memory://",  # Use Redis in production: "redis://localhost:6379"
-    strategy="fixed-window"
+    storage_uri=settings.redis_url or "memory://",
+    strategy="moving-window"  # No 2x burst at window boundaries
 )
 
 
@@ -30,7 +34,8 @@ def setup_rate_limiting(app):
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     app.add_middleware(SlowAPIMiddleware)
     
-    logger.info("Rate limiting configured")
+    storage = "redis" if settings.redis_url else "memory"
+    logger.info(f"Rate limiting configured ({storage} storage)")
 
 
 # Rate limit decorators for different endpoints
@@ -0,0 +1,96 @@
+"""
+Twilio webhook signature validation.
+
+Twilio signs each webhook with HMAC-SHA1(auth_token, url + sorted POST
+params), base64-encoded in X-Twilio-Signature. Unsigned or forged requests
+are rejected before the endpoint runs. The parsed form is cached on the
+request, so the endpoint's Form() parameters don't parse the body again.
+"""
+
+from fastapi import HTTPException, Request, status
+from config import settings
+import base64
+import hashlib
+import hmac
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def compute_signature(url: str, params, auth_token: str) -> str:
+    """
+    Compute the expected X-Twilio-Signature.
+
+    Args:
+        url: Full URL Twilio requested (including query string)
+        params: POST form items as (key, value) pairs
+        auth_token: Twilio auth token
+
+    Returns:
+        Base64 HMAC-SHA1 signature
+    """
+    payload = url + "".join(key + value for key, value in sorted(params))
+    digest = hmac.new(auth_token.encode(), payload.encode(), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode()
+
+
+def _public_url(request: Request) -> str:
+    """
+    URL Twilio requested: TWILIO_WEBHOOK_BASE_URL if set, otherwise the
+    request URL with scheme and host from X-Forwarded-Proto/-Host (a TLS-
+    terminating proxy forwards https requests as http). Trusting these
+    headers is safe here: a forged value only changes which URL must carry
+    a valid HMAC.
+    """
+    if settings.twilio_webhook_base_url:
+        base = settings.twilio_webhook_base_url.rstrip("/")
+    else:
+        proto = request.headers.get("X-Forwarded-Proto", request.url.scheme)
+        host = request.headers.get("X-Forwarded-Host", request.headers.get("host", request.url.netloc))
+        # Proxy chains send comma-separated lists; the first hop is the client's
+        base = f"{proto.split(',')[0].strip()}://{host.split(',')[0].strip()}"
+
+    url = base + request.url.path
+    if request.url.query:
+        url += "?" + request.url.query
+    return url
+
+
+def warn_if_unconfigured():
+    """Log a startup warning when signatures are checked against a guessed URL."""
+    if (
+        settings.twilio_validate_signatures
+        and settings.twilio_auth_token
+        and not settings.twilio_webhook_base_url
+    ):
+        logger.warning(
+            "Twilio signature validation is on but TWILIO_WEBHOOK_BASE_URL is not set; "
+            "the signed URL is rebuilt from the request and X-Forwarded-* headers. "
+            "Set TWILIO_WEBHOOK_BASE_URL to the public origin in production."
+        )
+
+
+async def verify_twilio_signature(request: Request):
+    """
+    Dependency for Twilio webhook routes.
+
+    Raises:
+        HTTPException: 403 if the signature is missing or invalid
+    """
+    if not settings.twilio_validate_signatures or not settings.twilio_auth_token:
+        return
+
+    signature = request.headers.get("X-Twilio-Signature")
+    if not signature:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Missing signature")
+
+    form = await request.form()
+    expected = compute_signature(
+        _public_url(request),
+        [(key, str(value)) for key, value in form.multi_items()],
+        settings.twilio_auth_token
+    )
+
+    if not hmac.compare_digest(expected, signature):
+        logger.debug(f"Rejected Twilio webhook with invalid signature: {request.url.path}")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid signature")
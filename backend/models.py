@@ -2,12 +2,27 @@
 Pydantic models for request/response schemas and data validation.
 """
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 
+class FastModel(BaseModel):
+    """
+    Immutable base for high-volume transcription, AI and WebSocket models.
+    
+    Unknown fields are dropped, assignment is never re-validated and
+    instances are frozen.
+    """
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+        ser_json_bytes="utf8"
+    )
+
+
 class ParticipantRole(str, Enum):
     """Participant role in a session."""
     CUSTOMER = "customer"
@@ -46,6 +61,7 @@ class Lead(BaseModel):
     notes: Optional[str] = None
     sms_sent: bool = False
     sms_sent_at: Optional[datetime] = None
+    sms_status: Optional[str] = None
     created_at: datetime
 
 
@@ -126,7 +142,7 @@ class ZoomSignatureResponse(BaseModel):
 
 # =============== Transcription Models ===============
 
-class TranscriptSegment(BaseModel):
+class TranscriptSegment(FastModel):
     """A segment of transcribed speech."""
     text: str
     speaker: str  # "customer" or "staff"
@@ -134,7 +150,7 @@ class TranscriptSegment(BaseModel):
     confidence: float = 1.0
 
 
-class TranscriptQuery(BaseModel):
+class TranscriptQuery(FastModel):
     """Query from transcript for AI processing."""
     session_id: str
     text: str
@@ -144,21 +160,28 @@ class TranscriptQuery(BaseModel):
 
 # =============== AI/RAG Models ===============
 
-class RAGQuery(BaseModel):
+class RAGQuery(FastModel):
     """Query to the RAG system."""
     query: str
     session_id: Optional[str] = None
     top_k: int = 5
+    # Optional metadata restrictions applied before the vector search
+    state: Optional[str] = None
+    regulator: Optional[str] = None
+    carrier: Optional[str] = None
+    authority_level: Optional[str] = None
+    modified_after: Optional[datetime] = None
+    modified_before: Optional[datetime] = None
 
 
-class RAGContext(BaseModel):
+class RAGContext(FastModel):
     """Retrieved context from RAG system."""
     chunks: List[Dict[str, Any]]
     query: str
     total_results: int
 
 
-class AIResponse(BaseModel):
+class AIResponse(FastModel):
     """AI-generated response."""
     answer: str
     follow_up_question: Optional[str] = None
@@ -169,11 +192,11 @@ class AIResponse(BaseModel):
 
 # =============== WebSocket Event Models ===============
 
-class WSEvent(BaseModel):
+class WSEvent(FastModel):
     """WebSocket event base model."""
     event_type: str
     session_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     data: Dict[str, Any]
 
 
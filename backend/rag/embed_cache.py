@@ -0,0 +1,172 @@
+"""
+Persistent, content-addressed cache of document embeddings.
+
+Re-ingesting unchanged SharePoint or local documents produces the same
+chunk texts. Their vectors are stored on disk keyed by
+blake2b(model + text), so repeat ingests only call the embedding API for
+new or edited chunks. Vectors are kept as float16 bytes (half the size of
+float32; the precision loss is far below what affects cosine ranking).
+"""
+
+from config import settings
+from typing import Awaitable, Callable, List, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_key(model: str, text: str) -> bytes:
+    """Content hash of (model, text)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model.encode())
+    digest.update(b"\0")
+    digest.update(text.encode())
+    return digest.digest()
+
+
+class EmbedCache:
+    """SQLite-backed mapping of content hash -> float16 vector."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened on first use; shared across threads behind the lock
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, texts: List[str], model: str) -> List[Optional[List[float]]]:
+        """
+        Look up cached vectors.
+
+        Args:
+            texts: Chunk texts
+            model: Embedding model name
+
+        Returns:
+            Vector per text, or None where not cached
+        """
+        keys = [_cache_key(model, text) for text in texts]
+        found = {}
+
+        with self._lock:
+            conn = self._connection()
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                part = keys[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(part))})",
+                    part
+                )
+                found.update(rows)
+
+        return [
+            np.frombuffer(found[key], dtype=np.float16).astype(np.float32).tolist()
+            if key in found else None
+            for key in keys
+        ]
+
+    def put_many(self, texts: List[str], model: str, embeddings: List[List[float]]):
+        """
+        Store vectors, skipping zero vectors left by failed embedding calls.
+
+        Args:
+            texts: Chunk texts
+            model: Embedding model name
+            embeddings: Vector per text
+        """
+        rows = [
+            (_cache_key(model, text), np.asarray(embedding, dtype=np.float16).tobytes())
+            for text, embedding in zip(texts, embeddings)
+            if any(embedding)
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            conn.commit()
+
+    def _split(self, texts: List[str], model: str) -> Tuple[List[Optional[List[float]]], List[int]]:
+        embeddings = self.get_many(texts, model)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        return embeddings, missing
+
+    def get_or_compute_many(
+        self,
+        texts: List[str],
+        model: str,
+        compute: Callable[[List[str]], List[List[float]]]
+    ) -> List[List[float]]:
+        """
+        Synchronous get_or_compute_many_async for scripts.
+
+        Args:
+            texts: Chunk texts
+            model: Embedding model name
+            compute: Batch embedder called with the missing texts
+
+        Returns:
+            Vector per text, in input order
+        """
+        embeddings, missing = self._split(texts, model)
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            computed = compute(missing_texts)
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+            self.put_many(missing_texts, model, computed)
+
+        logger.info(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return embeddings
+
+    async def get_or_compute_many_async(
+        self,
+        texts: List[str],
+        model: str,
+        compute: Callable[[List[str]], Awaitable[List[List[float]]]]
+    ) -> List[List[float]]:
+        """
+        Return vectors for texts, embedding only the cache misses.
+
+        Args:
+            texts: Chunk texts
+            model: Embedding model name
+            compute: Async batch embedder called with the missing texts
+
+        Returns:
+            Vector per text, in input order
+        """
+        embeddings, missing = await asyncio.to_thread(self._split, texts, model)
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            computed = await compute(missing_texts)
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+            await asyncio.to_thread(self.put_many, missing_texts, model, computed)
+
+        logger.info(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return embeddings
+
+
+# Global cache instance
+embed_cache = EmbedCache(settings.embed_cache_path)
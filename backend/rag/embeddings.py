@@ -1,48 +1,109 @@
-import google.generativeai as genai
-from openai import OpenAI
 from config import settings
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from array import array
+import asyncio
+import base64
 import hashlib
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
 
+# OpenAI embedding size (text-embedding-3-small truncated to match the index)
+_OPENAI_DIMENSIONS = 1024
+
+
+def _decode_base64_embedding(data: str) -> List[float]:
+    """Decode an OpenAI base64 embedding (little-endian float32)."""
+    floats = array('f', base64.b64decode(data))
+    if sys.byteorder != 'little':
+        floats.byteswap()
+    return floats.tolist()
+
+
+# Upper bound on cached document embeddings (~3-6 KB each as float lists)
+_EMBED_CACHE_MAX_SIZE = 50_000
+
+
+def _content_key(text: str) -> bytes:
+    """Content hash used as the embedding cache key."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
 class EmbeddingService:
     """Handles text embedding generation."""
     
     def __init__(self):
         self.provider = settings.ai_provider.lower()
         self.dimension = 1024 if self.provider == 'openai' else 768
+        # Document embeddings by content hash; identical chunks (boilerplate,
+        # re-ingested files) are embedded once per process
+        self._cache: Dict[bytes, List[float]] = {}
         
+        # Only the active provider's SDK is imported, and only when the
+        # service is built, so workers don't pay for both at import time
         if self.provider == 'openai':
+            from openai import OpenAI
             self.client = OpenAI(api_key=settings.openai_api_key)
             self.model_name = 'text-embedding-3-small'
             logger.info("Initialized EmbeddingService with OpenAI (1024 dims)")
         else:
+            import google.generativeai as genai
+            self._genai = genai
             genai.configure(api_key=settings.google_api_key)
             self.model_name = 'models/embedding-001'
             logger.info("Initialized EmbeddingService with Google Gemini (768 dims)")
     
+    def _openai_embed(self, texts) -> List[List[float]]:
+        """
+        Embed one text or a list of texts with OpenAI.
+        
+        Vectors are requested as base64-packed float32 instead of JSON float
+        lists, which is a fraction of the payload and parse work.
+        """
+        resp = self.client.embeddings.create(
+            input=texts,
+            model=self.model_name,
+            dimensions=_OPENAI_DIMENSIONS,
+            encoding_format="base64"
+        )
+        # OpenAI returns list of embedding objects in order
+        return [
+            _decode_base64_embedding(d.embedding) if isinstance(d.embedding, str) else d.embedding
+            for d in resp.data
+        ]
+    
+    def _cache_put(self, key: bytes, embedding: List[float]):
+        """Cache a document embedding, skipping zero vectors from failures."""
+        if not any(embedding):
+            return
+        if len(self._cache) >= _EMBED_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = embedding
+    
     def embed_text(self, text: str) -> List[float]:
         """
         Generate embedding for a single text.
         """
+        key = _content_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             if self.provider == 'openai':
-                resp = self.client.embeddings.create(
-                    input=text,
-                    model=self.model_name,
-                    dimensions=1024
-                )
-                return resp.data[0].embedding
+                embedding = self._openai_embed(text)[0]
             else:
-                result = genai.embed_content(
+                result = self._genai.embed_content(
                     model=self.model_name,
                     content=text,
                     task_type="retrieval_document"
                 )
-                return result['embedding']
+                embedding = result['embedding']
+            self._cache_put(key, embedding)
+            return embedding
         except Exception as e:
             logger.error(f"Failed to embed text: {str(e)}")
             raise
@@ -53,14 +114,9 @@ class EmbeddingService:
         """
         try:
             if self.provider == 'openai':
-                resp = self.client.embeddings.create(
-                    input=query,
-                    model=self.model_name,
-                    dimensions=1024
-                )
-                return resp.data[0].embedding
+                return self._openai_embed(query)[0]
             else:
-                result = genai.embed_content(
+                result = self._genai.embed_content(
                     model=self.model_name,
                     content=query,
                     task_type="retrieval_query"
@@ -77,38 +133,121 @@ class EmbeddingService:
     ) -> List[List[float]]:
         """
         Generate embeddings for multiple texts.
+        
+        Texts already in the cache, and repeats within the call, are not
+        sent to the API; results are returned in input order.
         """
+        keys, results, pending, uncached_texts = self._lookup_batch(texts)
+        
         embeddings = []
+        for i in range(0, len(uncached_texts), batch_size):
+            batch = uncached_texts[i:i + batch_size]
+            embeddings.extend(self._embed_one_batch(batch, i // batch_size + 1))
+        
+        return self._merge_batch(keys, results, pending, embeddings)
+    
+    async def embed_batch_async(
+        self,
+        texts: List[str],
+        batch_size: int = 100,
+        concurrency: int = 8
+    ) -> List[List[float]]:
+        """
+        Async embed_batch that sends up to `concurrency` batches at once.
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
+        The provider SDK calls are blocking, so each batch runs in a worker
+        thread; total time approaches the slowest batch instead of the sum.
+        """
+        keys, results, pending, uncached_texts = self._lookup_batch(texts)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(number: int, batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._embed_one_batch, batch, number)
+        
+        parts = await asyncio.gather(*[
+            run(i // batch_size + 1, uncached_texts[i:i + batch_size])
+            for i in range(0, len(uncached_texts), batch_size)
+        ])
+        embeddings = [embedding for part in parts for embedding in part]
+        
+        return self._merge_batch(keys, results, pending, embeddings)
+    
+    def _lookup_batch(self, texts: List[str]):
+        """
+        Split a batch into cached results and unique texts still to embed.
+        
+        Returns:
+            (keys, results, pending, uncached_texts) where results holds cached
+            vectors or None, and pending maps a key to its uncached_texts index
+        """
+        keys = [_content_key(text) for text in texts]
+        results: List[Optional[List[float]]] = [self._cache.get(key) for key in keys]
+        
+        # Unique uncached texts, in first-seen order
+        pending: Dict[bytes, int] = {}
+        uncached_texts = []
+        for key, text, result in zip(keys, texts, results):
+            if result is None and key not in pending:
+                pending[key] = len(uncached_texts)
+                uncached_texts.append(text)
+        
+        if len(uncached_texts) < len(texts):
+            logger.info(f"Embedding cache: {len(texts) - len(uncached_texts)}/{len(texts)} texts reused")
+        
+        return keys, results, pending, uncached_texts
+    
+    def _merge_batch(self, keys, results, pending, embeddings) -> List[List[float]]:
+        """Cache new embeddings and return all vectors in input order."""
+        for key, index in pending.items():
+            self._cache_put(key, embeddings[index])
+        
+        return [
+            result if result is not None else embeddings[pending[key]]
+            for key, result in zip(keys, results)
+        ]
+    
+    def _embed_one_batch(self, batch: List[str], number: int) -> List[List[float]]:
+        """Embed one API batch; failed batches get zero vectors."""
+        try:
+            if self.provider == 'openai':
+                batch_embeddings = self._openai_embed(batch)
+            else:
+                batch_embeddings = self._embed_batch_gemini(batch)
             
+            logger.info(f"Embedded batch {number} ({len(batch_embeddings)} texts)")
+            return batch_embeddings
+        
+        except Exception as e:
+            logger.error(f"Failed to embed batch: {str(e)}")
+            # Add empty embedding for failed items
+            return [[0.0] * self.dimension] * len(batch)
+
+    def _embed_batch_gemini(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed a batch with one Gemini request.
+        
+        If the batch request fails, fall back to one request per item so a
+        single bad input doesn't zero out the whole batch.
+        """
+        try:
+            result = self._genai.embed_content(
+                model=self.model_name,
+                content=batch,
+                task_type="retrieval_document"
+            )
+            return result['embedding']
+        except Exception as e:
+            logger.warning(f"Gemini batch embed failed, retrying per item: {str(e)}")
+        
+        batch_embeddings = []
+        for text in batch:
             try:
-                # Process batch
-                if self.provider == 'openai':
-                     resp = self.client.embeddings.create(
-                        input=batch,
-                        model=self.model_name,
-                        dimensions=1024
-                    )
-                     # OpenAI returns list of embedding objects in order
-                     batch_embeddings = [d.embedding for d in resp.data]
-                     embeddings.extend(batch_embeddings)
-                else:
-                    # Google doesn't have a clean batch API in this SDK setup easily, 
-                    # so we loop (as before) or improved logic. Keeping loop for safety.
-                    for text in batch:
-                        embedding = self.embed_text(text)
-                        embeddings.append(embedding)
-                
-                logger.info(f"Embedded batch {i//batch_size + 1}, total: {len(embeddings)}")
-                
-            except Exception as e:
-                logger.error(f"Failed to embed batch: {str(e)}")
-                # Add empty embedding for failed items
-                embeddings.extend([[0.0] * self.dimension] * len(batch))
-        
-        return embeddings
+                batch_embeddings.append(self.embed_text(text))
+            except Exception:
+                batch_embeddings.append([0.0] * self.dimension)
+        return batch_embeddings
 
 
 def chunk_text(
@@ -122,22 +261,21 @@ def chunk_text(
     chunks = []
     start = 0
     text_length = len(text)
+    min_break = chunk_size // 2 + 1  # Only break if not too early
     
     while start < text_length:
         end = start + chunk_size
-        chunk = text[start:end]
         
-        # Try to break at sentence boundary
+        # Try to break at sentence boundary, searching the original text in
+        # place so no intermediate slice is built
         if end < text_length:
-            last_period = chunk.rfind('.')
-            last_newline = chunk.rfind('\n')
-            break_point = max(last_period, last_newline)
+            lo = start + min_break
+            break_point = max(text.rfind('.', lo, end), text.rfind('\n', lo, end))
             
-            if break_point > chunk_size // 2:  # Only break if not too early
-                chunk = chunk[:break_point + 1]
-                end = start + break_point + 1
+            if break_point != -1:
+                end = break_point + 1
         
-        chunks.append(chunk.strip())
+        chunks.append(text[start:end].strip())
         start = end - chunk_overlap
     
     return [c for c in chunks if c]  # Remove empty chunks
@@ -148,7 +286,7 @@ def generate_chunk_id(text: str, source: str, index: int) -> str:
     Generate a unique ID for a chunk.
     """
     content = f"{source}:{index}:{text[:100]}"
-    return hashlib.md5(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 
 # Global service instance
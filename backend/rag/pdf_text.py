@@ -0,0 +1,33 @@
+"""
+PDF text extraction.
+
+Uses PDFium (pypdfium2), which is much faster than pure-Python parsers on
+large policy documents. Page texts are collected and joined once.
+"""
+
+from typing import Union
+
+
+def extract_pdf_text(source: Union[str, bytes]) -> str:
+    """
+    Extract the text of every page.
+
+    Args:
+        source: File path or raw PDF bytes
+
+    Returns:
+        Page texts separated by newlines
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source)
+    try:
+        parts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "\n".join(parts)
+    finally:
+        pdf.close()
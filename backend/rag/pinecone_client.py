@@ -3,12 +3,25 @@ Pinecone client for vector database operations.
 """
 
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.config.openapi import OpenApiConfigFactory
 from config import settings
 from typing import List, Dict, Any, Optional
+import asyncio
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Dense vectors go over the wire as JSON floats. Rounding to 6 decimals
+# keeps cosine scores unchanged to ~1e-6 while roughly halving payload size
+_WIRE_DECIMALS = 6
+
+
+def _compact_values(values: List[float]) -> List[float]:
+    """Round vector components so they serialize to short JSON numbers."""
+    return np.round(np.asarray(values, dtype=np.float64), _WIRE_DECIMALS).tolist()
+
 
 class PineconeClient:
     """Handles Pinecone vector database operations."""
@@ -19,11 +32,19 @@ class PineconeClient:
         self.index_name = settings.pinecone_index_name
         
         # Initialize Pinecone
-        self.pc = Pinecone(api_key=self.api_key)
+        if settings.pinecone_use_grpc:
+            # Optional extra; imported only when enabled
+            from pinecone.grpc import PineconeGRPC
+            self.pc = PineconeGRPC(api_key=self.api_key)
+        else:
+            self.pc = Pinecone(api_key=self.api_key)
         self.index = None
         
         # Initialize index
-        self._ensure_index_exists()
+        if settings.pinecone_index_host:
+            self._connect(settings.pinecone_index_host)
+        else:
+            self._ensure_index_exists()
     
     def _ensure_index_exists(self):
         """Create index if it doesn't exist."""
@@ -51,58 +72,134 @@ class PineconeClient:
                 logger.info(f"Created index: {self.index_name} with dimension {dimension}")
             
             # Connect to index
-            self.index = self.pc.Index(self.index_name)
-            logger.info(f"Connected to Pinecone index: {self.index_name}")
+            self._connect(self.pc.describe_index(self.index_name).host)
             
         except Exception as e:
             logger.error(f"Failed to initialize Pinecone index: {str(e)}")
             raise
     
+    def _connect(self, host: str):
+        """
+        Connect to the index data plane with a sized keep-alive pool.
+        
+        The default pool size follows the CPU count; on small instances
+        concurrent upsert batches and queries overflow it and pay a fresh
+        TCP+TLS handshake for connections that are then discarded. The gRPC
+        transport multiplexes calls over one channel and needs no pool.
+        """
+        if settings.pinecone_use_grpc:
+            self.index = self.pc.Index(host=host)
+            logger.info(f"Connected to Pinecone index over gRPC: {self.index_name} ({host})")
+            return
+        
+        # describe_index() and PINECONE_INDEX_HOST give a bare hostname;
+        # with a custom openapi_config the client does not add the scheme,
+        # so urllib3 would fall back to plain HTTP on port 80
+        if "://" not in host:
+            host = f"https://{host}"
+        
+        openapi_config = OpenApiConfigFactory.build(api_key=self.api_key, host=host)
+        openapi_config.connection_pool_maxsize = settings.pinecone_pool_maxsize
+        self.index = self.pc.Index(host=host, openapi_config=openapi_config)
+        logger.info(f"Connected to Pinecone index: {self.index_name} ({host})")
+
+    @staticmethod
+    def _to_vectors(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Format chunks as Pinecone vector payloads."""
+        return [
+            {
+                'id': chunk['id'],
+                'values': _compact_values(chunk['embedding']),
+                'metadata': chunk.get('metadata', {})
+            }
+            for chunk in chunks
+        ]
+
     def upsert_chunks(
         self,
         chunks: List[Dict[str, Any]],
-        batch_size: int = 100
+        batch_size: int = 100,
+        max_concurrent_batches: int = 8
     ) -> int:
         """
         Upsert document chunks with embeddings.
-        
+
+        Synchronous wrapper around upsert_chunks_async for scripts; async
+        callers should await upsert_chunks_async directly.
+
         Args:
             chunks: List of dicts with 'id', 'embedding', and 'metadata'
             batch_size: Number of vectors to upsert at once
-        
+            max_concurrent_batches: Batches allowed in flight at once
+
         Returns:
             Number of vectors upserted
         """
-        try:
-            total_upserted = 0
-            
-            # Process in batches
-            for i in range(0, len(chunks), batch_size):
-                batch = chunks[i:i + batch_size]
-                
-                # Format for Pinecone
-                vectors = [
-                    {
-                        'id': chunk['id'],
-                        'values': chunk['embedding'],
-                        'metadata': chunk.get('metadata', {})
-                    }
-                    for chunk in batch
-                ]
-                
-                # Upsert batch
-                self.index.upsert(vectors=vectors)
-                total_upserted += len(vectors)
-                
-                logger.info(f"Upserted batch {i//batch_size + 1}, total: {total_upserted}")
-            
-            logger.info(f"Successfully upserted {total_upserted} vectors")
-            return total_upserted
-            
-        except Exception as e:
-            logger.error(f"Failed to upsert chunks: {str(e)}")
-            raise
-    
+        return asyncio.run(
+            self.upsert_chunks_async(chunks, batch_size, max_concurrent_batches)
+        )
+
+    async def upsert_chunks_async(
+        self,
+        chunks: List[Dict[str, Any]],
+        batch_size: int = 100,
+        max_concurrent_batches: int = 8,
+        max_retries: int = 2
+    ) -> int:
+        """
+        Upsert document chunks with several batches in flight at once.
+
+        Each batch is a blocking network call, so batches run in worker
+        threads bounded by a semaphore. Failed batches are retried; if any
+        still fail after max_retries the last error is raised.
+
+        Args:
+            chunks: List of dicts with 'id', 'embedding', and 'metadata'
+            batch_size: Number of vectors per upsert request
+            max_concurrent_batches: Batches allowed in flight at once
+            max_retries: Retry rounds for failed batches
+
+        Returns:
+            Number of vectors upserted
+        """
+        semaphore = asyncio.Semaphore(max_concurrent_batches)
+
+        async def upsert_batch(vectors: List[Dict[str, Any]]) -> int:
+            async with semaphore:
+                await asyncio.to_thread(self.index.upsert, vectors=vectors)
+            return len(vectors)
+
+        pending = [
+            self._to_vectors(chunks[i:i + batch_size])
+            for i in range(0, len(chunks), batch_size)
+        ]
+        total_upserted = 0
+
+        for attempt in range(max_retries + 1):
+            results = await asyncio.gather(
+                *(upsert_batch(vectors) for vectors in pending),
+                return_exceptions=True
+            )
+
+            failed = []
+            for vectors, result in zip(pending, results):
+                if isinstance(result, BaseException):
+                    failed.append((vectors, result))
+                else:
+                    total_upserted += result
+
+            if not failed:
+                break
+
+            pending = [vectors for vectors, _ in failed]
+            logger.warning(f"{len(failed)} upsert batches failed (attempt {attempt + 1}): {str(failed[0][1])}")
+        else:
+            logger.error(f"Failed to upsert chunks: {len(pending)} batches failed after {max_retries} retries")
+            raise failed[0][1]
+
+        logger.info(f"Successfully upserted {total_upserted} vectors")
+        return total_upserted
+
     def search(
         self,
         query_embedding: List[float],
@@ -123,7 +220,7 @@ class PineconeClient:
         try:
             # Query index
             query_args = {
-                'vector': query_embedding,
+                'vector': _compact_values(query_embedding),
                 'top_k': top_k,
                 'include_metadata': True
             }
@@ -186,7 +283,3 @@ def get_pinecone_client() -> Optional[PineconeClient]:
             return None
     
     return _pinecone_client_instance
-
-
-# For backward compatibility
-pinecone_client = get_pinecone_client()
@@ -2,27 +2,104 @@
 RAG retrieval service combining embeddings and Pinecone search.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from datetime import datetime
 from rag.embeddings import embedding_service
-from rag.pinecone_client import pinecone_client
+from rag.pinecone_client import get_pinecone_client, PineconeClient
+from rag.util import dedupe_by_id, top_k_above
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _cached_query_embedding(model_name: str, query: str) -> Tuple[float, ...]:
+    """
+    Embed a search query once per (model, query).
+    
+    Failed calls raise and are therefore not cached.
+    """
+    return tuple(embedding_service.embed_query(query))
+
+
+def embed_query_cached(query: str) -> List[float]:
+    """
+    Query embedding through the process-wide LRU cache.
+    
+    Args:
+        query: Search query
+    
+    Returns:
+        Embedding vector
+    """
+    return list(_cached_query_embedding(embedding_service.model_name, query))
+
+
+def build_metadata_filter(
+    universe: Optional[str] = None,
+    state: Optional[str] = None,
+    regulator: Optional[str] = None,
+    carrier: Optional[str] = None,
+    authority_level: Optional[str] = None,
+    modified_after: Optional[datetime] = None,
+    modified_before: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Build a Pinecone metadata filter from request-scoped restrictions.
+    
+    Date bounds apply to the numeric 'last_modified_ts' field written at
+    ingestion (Pinecone range operators only work on numbers).
+    
+    Returns:
+        Filter dict; empty when nothing restricts the search
+    """
+    filters: Dict[str, Any] = {}
+    if universe and universe != "NONE":
+        filters['universe'] = universe
+    
+    for field, value in (
+        ('state', state),
+        ('regulator', regulator),
+        ('carrier', carrier),
+        ('authority_level', authority_level),
+    ):
+        if value:
+            filters[field] = value
+    
+    date_range = {}
+    if modified_after:
+        date_range['$gte'] = modified_after.timestamp()
+    if modified_before:
+        date_range['$lte'] = modified_before.timestamp()
+    if date_range:
+        filters['last_modified_ts'] = date_range
+    
+    return filters
+
+
 class RetrieverService:
     """Handles RAG retrieval pipeline."""
     
     def __init__(self):
         self.embedding_service = embedding_service
-        self.pinecone_client = pinecone_client
+    
+    @property
+    def pinecone_client(self) -> PineconeClient:
+        """Pinecone client, connected on first use."""
+        client = get_pinecone_client()
+        if client is None:
+            raise RuntimeError("Pinecone client is not available")
+        return client
     
     async def retrieve(
         self,
         query: str,
         universe: Optional[str] = None,
         top_k: int = 5,
-        min_score: float = 0.1
+        min_score: float = 0.1,
+        filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Retrieve relevant context for a query.
@@ -32,6 +109,7 @@ class RetrieverService:
             universe: Regulatory Universe to filter by (optional)
             top_k: Number of results to return
             min_score: Minimum similarity score
+            filters: Additional metadata filter (see build_metadata_filter)
         
         Returns:
             Dict with chunks and metadata
@@ -40,25 +118,21 @@ class RetrieverService:
             logger.info(f"Retrieving context for query: {query[:100]}... Universe: {universe}")
             
             # Construct Filter
-            filters = {}
-            if universe and universe != "NONE":
-                filters['universe'] = universe
+            filters = {**(filters or {}), **build_metadata_filter(universe)}
             
             # Generate query embedding
-            query_embedding = self.embedding_service.embed_query(query)
+            query_embedding = embed_query_cached(query)
             
-            # Search Pinecone
-            results = self.pinecone_client.search(
+            # Search Pinecone (blocking HTTP call, keep it off the event loop)
+            results = await asyncio.to_thread(
+                self.pinecone_client.search,
                 query_embedding=query_embedding,
                 top_k=top_k,
                 filter_dict=filters
             )
             
-            # Filter by minimum score
-            filtered_results = [
-                r for r in results
-                if r['score'] >= min_score
-            ]
+            # Dedupe, filter by minimum score and keep the best top_k
+            filtered_results = top_k_above(dedupe_by_id(results), top_k, min_score)
             
             logger.info(f"Retrieved {len(filtered_results)} relevant chunks")
             
@@ -78,32 +152,23 @@ class RetrieverService:
                 'error': str(e)
             }
     
-    def retrieve_and_rank(
+    async def retrieve_and_rank(
         self,
         query: str,
         top_k: int = 5
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve and rank results by relevance.
+        Retrieve results ranked by relevance.
         
         Args:
             query: Search query
             top_k: Number of results
         
         Returns:
-            Ranked list of chunks
+            Ranked list of chunks (Pinecone returns them score-descending)
         """
-        result = self.retrieve(query, top_k)
-        chunks = result.get('chunks', [])
-        
-        # Sort by score (already sorted by Pinecone, but ensure order)
-        ranked_chunks = sorted(
-            chunks,
-            key=lambda x: x['score'],
-            reverse=True
-        )
-        
-        return ranked_chunks
+        result = await self.retrieve(query, top_k=top_k)
+        return result.get('chunks', [])
 
 
 # Global service instance
@@ -0,0 +1,62 @@
+"""
+Vectorized helpers for ranking retrieval results.
+"""
+
+from typing import List, Dict, Any
+
+import numpy as np
+
+
+def dedupe_by_id(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop repeated chunk ids, keeping the highest-scoring copy.
+    
+    Needed when results from several searches (sources, namespaces or
+    query variants) are merged; first-seen order is preserved.
+    
+    Args:
+        results: Matches with 'id' and 'score' keys
+    
+    Returns:
+        One match per id
+    """
+    best: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        seen = best.get(result['id'])
+        if seen is None or result['score'] > seen['score']:
+            best[result['id']] = result
+    return list(best.values())
+
+
+def top_k_above(
+    results: List[Dict[str, Any]],
+    top_k: int,
+    min_score: float = 0.0
+) -> List[Dict[str, Any]]:
+    """
+    Keep the top_k results scoring at least min_score, best first.
+    
+    Uses a boolean mask for the threshold and np.argpartition for the
+    selection, so only the k survivors are sorted.
+    
+    Args:
+        results: Matches with a 'score' key
+        top_k: Maximum number of results to keep
+        min_score: Minimum score (inclusive)
+    
+    Returns:
+        Selected results in descending score order
+    """
+    if not results or top_k <= 0:
+        return []
+
+    scores = np.fromiter((r['score'] for r in results), dtype=np.float32, count=len(results))
+    candidates = np.flatnonzero(scores >= min_score)
+
+    if len(candidates) > top_k:
+        kept = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+        candidates = candidates[kept]
+
+    # Stable sort keeps the original order among equal scores
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return [results[i] for i in order]
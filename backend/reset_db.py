@@ -4,7 +4,7 @@ WARNING: This will delete all data!
 """
 import asyncio
 from sqlalchemy import text
-from database import engine, Base, init_db
+from database import engine, Base
 from db_models import *  # Import all models
 
 async def reset_database():
@@ -15,17 +15,16 @@ async def reset_database():
         print("❌ Aborted")
         return
     
-    print("\n🗑️  Dropping all tables...")
+    print("\n🗑️  Dropping and recreating all tables...")
+    # One transaction: PostgreSQL DDL is transactional, so a failure leaves
+    # the old schema in place. The schema is empty after the drop, so
+    # create_all can skip its per-table existence checks.
     async with engine.begin() as conn:
         # Use CASCADE to drop tables with dependencies
         await conn.execute(text("DROP SCHEMA public CASCADE"))
         await conn.execute(text("CREATE SCHEMA public"))
-        await conn.commit()
-    print("✅ All tables dropped")
-    
-    print("\n📋 Creating all tables...")
-    await init_db()
-    print("✅ All tables created")
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
+    print("✅ All tables recreated")
     
     print("\n✅ Database reset complete!")
     
@@ -3,18 +3,21 @@ AI query API routes.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from models import RAGQuery, AIResponse
 from pydantic import BaseModel
-from rag.retriever import retriever_service
+from rag.retriever import retriever_service, embed_query_cached, build_metadata_filter
 from services.ai_factory import get_ai_service
+from services.answer_cache import query_answer_cache, chat_answer_cache
+from services.compliance_router import compliance_router
 from datetime import datetime
+from typing import Optional
+import asyncio
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
-# Initialize AI Service
-ai_service = get_ai_service()
-
 router = APIRouter(prefix="/api/ai", tags=["ai"])
 
 class SummaryRequest(BaseModel):
@@ -24,13 +27,81 @@ class SummaryRequest(BaseModel):
 async def generate_summary(request: SummaryRequest):
     """Generate a summary of the conversation."""
     try:
-        summary = ai_service.generate_summary(request.transcript)
+        summary = get_ai_service().generate_summary(request.transcript)
         return {"summary": summary}
     except Exception as e:
         logger.error(f"Summary generation failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _retrieve_for_query(request: RAGQuery):
+    """
+    Embed, route and retrieve context for a RAG query.
+    
+    Returns:
+        (cache_key, cached_response, rag_result); rag_result is None when a
+        cached answer for a near-duplicate question exists. cache_key is the
+        query embedding, or None when request filters make the answer
+        unsuitable for the shared answer cache. Answers are cached together
+        with top_k and only reused for the same top_k
+    """
+    # Blocking network call; run it in a worker thread
+    query_embedding = await asyncio.to_thread(embed_query_cached, request.query)
+    
+    restrictions = build_metadata_filter(
+        state=request.state,
+        regulator=request.regulator,
+        carrier=request.carrier,
+        authority_level=request.authority_level,
+        modified_after=request.modified_after,
+        modified_before=request.modified_before
+    )
+    cache_key = None if restrictions else query_embedding
+    
+    # Near-duplicate questions reuse the earlier answer
+    if cache_key is not None:
+        cached = query_answer_cache.get(cache_key)
+        if cached is not None and cached[0] == request.top_k:
+            return cache_key, cached[1], None
+    
+    # Route Query to Compliance Universe (paraphrases of earlier questions
+    # are answered from the router's semantic cache)
+    universe = await asyncio.to_thread(
+        compliance_router.determine_universe, request.query, query_embedding
+    )
+    
+    if universe and universe != "NONE":
+        logger.info(f"Applying compliance filter: universe={universe}")
+    else:
+        logger.info("No compliance universe matched. Searching all documents.")
+    if restrictions:
+        logger.info(f"Applying request filters: {restrictions}")
+    
+    # Retrieve context
+    rag_result = await retriever_service.retrieve(
+        query=request.query,
+        universe=universe if universe != "NONE" else None,
+        top_k=request.top_k,
+        filters=restrictions
+    )
+    return cache_key, None, rag_result
+
+
+def _cacheable(ai_result: dict, rag_result: Optional[dict] = None) -> bool:
+    """
+    Whether an answer may be reused for similar questions.
+    
+    Answers produced after a provider error, or from a failed or empty
+    retrieval, are not cached, so a short outage doesn't keep serving
+    context-free answers for the cache TTL.
+    """
+    if ai_result.get('error'):
+        return False
+    if rag_result is not None and (rag_result.get('error') or not rag_result.get('chunks')):
+        return False
+    return True
+
+
 @router.post("/query", response_model=AIResponse)
 async def query_ai(request: RAGQuery):
     """
@@ -40,26 +111,12 @@ async def query_ai(request: RAGQuery):
     try:
         logger.info(f"AI query: {request.query[:100]}")
         
-        # Route Query to Compliance Universe
-        from services.compliance_router import compliance_router
-        universe = compliance_router.determine_universe(request.query)
-        
-        filters = None
-        if universe and universe != "NONE":
-            filters = {"universe": universe}
-            logger.info(f"Applying compliance filter: {filters}")
-        else:
-            logger.info("No compliance universe matched. Searching all documents.")
-        
-        # Retrieve context
-        rag_result = await retriever_service.retrieve(
-            query=request.query,
-            universe=universe if universe != "NONE" else None,
-            top_k=request.top_k
-        )
+        cache_key, cached, rag_result = await _retrieve_for_query(request)
+        if cached is not None:
+            return cached
         
         # Generate AI response
-        ai_result = ai_service.generate_response(
+        ai_result = get_ai_service().generate_response(
             query=request.query,
             context_chunks=rag_result['chunks']
         )
@@ -77,6 +134,8 @@ async def query_ai(request: RAGQuery):
             timestamp=datetime.utcnow()
         )
         
+        if cache_key is not None and _cacheable(ai_result, rag_result):
+            query_answer_cache.put(cache_key, (request.top_k, response))
         return response
         
     except Exception as e:
@@ -84,6 +143,79 @@ async def query_ai(request: RAGQuery):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _sse(event: str, data: dict) -> bytes:
+    """Format one server-sent event."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.post("/query/stream")
+async def query_ai_stream(request: RAGQuery):
+    """
+    Streaming variant of /query (server-sent events).
+    
+    Emits a `context` event once retrieval finishes, a `token` event per
+    generated text delta, and a final `done` event with the parsed answer
+    (or an `error` event).
+    """
+    logger.info(f"AI streaming query: {request.query[:100]}")
+    
+    async def events():
+        try:
+            cache_key, cached, rag_result = await _retrieve_for_query(request)
+            
+            if cached is not None:
+                yield _sse("context", cached.rag_context.model_dump() if cached.rag_context else {})
+                yield _sse("done", cached.model_dump(mode="json"))
+                return
+            
+            yield _sse("context", {
+                'chunks': rag_result['chunks'],
+                'query': request.query,
+                'total_results': rag_result['total_results']
+            })
+            
+            # The provider SDKs stream synchronously; pull each delta in a
+            # worker thread so the event loop stays free
+            tokens = get_ai_service().stream_response(
+                query=request.query,
+                context_chunks=rag_result['chunks']
+            )
+            parts = []
+            while True:
+                token = await asyncio.to_thread(next, tokens, None)
+                if token is None:
+                    break
+                parts.append(token)
+                yield _sse("token", {"text": token})
+            
+            ai_result = get_ai_service().parse_response("".join(parts))
+            response = AIResponse(
+                answer=ai_result['answer'],
+                follow_up_question=ai_result.get('follow_up_question'),
+                confidence=ai_result['confidence'],
+                rag_context={
+                    'chunks': rag_result['chunks'],
+                    'query': request.query,
+                    'total_results': rag_result['total_results']
+                },
+                timestamp=datetime.utcnow()
+            )
+            if cache_key is not None and _cacheable(ai_result, rag_result):
+                query_answer_cache.put(cache_key, (request.top_k, response))
+            
+            yield _sse("done", response.model_dump(mode="json"))
+        
+        except Exception as e:
+            logger.error(f"AI streaming query failed: {str(e)}")
+            yield _sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @router.get("/context/{query}")
 async def get_context(query: str, top_k: int = 5):
     """
@@ -91,7 +223,7 @@ async def get_context(query: str, top_k: int = 5):
     Useful for debugging and testing retrieval.
     """
     try:
-        result = retriever_service.retrieve(query=query, top_k=top_k)
+        result = await retriever_service.retrieve(query=query, top_k=top_k)
         return result
     except Exception as e:
         logger.error(f"Context retrieval failed: {str(e)}")
@@ -107,8 +239,14 @@ async def chat_ai(request: RAGQuery):
     try:
         logger.info(f"AI chat query: {request.query[:100]}")
         
+        # Blocking network call; run it in a worker thread
+        query_embedding = await asyncio.to_thread(embed_query_cached, request.query)
+        cached = chat_answer_cache.get(query_embedding)
+        if cached is not None:
+            return cached
+        
         # Generate AI response with EMPTY context
-        ai_result = ai_service.generate_response(
+        ai_result = get_ai_service().generate_response(
             query=request.query,
             context_chunks=[] 
         )
@@ -122,6 +260,8 @@ async def chat_ai(request: RAGQuery):
             timestamp=datetime.utcnow()
         )
         
+        if _cacheable(ai_result):
+            chat_answer_cache.put(query_embedding, response)
         return response
         
     except Exception as e:
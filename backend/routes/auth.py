@@ -9,9 +9,11 @@ from pydantic import BaseModel, EmailStr
 from database import get_db
 from db_models import User, UserRole
 from auth.jwt_handler import create_access_token, create_refresh_token, verify_token
-from auth.password import hash_password, verify_password
-from middleware.auth_middleware import get_current_user
+from auth.password import hash_password_async, verify_password_async, get_dummy_hash
+from middleware.auth_middleware import get_current_user_claims
+from typing import Any, Dict
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
@@ -63,8 +65,8 @@ async def register_user(
     """
     try:
         # Check if email already exists
-        result = await db.execute(select(User).where(User.email == user_data.email))
-        existing_user = result.scalar_one_or_none()
+        result = await db.execute(select(User.id).where(User.email == user_data.email))
+        existing_user = result.scalar()
         
         if existing_user:
             raise HTTPException(
@@ -73,7 +75,7 @@ async def register_user(
             )
         
         # Create new user
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
         new_user = User(
             email=user_data.email,
             hashed_password=hashed_password,
@@ -116,18 +118,25 @@ async def login(
     Login and receive JWT tokens.
     """
     try:
-        # Get user by email
-        result = await db.execute(select(User).where(User.email == credentials.email))
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
-            )
+        # Get user by email (only the columns login needs, no ORM hydrate)
+        result = await db.execute(
+            select(
+                User.id,
+                User.email,
+                User.hashed_password,
+                User.is_active,
+                User.role,
+                User.full_name
+            ).where(User.email == credentials.email)
+        )
+        user = result.one_or_none()
         
-        # Verify password
-        if not verify_password(credentials.password, user.hashed_password):
+        # Verify password (always, so unknown emails take as long as known ones)
+        password_ok = await verify_password_async(
+            credentials.password,
+            user.hashed_password if user else get_dummy_hash()
+        )
+        if not user or not password_ok:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -144,7 +153,8 @@ async def login(
         token_data = {
             "user_id": str(user.id),
             "email": user.email,
-            "role": user.role.value
+            "role": user.role.value,
+            "full_name": user.full_name
         }
         
         access_token = create_access_token(token_data)
@@ -184,10 +194,15 @@ async def refresh_access_token(
                 detail="Invalid or expired refresh token"
             )
         
-        # Get user
-        user_id = payload.get("user_id")
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        # Get user (primary-key lookup through the identity map)
+        try:
+            user_id = uuid.UUID(payload.get("user_id"))
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token"
+            )
+        user = await db.get(User, user_id)
         
         if not user or not user.is_active:
             raise HTTPException(
@@ -199,7 +214,8 @@ async def refresh_access_token(
         token_data = {
             "user_id": str(user.id),
             "email": user.email,
-            "role": user.role.value
+            "role": user.role.value,
+            "full_name": user.full_name
         }
         
         access_token = create_access_token(token_data)
@@ -222,15 +238,18 @@ async def refresh_access_token(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    claims: Dict[str, Any] = Depends(get_current_user_claims)
 ):
     """
     Get current authenticated user information.
+    
+    Served from the access-token claims; no database lookup.
     """
     return UserResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        full_name=current_user.full_name,
-        role=current_user.role.value,
-        is_active=current_user.is_active
+        id=claims["user_id"],
+        email=claims.get("email", ""),
+        full_name=claims.get("full_name") or "",
+        role=claims.get("role", ""),
+        # Access tokens are only issued to active users
+        is_active=True
     )
@@ -2,17 +2,19 @@
 Booking management API routes.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime, timedelta
 from typing import Optional, List
 from database import get_db
 from db_models import Booking, Lead, Session, BookingStatus, SessionStatus
 from services.zoom_service import zoom_service
 from services.twilio_service import twilio_service
+from services.sms_dispatcher import sms_dispatcher
 from config import settings
+import asyncio
 import logging
 import uuid
 
@@ -20,6 +22,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/bookings", tags=["bookings"])
 
+# Bulk imports: requests larger than this are rejected, and at most
+# ZOOM_CONCURRENCY meetings are created at once to stay under Zoom's rate
+# limits
+MAX_BULK_BOOKINGS = 100
+ZOOM_CONCURRENCY = 5
+
 
 # ==================== MODELS ====================
 
@@ -45,6 +53,173 @@ class BookingResponse(BaseModel):
     zoom_meeting_password: Optional[str] = None
 
 
+class BulkBookingCreate(BaseModel):
+    bookings: List[BookingCreate] = Field(..., min_length=1, max_length=MAX_BULK_BOOKINGS)
+
+
+class BulkBookingFailure(BaseModel):
+    index: int
+    customer_email: str
+    detail: str
+
+
+class BulkBookingResponse(BaseModel):
+    created: List[BookingResponse]
+    failed: List[BulkBookingFailure]
+
+
+# ==================== HELPERS ====================
+
+# English names, so SMS text doesn't depend on the server locale
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+
+def _format_date(dt: datetime) -> str:
+    """Same as strftime("%B %d, %Y"), without the locale-aware formatter."""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
+def _format_time(dt: datetime) -> str:
+    """Same as strftime("%I:%M %p")."""
+    return f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+def _fallback_meeting() -> dict:
+    """Mock Zoom meeting so a booking can proceed when Zoom is unavailable."""
+    import random
+    mock_id = str(random.randint(1000000000, 9999999999))
+    return {
+        'meeting_id': mock_id,
+        'meeting_password': '123456',
+        'join_url': f'{settings.domain}/join/mock-{mock_id}',
+        'start_url': f'{settings.domain}/start/mock-{mock_id}'
+    }
+
+
+def _build_booking(
+    booking_data: BookingCreate,
+    scheduled_datetime: datetime,
+    lead_uuid: Optional[uuid.UUID],
+    zoom_meeting: dict
+) -> tuple:
+    """
+    Build the Session and Booking rows for one booking (not yet added).
+    
+    Returns:
+        (Session, Booking)
+    """
+    new_session = Session(
+        id=uuid.uuid4(),
+        zoom_meeting_id=str(zoom_meeting['meeting_id']),
+        zoom_meeting_password=zoom_meeting.get('meeting_password', ''),
+        status=SessionStatus.PENDING,
+        created_at=datetime.utcnow(),
+        expires_at=scheduled_datetime + timedelta(hours=2)
+    )
+    new_booking = Booking(
+        id=uuid.uuid4(),
+        lead_id=lead_uuid,
+        customer_email=booking_data.customer_email,
+        scheduled_time=scheduled_datetime,
+        duration_minutes=30,
+        status=BookingStatus.CONFIRMED,
+        session_id=new_session.id
+    )
+    return new_session, new_booking
+
+
+_SESSION_COPY_COLUMNS = [
+    "id", "zoom_meeting_id", "zoom_meeting_password", "status", "created_at", "expires_at"
+]
+_BOOKING_COPY_COLUMNS = [
+    "id", "lead_id", "customer_email", "scheduled_time", "duration_minutes",
+    "status", "session_id", "created_at", "updated_at"
+]
+
+
+async def _copy_bookings(db: AsyncSession, rows: List[tuple]):
+    """
+    Write (Session, Booking) pairs with one COPY per table.
+    
+    Runs on the request's connection inside a transaction, so the batch
+    is all-or-nothing. Column defaults are not applied by COPY, so every
+    column is given explicitly (enums by name, as SQLAlchemy stores them).
+    """
+    now = datetime.utcnow()
+    session_records = [
+        (s.id, s.zoom_meeting_id, s.zoom_meeting_password, s.status.name, s.created_at, s.expires_at)
+        for s, _ in rows
+    ]
+    booking_records = [
+        (b.id, b.lead_id, b.customer_email, b.scheduled_time, b.duration_minutes,
+         b.status.name, b.session_id, now, now)
+        for _, b in rows
+    ]
+    
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    async with driver.transaction():
+        await driver.copy_records_to_table(
+            Session.__tablename__, records=session_records, columns=_SESSION_COPY_COLUMNS
+        )
+        await driver.copy_records_to_table(
+            Booking.__tablename__, records=booking_records, columns=_BOOKING_COPY_COLUMNS
+        )
+
+
+def _queue_confirmation_sms(booking_data: BookingCreate, booking: Booking, zoom_meeting: dict):
+    """Queue the booking confirmation SMS (rate-limited, retried)."""
+    join_url = f"{settings.domain}/join/{booking.session_id}"
+    formatted_date = _format_date(booking.scheduled_time)
+    formatted_time = _format_time(booking.scheduled_time)
+    
+    confirmation_message = (
+        f"Your insurance consultation is confirmed!\n\n"
+        f"📅 {formatted_date}\n"
+        f"🕒 {formatted_time}\n\n"
+        f"Join meeting:\n{join_url}\n\n"
+        f"We look forward to speaking with you!"
+    )
+    
+    sms_dispatcher.enqueue(
+        booking_data.customer_phone,
+        twilio_service.booking_message(
+            booking_url=join_url,
+            customer_name=booking_data.customer_name,
+            description=confirmation_message,
+            meeting_id=str(zoom_meeting['meeting_id']),
+            passcode=str(zoom_meeting.get('meeting_password', ''))
+        )
+    )
+
+
+def _booking_response(booking_data: BookingCreate, booking: Booking, zoom_meeting: dict) -> BookingResponse:
+    return BookingResponse(
+        id=str(booking.id),
+        customer_name=booking_data.customer_name,
+        customer_email=booking_data.customer_email,
+        scheduled_time=booking.scheduled_time.isoformat(),
+        status=booking.status.value,
+        session_id=str(booking.session_id),
+        zoom_meeting_id=str(zoom_meeting['meeting_id']),
+        zoom_meeting_password=str(zoom_meeting.get('meeting_password', ''))
+    )
+
+
+def _parse_lead_id(lead_id: Optional[str]) -> Optional[uuid.UUID]:
+    if not lead_id:
+        return None
+    try:
+        return uuid.UUID(lead_id)
+    except ValueError:
+        logger.warning(f"Invalid Lead ID format {lead_id}, proceeding without linking.")
+        return None
+
+
 # ==================== ROUTES ====================
 
 @router.post("", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
@@ -57,6 +232,10 @@ async def create_booking(
     1. Create Zoom meeting
     2. Create session
     3. Send confirmation SMS
+    
+    The response returns once the booking is committed; the SMS is sent
+    afterwards by the SMS dispatcher, so Twilio latency or failures never
+    delay or fail the booking.
     """
     try:
         scheduled_datetime = datetime.fromisoformat(
@@ -64,20 +243,13 @@ async def create_booking(
         )
         
         # Verify lead_id exists if provided
-        if booking_data.lead_id:
-            try:
-                lead_uuid = uuid.UUID(booking_data.lead_id)
-                stmt = select(Lead).where(Lead.id == lead_uuid)
-                result = await db.execute(stmt)
-                if not result.scalar_one_or_none():
-                    logger.warning(f"Lead ID {booking_data.lead_id} not found, proceeding without linking to lead.")
-                    booking_data.lead_id = None
-            except ValueError:
-                logger.warning(f"Invalid Lead ID format {booking_data.lead_id}, proceeding without linking.")
-                booking_data.lead_id = None
+        lead_uuid = _parse_lead_id(booking_data.lead_id)
+        if lead_uuid and not await db.get(Lead, lead_uuid):
+            logger.warning(f"Lead ID {booking_data.lead_id} not found, proceeding without linking to lead.")
+            lead_uuid = None
         
         # Create Zoom meeting
-        zoom_meeting = zoom_service.create_meeting(
+        zoom_meeting = await zoom_service.acreate_meeting(
             topic=f"Insurance Consultation - {booking_data.customer_name}",
             start_time=scheduled_datetime,
             duration_minutes=30  # 30 minutes
@@ -85,86 +257,24 @@ async def create_booking(
         
         if not zoom_meeting:
             logger.warning("Zoom service failed to create meeting, using fallback mock data")
-            # Fallback mock data so booking can proceed
-            import random
-            mock_id = str(random.randint(1000000000, 9999999999))
-            zoom_meeting = {
-                'meeting_id': mock_id,  # Changed from id to meeting_id
-                'meeting_password': '123456',
-                'join_url': f'{settings.domain}/join/mock-{mock_id}',
-                'start_url': f'{settings.domain}/start/mock-{mock_id}'
-            }
-        
-        # Create session
-        session_id = uuid.uuid4()
-        new_session = Session(
-            id=session_id,
-            zoom_meeting_id=str(zoom_meeting['meeting_id']),  # Changed from id to meeting_id
-            zoom_meeting_password=zoom_meeting.get('meeting_password', ''), # Changed from password to meeting_password
-            status=SessionStatus.PENDING,
-            created_at=datetime.utcnow(),
-            expires_at=scheduled_datetime + timedelta(hours=2)
-        )
+            zoom_meeting = _fallback_meeting()
         
+        # Create session and booking
+        new_session, new_booking = _build_booking(booking_data, scheduled_datetime, lead_uuid, zoom_meeting)
         db.add(new_session)
-        
-        # Create booking
-        booking_id = uuid.uuid4()
-        new_booking = Booking(
-            id=booking_id,
-            lead_id=uuid.UUID(booking_data.lead_id) if booking_data.lead_id else None,
-            customer_email=booking_data.customer_email,
-            scheduled_time=scheduled_datetime,
-            duration_minutes=30,
-            status=BookingStatus.CONFIRMED,
-            session_id=session_id
-        )
-        
         db.add(new_booking)
         await db.commit()
-        await db.refresh(new_booking)
-        
-        # Send confirmation SMS
-        join_url = f"{settings.domain}/join/{session_id}"
-        formatted_date = scheduled_datetime.strftime("%B %d, %Y")
-        formatted_time = scheduled_datetime.strftime("%I:%M %p")
-        
-        confirmation_message = (
-            f"Your insurance consultation is confirmed!\n\n"
-            f"📅 {formatted_date}\n"
-            f"🕒 {formatted_time}\n\n"
-            f"Join meeting:\n{join_url}\n\n"
-            f"We look forward to speaking with you!"
-        )
         
-        sms_result = twilio_service.send_booking_sms(
-            to_phone_number=booking_data.customer_phone,
-            booking_url=join_url,
-            customer_name=booking_data.customer_name,
-            description=confirmation_message,
-            meeting_id=str(zoom_meeting['meeting_id']),
-            passcode=str(zoom_meeting.get('meeting_password', ''))
-        )
-        
-        if not sms_result.success:
-            logger.warning(f"Failed to send confirmation SMS: {sms_result.error}")
+        # Send confirmation SMS (only after the commit succeeded)
+        _queue_confirmation_sms(booking_data, new_booking, zoom_meeting)
             
         # Send confirmation Email - MOVED TO FRONTEND (EmailJS)
         # We no longer send email from backend to avoid SMTP issues.
         # The frontend uses bookingResponse to trigger EmailJS.
         
-        logger.info(f"Booking created: {booking_id}, Session: {session_id}, Zoom: {zoom_meeting['meeting_id']}")
+        logger.info(f"Booking created: {new_booking.id}, Session: {new_session.id}, Zoom: {zoom_meeting['meeting_id']}")
         
-        return BookingResponse(
-            id=str(booking_id),
-            customer_name=booking_data.customer_name,
-            customer_email=booking_data.customer_email,
-            scheduled_time=scheduled_datetime.isoformat(),
-            status=new_booking.status.value,
-            session_id=str(session_id),
-            zoom_meeting_id=str(zoom_meeting['meeting_id']),
-            zoom_meeting_password=str(zoom_meeting.get('meeting_password', ''))
-        )
+        return _booking_response(booking_data, new_booking, zoom_meeting)
         
     except Exception as e:
         logger.error(f"Failed to create booking: {str(e)}")
@@ -175,31 +285,146 @@ async def create_booking(
         )
 
 
+@router.post("/bulk", response_model=BulkBookingResponse, status_code=status.HTTP_201_CREATED)
+async def create_bookings_bulk(
+    request: BulkBookingCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many bookings at once (e.g. a broker importing leads).
+    
+    Zoom meetings are created with bounded concurrency and all sessions/
+    bookings are written with one COPY per table in a single transaction;
+    confirmation SMS are queued after the commit. Items whose Zoom meeting
+    could not be created are not booked (no mock meeting, no SMS) and are
+    listed under `failed` so they can be retried.
+    """
+    try:
+        items = request.bookings
+        scheduled = [
+            datetime.fromisoformat(f"{b.scheduled_date}T{b.scheduled_time}")
+            for b in items
+        ]
+        
+        # Verify all lead_ids with one query
+        lead_uuids = [_parse_lead_id(b.lead_id) for b in items]
+        wanted = {lead_uuid for lead_uuid in lead_uuids if lead_uuid}
+        existing = set()
+        if wanted:
+            result = await db.execute(select(Lead.id).where(Lead.id.in_(wanted)))
+            existing = set(result.scalars())
+        
+        # Create Zoom meetings, a few at a time
+        semaphore = asyncio.Semaphore(ZOOM_CONCURRENCY)
+        
+        async def create_meeting(b: BookingCreate, when: datetime):
+            async with semaphore:
+                return await zoom_service.acreate_meeting(
+                    topic=f"Insurance Consultation - {b.customer_name}",
+                    start_time=when,
+                    duration_minutes=30,
+                    fallback=False
+                )
+        
+        zoom_results = await asyncio.gather(
+            *(create_meeting(b, when) for b, when in zip(items, scheduled)),
+            return_exceptions=True
+        )
+        
+        rows = []
+        failed = []
+        for index, (b, when, lead_uuid, zoom_meeting) in enumerate(
+            zip(items, scheduled, lead_uuids, zoom_results)
+        ):
+            if isinstance(zoom_meeting, BaseException) or not zoom_meeting:
+                logger.warning(f"Zoom meeting failed for {b.customer_email}, skipping booking")
+                failed.append(BulkBookingFailure(
+                    index=index,
+                    customer_email=b.customer_email,
+                    detail="Zoom meeting could not be created"
+                ))
+                continue
+            if lead_uuid not in existing:
+                lead_uuid = None
+            new_session, new_booking = _build_booking(b, when, lead_uuid, zoom_meeting)
+            rows.append((b, new_session, new_booking, zoom_meeting))
+        
+        if rows:
+            await _copy_bookings(db, [(s, bk) for _, s, bk, _ in rows])
+            await db.commit()
+        
+        for b, _, new_booking, zoom_meeting in rows:
+            _queue_confirmation_sms(b, new_booking, zoom_meeting)
+        
+        logger.info(f"Bulk created {len(rows)} bookings ({len(failed)} failed)")
+        
+        return BulkBookingResponse(
+            created=[
+                _booking_response(b, new_booking, zoom_meeting)
+                for b, _, new_booking, zoom_meeting in rows
+            ],
+            failed=failed
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to create bookings: {str(e)}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to create bookings: {str(e)}"
+        )
+
+
 @router.get("", response_model=List[BookingResponse])
-async def list_bookings(db: AsyncSession = Depends(get_db)):
-    """List all bookings."""
+async def list_bookings(
+    status_filter: Optional[BookingStatus] = Query(None, alias="status"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    List bookings, newest first.
+    
+    Args:
+        status_filter: Only bookings with this status (?status=confirmed)
+        limit: Page size
+        offset: Number of bookings to skip
+    """
     try:
-        # Join Booking with Session to get session status
+        # One joined query, projecting only the columns the response needs
         stmt = (
-            select(Booking, Session)
+            select(
+                Booking.id,
+                Booking.customer_email,
+                Booking.scheduled_time,
+                Booking.status,
+                Booking.session_id,
+                Session.status.label("session_status"),
+                Session.zoom_meeting_id
+            )
             .outerjoin(Session, Booking.session_id == Session.id)
             .order_by(Booking.scheduled_time.desc())
+            .limit(limit)
+            .offset(offset)
+            .execution_options(yield_per=200)
         )
-        result = await db.execute(stmt)
-        rows = result.all()
+        if status_filter is not None:
+            stmt = stmt.where(Booking.status == status_filter)
+        # Rows are streamed from a server-side cursor in batches of 200
+        result = await db.stream(stmt)
         
         return [
             BookingResponse(
-                id=str(booking.id),
-                customer_name=booking.customer_email.split('@')[0],  # Fallback
-                customer_email=booking.customer_email,
-                scheduled_time=booking.scheduled_time.isoformat(),
-                status=booking.status.value,
-                session_id=str(booking.session_id) if booking.session_id else None,
-                session_status=session.status.value if session else None,
-                zoom_meeting_id=None
+                id=str(row.id),
+                customer_name=row.customer_email.split('@')[0],  # Fallback
+                customer_email=row.customer_email,
+                scheduled_time=row.scheduled_time.isoformat(),
+                status=row.status.value,
+                session_id=str(row.session_id) if row.session_id else None,
+                session_status=row.session_status.value if row.session_status else None,
+                zoom_meeting_id=row.zoom_meeting_id
             )
-            for booking, session in rows
+            async for row in result
         ]
     except Exception as e:
         logger.error(f"Failed to list bookings: {str(e)}")
@@ -208,28 +433,26 @@ async def list_bookings(db: AsyncSession = Depends(get_db)):
 
 @router.post("/{booking_id}/send-reminder")
 async def send_reminder(
-    booking_id: str,
+    booking_id: uuid.UUID,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Send a reminder SMS to customer about their upcoming meeting.
     """
     try:
-        # Get booking
+        # Get booking and its lead (for the phone number) in one query
         result = await db.execute(
-            select(Booking).where(Booking.id == uuid.UUID(booking_id))
+            select(Booking, Lead)
+            .outerjoin(Lead, Booking.lead_id == Lead.id)
+            .where(Booking.id == booking_id)
         )
-        booking = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not booking:
+        if not row:
             raise HTTPException(status_code=404, detail="Booking not found")
+        booking, lead = row
         
-        # Get associated lead for phone number
         if booking.lead_id:
-            lead_result = await db.execute(
-                select(Lead).where(Lead.id == booking.lead_id)
-            )
-            lead = lead_result.scalar_one_or_none()
             customer_phone = lead.phone_number if lead else None
             customer_name = lead.customer_name if lead else None
         else:
@@ -245,49 +468,21 @@ async def send_reminder(
                 detail="Customer phone number not found"
             )
         
-        # Calculate time until meeting
-        now = datetime.utcnow()
-        time_diff = booking.scheduled_time - now
-        hours_until = int(time_diff.total_seconds() / 3600)
-        
-        # Format datetime
-        formatted_date = booking.scheduled_time.strftime("%B %d, %Y")
-        formatted_time = booking.scheduled_time.strftime("%I:%M %p")
         join_url = f"{settings.domain}/join/{booking.session_id}"
         
-        # Create reminder message
-        if hours_until <= 1:
-            time_msg = "in 1 hour"
-        elif hours_until < 24:
-            time_msg = f"in {hours_until} hours"
-        else:
-            time_msg = f"on {formatted_date}"
-        
-        reminder_message = (
-            f"Reminder: Your insurance meeting is {time_msg}!\n\n"
-            f"📅 {formatted_date}\n"
-            f"🕒 {formatted_time}\n\n"
-            f"Join:\n{join_url}\n\n"
-            f"See you soon!"
-        )
-        
-        # Send reminder SMS
-        sms_result = twilio_service.send_reminder_sms(
-            to_phone_number=customer_phone,
-            meeting_time=f"{formatted_date} at {formatted_time}",
-            join_url=join_url,
-            customer_name=customer_name
-        )
-        
-        if not sms_result.success:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to send reminder: {sms_result.error}"
+        # Queue reminder SMS
+        sms_dispatcher.enqueue(
+            customer_phone,
+            twilio_service.reminder_message(
+                meeting_time=f"{_format_date(booking.scheduled_time)} at {_format_time(booking.scheduled_time)}",
+                join_url=join_url,
+                customer_name=customer_name
             )
+        )
         
-        logger.info(f"Reminder sent for booking {booking_id}")
+        logger.info(f"Reminder queued for booking {booking_id}")
         
-        return {"success": True, "message": "Reminder sent successfully"}
+        return {"success": True, "message": "Reminder queued"}
         
     except HTTPException:
         raise
@@ -2,11 +2,18 @@
 Lead management and SMS API routes.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional
 from datetime import datetime
+from database import get_db
+from db_models import Lead as LeadRecord
 from models import LeadCreate, Lead
 from services.twilio_service import twilio_service
+from services.sms_dispatcher import sms_dispatcher
+from services.redis_client import get_redis
+from services.sms_status import invalidate_cached_leads, lead_cache_key
 from config import settings
 import logging
 import uuid
@@ -15,88 +22,143 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/leads", tags=["leads"])
 
-# In-memory storage (use database in production)
-_leads = {}
+# Leads are read far more often than written; with REDIS_URL set they are
+# cached for all workers
+LEAD_CACHE_TTL = 300  # seconds
+
+
+def _to_schema(record: LeadRecord) -> Lead:
+    return Lead(
+        id=str(record.id),
+        phone_number=record.phone_number,
+        customer_name=record.customer_name,
+        notes=record.notes,
+        sms_sent=bool(record.sms_sent),
+        sms_sent_at=record.sms_sent_at,
+        sms_status=record.sms_status,
+        created_at=record.created_at
+    )
+
+
+async def _cache_lead(lead: Lead):
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(lead_cache_key(lead.id), lead.model_dump_json(), ex=LEAD_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to cache lead {lead.id}: {str(e)}")
+
+
+async def _get_cached_lead(lead_id: uuid.UUID) -> Optional[Lead]:
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        cached = await redis.get(lead_cache_key(lead_id))
+    except Exception as e:
+        logger.warning(f"Lead cache lookup failed for {lead_id}: {str(e)}")
+        return None
+    return Lead.model_validate_json(cached) if cached else None
+
+
+def _queue_booking_sms(record: LeadRecord):
+    """Queue the booking-link SMS for a lead."""
+    # TODO: Replace with actual Microsoft Bookings URL
+    booking_url = f"{settings.domain}/booking?lead_id={record.id}"
+
+    sms_dispatcher.enqueue(
+        record.phone_number,
+        twilio_service.booking_message(
+            booking_url=booking_url,
+            customer_name=record.customer_name,
+            description=record.notes,  # Include notes/description in SMS
+            meeting_id="",
+            passcode=""
+        ),
+        lead_id=record.id
+    )
+
+
+async def _load_lead(db: AsyncSession, lead_id: uuid.UUID) -> LeadRecord:
+    """Fetch a lead row or raise 404."""
+    record = await db.get(LeadRecord, lead_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Lead not found")
+    return record
 
 
 @router.post("", response_model=Lead)
-async def create_lead_and_send_sms(request: LeadCreate):
+async def create_lead_and_send_sms(
+    request: LeadCreate,
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Create a new lead and send SMS with booking link.
+    Create a new lead and queue an SMS with booking link.
+    
+    The SMS is sent in the background at the sender's rate limit; the
+    lead's sms_status moves from "queued" to "sent"/"delivered"/"failed".
     """
     try:
-        lead_id = str(uuid.uuid4())
-        
+        lead_id = uuid.uuid4()
+
         # Create lead
-        lead = Lead(
+        record = LeadRecord(
             id=lead_id,
             phone_number=request.phone_number,
             customer_name=request.customer_name,
             notes=request.notes,
             sms_sent=False,
             sms_sent_at=None,
+            sms_status="queued",
             created_at=datetime.utcnow()
         )
-        
-        # TODO: Replace with actual Microsoft Bookings URL
-        booking_url = f"{settings.domain}/booking?lead_id={lead_id}"
-        
-        # Send SMS with description
-        sms_response = twilio_service.send_booking_sms(
-            to_phone_number=request.phone_number,
-            booking_url=booking_url,
-            customer_name=request.customer_name,
-            description=request.notes  # Include notes/description in SMS
-        )
-        
-        if sms_response.success:
-            lead.sms_sent = True
-            lead.sms_sent_at = datetime.utcnow()
-        
+
         # Store lead
-        _leads[lead_id] = lead
-        
-        logger.info(f"Created lead and sent SMS: {lead_id}")
+        db.add(record)
+        await db.commit()
+
+        # Queue SMS with description (after commit, so the status update
+        # always finds the row)
+        _queue_booking_sms(record)
+
+        lead = _to_schema(record)
+        logger.info(f"Created lead and queued SMS: {lead_id}")
         return lead
-        
+
     except Exception as e:
         logger.error(f"Failed to create lead: {str(e)}")
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("", response_model=List[Lead])
-async def list_leads():
+async def list_leads(db: AsyncSession = Depends(get_db)):
     """List all leads."""
-    return list(_leads.values())
+    result = await db.execute(select(LeadRecord).order_by(LeadRecord.created_at.desc()))
+    return [_to_schema(record) for record in result.scalars()]
 
 
 @router.get("/{lead_id}", response_model=Lead)
-async def get_lead(lead_id: str):
+async def get_lead(lead_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get lead by ID."""
-    lead = _leads.get(lead_id)
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
+    lead = await _get_cached_lead(lead_id)
+    if lead is not None:
+        return lead
+
+    lead = _to_schema(await _load_lead(db, lead_id))
+    await _cache_lead(lead)
     return lead
 
 
 @router.post("/{lead_id}/resend-sms")
-async def resend_sms(lead_id: str):
+async def resend_sms(lead_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Resend SMS to a lead."""
-    lead = _leads.get(lead_id)
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
-    
-    booking_url = f"{settings.domain}/booking?lead_id={lead_id}"
-    
-    sms_response = twilio_service.send_booking_sms(
-        to_phone_number=lead.phone_number,
-        booking_url=booking_url,
-        customer_name=lead.customer_name,
-        description=lead.notes  # Include notes when resending
-    )
-    
-    if sms_response.success:
-        lead.sms_sent_at = datetime.utcnow()
-        return {"success": True, "message": "SMS sent successfully"}
-    else:
-        raise HTTPException(status_code=500, detail=sms_response.error)
+    record = await _load_lead(db, lead_id)
+
+    record.sms_status = "queued"
+    await db.commit()
+    await invalidate_cached_leads([lead_id])
+    _queue_booking_sms(record)
+
+    return {"success": True, "message": "SMS queued"}
@@ -2,7 +2,7 @@
 Session management API routes.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
@@ -13,29 +13,89 @@ from database import get_db
 from db_models import Session, SessionStatus
 from models import Session as SessionModel, SessionCreate, ParticipantRole
 from services.zoom_service import zoom_service
+from services.redis_client import get_redis
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
+# Join pages re-fetch their session on every refresh; with REDIS_URL set the
+# response is cached briefly for all workers (and by the browser)
+SESSION_CACHE_TTL = 30  # seconds
+SESSION_CACHE_CONTROL = f"private, max-age={SESSION_CACHE_TTL}, stale-while-revalidate={SESSION_CACHE_TTL}"
+
+
+async def _get_cached_session(session_id: uuid.UUID) -> Optional[dict]:
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        cached = await redis.get(f"session:{session_id}")
+    except Exception as e:
+        logger.warning(f"Session cache lookup failed for {session_id}: {str(e)}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+async def _cache_session(session_id: uuid.UUID, data: dict):
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(f"session:{session_id}", orjson.dumps(data), ex=SESSION_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to cache session {session_id}: {str(e)}")
+
+
+async def _invalidate_session(session_id: uuid.UUID):
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(f"session:{session_id}")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cached session {session_id}: {str(e)}")
+
 
 @router.get("", response_model=List[dict])
 async def list_sessions(
     status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all sessions, optionally filtered by status."""
+    """
+    List sessions, newest first, optionally filtered by status.
+    
+    Args:
+        limit: Page size
+        offset: Number of sessions to skip
+    """
     try:
-        query = select(Session).order_by(Session.created_at.desc())
+        query = (
+            select(
+                Session.id,
+                Session.zoom_meeting_id,
+                Session.zoom_meeting_password,
+                Session.status,
+                Session.created_at,
+                Session.expires_at
+            )
+            .order_by(Session.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+            .execution_options(yield_per=200)
+        )
         
         if status:
             # Filter by status if provided
             # Note: In a real app, you'd filter by enum, but for simplicity we list all
             pass
             
-        result = await db.execute(query)
-        sessions = result.scalars().all()
+        # Rows are streamed from a server-side cursor in batches of 200
+        result = await db.stream(query)
         
         # Convert to response model format
         return [
@@ -48,7 +108,7 @@ async def list_sessions(
                 "expires_at": s.expires_at.isoformat() if s.expires_at else None,
                 "participants": []
             } 
-            for s in sessions
+            async for s in result
         ]
     except Exception as e:
         logger.error(f"Failed to list sessions: {str(e)}")
@@ -56,16 +116,26 @@ async def list_sessions(
 
 
 @router.get("/{session_id}", response_model=dict)
-async def get_session(session_id: str, db: AsyncSession = Depends(get_db)):
+async def get_session(
+    session_id: uuid.UUID,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """Get session details."""
+    response.headers["Cache-Control"] = SESSION_CACHE_CONTROL
+    
+    cached = await _get_cached_session(session_id)
+    if cached is not None:
+        return cached
+    
     try:
-        result = await db.execute(select(Session).where(Session.id == uuid.UUID(session_id)))
+        result = await db.execute(select(Session).where(Session.id == session_id))
         session = result.scalar_one_or_none()
         
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
             
-        return {
+        data = {
             "id": str(session.id),
             "zoom_meeting_id": session.zoom_meeting_id,
             "zoom_meeting_password": session.zoom_meeting_password,
@@ -74,18 +144,20 @@ async def get_session(session_id: str, db: AsyncSession = Depends(get_db)):
             "expires_at": session.expires_at.isoformat() if session.expires_at else None,
             "participants": [] # Participants would need a separate join table or logic
         }
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid session ID format")
+        await _cache_session(session_id, data)
+        return data
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get session: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/{session_id}/end")
-async def end_session(session_id: str, db: AsyncSession = Depends(get_db)):
+async def end_session(session_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """End a session and notify participants."""
     try:
-        query = select(Session).where(Session.id == uuid.UUID(session_id))
+        query = select(Session).where(Session.id == session_id)
         result = await db.execute(query)
         session = result.scalar_one_or_none()
         
@@ -95,11 +167,12 @@ async def end_session(session_id: str, db: AsyncSession = Depends(get_db)):
         else:
             session.status = SessionStatus.COMPLETED
             await db.commit()
+            await _invalidate_session(session_id)
             
         # Broadcast event to all connected clients
         try:
             from websocket.manager import connection_manager
-            await connection_manager.broadcast_event(session_id, "meeting.ended", {
+            await connection_manager.broadcast_event(str(session_id), "meeting.ended", {
                 "timestamp": datetime.utcnow().isoformat()
             })
         except Exception as ws_error:
@@ -108,8 +181,6 @@ async def end_session(session_id: str, db: AsyncSession = Depends(get_db)):
         
         return {"message": "Session ended successfully"}
         
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid session ID format")
     except Exception as e:
         logger.error(f"Failed to end session: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,13 +2,33 @@
 Twilio webhook endpoints for SMS status callbacks.
 """
 
-from fastapi import APIRouter, Form, Request
+from fastapi import APIRouter, Depends, Form, Request
+from fastapi.responses import Response
 from typing import Optional
+from middleware.twilio_signature import verify_twilio_signature
+from services.sms_status_buffer import sms_status_buffer
 import logging
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/twilio", tags=["twilio-webhooks"])
+router = APIRouter(
+    prefix="/api/twilio",
+    tags=["twilio-webhooks"],
+    dependencies=[Depends(verify_twilio_signature)]
+)
+
+# The voice reply never changes, so it is encoded once and the same
+# response object is returned for every call
+_VOICE_TWIML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say voice="alice">
+        Thank you for calling our insurance consultation service. 
+        Please use the meeting link sent to you via SMS to join your scheduled video consultation.
+        If you have questions, please reply to the SMS or email us.
+    </Say>
+    <Hangup/>
+</Response>"""
+_VOICE_TWIML_RESPONSE = Response(content=_VOICE_TWIML, media_type="application/xml")
 
 
 @router.post("/sms-webhook")
@@ -67,11 +87,11 @@ async def sms_status_callback(
         if ErrorCode:
             logger.error(f"SMS Error {ErrorCode}: {ErrorMessage}")
         
-        # TODO: Update SMS status in database
-        # For example:
-        # - Update lead record with delivery status
-        # - Retry if failed
-        # - Send notification to admin if delivery failed
+        # Record delivery status on the lead that sent this message
+        # (buffered; written in batches)
+        sms_status_buffer.record(MessageSid, MessageStatus)
+        
+        # TODO: Send notification to admin if delivery failed
         
         return {
             "status": "ok",
@@ -97,24 +117,7 @@ async def voice_incoming_webhook(
     
     Returns TwiML to control call behavior.
     """
-    try:
-        logger.info(f"Incoming call from {From}")
-        
-        # Return TwiML to play message and hang up
-        from fastapi.responses import Response
-        
-        twiml_response = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say voice="alice">
-        Thank you for calling our insurance consultation service. 
-        Please use the meeting link sent to you via SMS to join your scheduled video consultation.
-        If you have questions, please reply to the SMS or email us.
-    </Say>
-    <Hangup/>
-</Response>"""
-        
-        return Response(content=twiml_response, media_type="application/xml")
+    logger.info(f"Incoming call from {From}")
     
-    except Exception as e:
-        logger.error(f"Error processing incoming call: {str(e)}")
-        return Response(content="<Response><Hangup/></Response>", media_type="application/xml")
+    # Play message and hang up
+    return _VOICE_TWIML_RESPONSE
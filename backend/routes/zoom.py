@@ -2,7 +2,7 @@
 Zoom API routes.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from models import ZoomSignatureRequest, ZoomSignatureResponse
 from services.zoom_service import zoom_service
 import logging
@@ -22,7 +22,7 @@ async def generate_signature(request: ZoomSignatureRequest):
         )
         
         # Get meeting details to include password if available
-        meeting_details = zoom_service.get_meeting_details(request.meeting_number)
+        meeting_details = await zoom_service.aget_meeting_details(request.meeting_number)
         password = meeting_details.get('password') if meeting_details else None
         
         return ZoomSignatureResponse(
@@ -60,10 +60,11 @@ async def create_meeting(
 
 
 @router.get("/meeting/{meeting_id}")
-async def get_meeting(meeting_id: str):
-    """Get Zoom meeting details."""
+async def get_meeting(meeting_id: str, response: Response):
+    """Get Zoom meeting details (cached server-side by zoom_service)."""
+    response.headers["Cache-Control"] = "private, max-age=30, stale-while-revalidate=30"
     try:
-        meeting_details = zoom_service.get_meeting_details(meeting_id)
+        meeting_details = await zoom_service.aget_meeting_details(meeting_id)
         
         if not meeting_details:
             raise HTTPException(status_code=404, detail="Meeting not found")
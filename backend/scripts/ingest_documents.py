@@ -5,44 +5,42 @@ Processes insurance documents and uploads to Pinecone.
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from rag.embeddings import embedding_service, chunk_text, generate_chunk_id
-from rag.pinecone_client import pinecone_client
-import PyPDF2
+from rag.embed_cache import embed_cache
+from rag.pdf_text import extract_pdf_text
+from rag.pinecone_client import get_pinecone_client
 import docx
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SUPPORTED_EXTS = {'.pdf', '.docx', '.doc', '.txt'}
+
 
 def read_pdf(file_path: str) -> str:
     """Extract text from PDF file."""
-    text = ""
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+        return extract_pdf_text(file_path)
     except Exception as e:
         logger.error(f"Failed to read PDF {file_path}: {str(e)}")
-    return text
+        return ""
 
 
 def read_docx(file_path: str) -> str:
     """Extract text from DOCX file."""
-    text = ""
     try:
         doc = docx.Document(file_path)
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
     except Exception as e:
         logger.error(f"Failed to read DOCX {file_path}: {str(e)}")
-    return text
+        return ""
 
 
 def read_txt(file_path: str) -> str:
@@ -55,16 +53,19 @@ def read_txt(file_path: str) -> str:
         return ""
 
 
-def process_document(file_path: str, source_name: str = None):
+def read_document(file_path: str, source_name: str = None):
     """
-    Process a single document.
+    Extract the text of a single document.
+    
+    Module-level and free of shared state, so it can run in a worker
+    process.
     
     Args:
         file_path: Path to document
         source_name: Optional source name (defaults to filename)
     
     Returns:
-        List of chunks with embeddings and metadata
+        (source_name, text); text is empty for unsupported or unreadable files
     """
     if not source_name:
         source_name = Path(file_path).name
@@ -82,8 +83,22 @@ def process_document(file_path: str, source_name: str = None):
         text = read_txt(file_path)
     else:
         logger.warning(f"Unsupported file type: {ext}")
-        return []
+        text = ""
     
+    return source_name, text
+
+
+def build_chunks(source_name: str, text: str):
+    """
+    Chunk a document's text (no embeddings yet).
+    
+    Args:
+        source_name: Document name stored with each chunk
+        text: Extracted document text
+    
+    Returns:
+        List of chunks with ids and metadata
+    """
     if not text.strip():
         logger.warning(f"No text extracted from {source_name}")
         return []
@@ -92,17 +107,13 @@ def process_document(file_path: str, source_name: str = None):
     chunks = chunk_text(text, chunk_size=500, chunk_overlap=100)
     logger.info(f"Created {len(chunks)} chunks from {source_name}")
     
-    # Generate embeddings
-    embeddings = embedding_service.embed_batch(chunks)
-    
     # Create chunk objects
     chunk_objects = []
-    for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+    for idx, chunk in enumerate(chunks):
         chunk_id = generate_chunk_id(chunk, source_name, idx)
         
         chunk_objects.append({
             'id': chunk_id,
-            'embedding': embedding,
             'metadata': {
                 'text': chunk,
                 'source': source_name,
@@ -114,6 +125,78 @@ def process_document(file_path: str, source_name: str = None):
     return chunk_objects
 
 
+def chunk_document(file_path: str, source_name: str = None):
+    """
+    Read and chunk a single document (no embeddings yet).
+    
+    Args:
+        file_path: Path to document
+        source_name: Optional source name (defaults to filename)
+    
+    Returns:
+        List of chunks with ids and metadata
+    """
+    return build_chunks(*read_document(file_path, source_name))
+
+
+def embed_chunks(chunk_objects):
+    """
+    Add embeddings to chunk objects with batched API calls.
+    
+    Chunks embedded by an earlier run (same text and model) come from the
+    on-disk embedding cache; only new or edited text goes to the API.
+    
+    Args:
+        chunk_objects: Chunks from chunk_document (any number of documents)
+    
+    Returns:
+        The same chunks, each with an 'embedding'
+    """
+    texts = [chunk['metadata']['text'] for chunk in chunk_objects]
+    embeddings = embed_cache.get_or_compute_many(
+        texts,
+        embedding_service.model_name,
+        embedding_service.embed_batch
+    )
+    
+    for chunk, embedding in zip(chunk_objects, embeddings):
+        chunk['embedding'] = embedding
+    
+    return chunk_objects
+
+
+def process_document(file_path: str, source_name: str = None):
+    """
+    Process a single document.
+    
+    Args:
+        file_path: Path to document
+        source_name: Optional source name (defaults to filename)
+    
+    Returns:
+        List of chunks with embeddings and metadata
+    """
+    return embed_chunks(chunk_document(file_path, source_name))
+
+
+def iter_supported(root: str):
+    """
+    Walk a directory tree, yielding paths of supported documents.
+    
+    Uses os.scandir so entries are filtered by name before any Path object
+    or extra stat call is made for them; symlinked directories are not
+    followed.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTS:
+                    yield entry.path
+
+
 def ingest_directory(directory_path: str):
     """
     Ingest all documents from a directory.
@@ -127,16 +210,21 @@ def ingest_directory(directory_path: str):
         logger.error(f"Directory not found: {directory_path}")
         return
     
-    # Supported extensions
-    supported_exts = ['.pdf', '.docx', '.doc', '.txt']
-    
     # Find all documents
+    paths = list(iter_supported(str(directory)))
+    
+    # PDF/DOCX parsing is CPU-bound: read files in parallel worker
+    # processes, then chunk and embed centrally
     all_chunks = []
     
-    for file_path in directory.rglob('*'):
-        if file_path.suffix.lower() in supported_exts:
-            chunks = process_document(str(file_path))
-            all_chunks.extend(chunks)
+    if len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+            documents = list(executor.map(read_document, paths))
+    else:
+        documents = [read_document(path) for path in paths]
+    
+    for source_name, text in documents:
+        all_chunks.extend(build_chunks(source_name, text))
     
     if not all_chunks:
         logger.warning("No chunks created from documents")
@@ -144,7 +232,12 @@ def ingest_directory(directory_path: str):
     
     logger.info(f"Total chunks to upload: {len(all_chunks)}")
     
-    # Upload to Pinecone
+    # Embed all documents together so API batches are always full
+    embed_chunks(all_chunks)
+    
+    # Upload to Pinecone (connected here, not at import, so the reader
+    # processes don't each open a client)
+    pinecone_client = get_pinecone_client()
     count = pinecone_client.upsert_chunks(all_chunks)
     logger.info(f"Successfully uploaded {count} chunks to Pinecone")
     
@@ -3,26 +3,35 @@ import asyncio
 import os
 import sys
 import json
-import io
 import logging
 
+import numpy as np
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.sharepoint_service import sharepoint_service
+from services.ingestion_service import extract_sharepoint_metadata
 from rag.embeddings import embedding_service
-from rag.pinecone_client import pinecone_client
+from rag.embed_cache import embed_cache
+from rag.pdf_text import extract_pdf_text
+from rag.pinecone_client import get_pinecone_client
 from typing import List, Dict
 
 # Setup Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+pinecone_client = get_pinecone_client()
+
 # Constants
 KB_SITE_NAME = "Compliance"
 KB_LIB_NAME = "KB-DEV"
 IGNORED_FOLDERS = ["00_TrainingReference", "Forms"]
 STATE_FILE = "sync_state.json"
+# Chunks are embedded and upserted once this many are pending (checked at
+# file boundaries, so a file's chunks are never split across flushes)
+BATCH_SIZE = 96
 
 class LocalFileService:
     """Mock Service for Local Ingestion"""
@@ -60,6 +69,9 @@ class IngestionPipeline:
     def __init__(self):
         self.state_file = STATE_FILE
         self.sync_state = self._load_state()
+        self.pending_texts: List[str] = []
+        self.pending_meta: List[Dict] = []  # {"id", "metadata"}, aligned with pending_texts
+        self.pending_files: Dict[str, str] = {}  # file_id -> last_modified
 
     def _load_state(self) -> Dict[str, str]:
         if os.path.exists(self.state_file):
@@ -82,33 +94,64 @@ class IngestionPipeline:
             if file_name.endswith('.txt'):
                 return file_content.decode('utf-8', errors='ignore')
             elif file_name.endswith('.pdf'):
-                import PyPDF2
-                pdf = PyPDF2.PdfReader(io.BytesIO(file_content))
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
-                return text
+                return extract_pdf_text(file_content)
             return ""
         except Exception as e:
             logger.error(f"Text extraction failed for {file_name}: {e}")
             return ""
 
     def chunk_text(self, text: str, chunk_size: int = 1000) -> List[str]:
+        """
+        Split text into chunks of whole words, each closed by the first
+        word that brings its length (words + separators) to chunk_size.
+        """
         words = text.split()
+        if not words:
+            return []
+        
+        # Running length over the whole text; each chunk boundary is one
+        # searchsorted instead of a Python step per word
+        cumul = np.cumsum(np.fromiter(map(len, words), dtype=np.int64, count=len(words)) + 1)
         chunks = []
-        current_chunk = []
-        current_length = 0
-        for word in words:
-            current_chunk.append(word)
-            current_length += len(word) + 1
-            if current_length >= chunk_size:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = []
-                current_length = 0
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        start = 0
+        base = 0
+        while start < len(words):
+            end = int(np.searchsorted(cumul, base + chunk_size, side="left")) + 1
+            chunks.append(" ".join(words[start:end]))
+            if end <= len(words):
+                base = int(cumul[end - 1])
+            start = end
         return chunks
 
+    async def flush(self) -> int:
+        """
+        Embed and upsert pending chunks, then mark their files as synced.
+        
+        Returns:
+            Number of files flushed
+        """
+        if not self.pending_texts:
+            return 0
+        
+        # Unchanged chunks (same text and model) come from the on-disk cache
+        embeddings = await embed_cache.get_or_compute_many_async(
+            self.pending_texts,
+            embedding_service.model_name,
+            embedding_service.embed_batch_async
+        )
+        vectors = [
+            {"id": meta["id"], "embedding": embedding, "metadata": meta["metadata"]}
+            for meta, embedding in zip(self.pending_meta, embeddings)
+        ]
+        await pinecone_client.upsert_chunks_async(vectors)
+        
+        files = len(self.pending_files)
+        self.sync_state.update(self.pending_files)
+        self._save_state()
+        
+        self.pending_texts, self.pending_meta, self.pending_files = [], [], {}
+        return files
+
     async def run(self, local_mode: bool = False):
         logger.info(f"Starting Ingestion Pipeline (Local Mode: {local_mode})...")
         processed_count = 0
@@ -137,56 +180,58 @@ class IngestionPipeline:
             service = sharepoint_service
             root_items = service.list_drive_items(drive_id)
 
-        for item in root_items:
-            if "folder" in item and item['name'] not in IGNORED_FOLDERS:
-                universe_name = item['name']
-                logger.info(f"Checking Universe: {universe_name}")
-                files = service.list_drive_items(drive_id, folder_path=universe_name)
+        # Chunks of files already processed are upserted (and their sync
+        # state saved) even if listing or downloading a later file fails
+        try:
+            for item in root_items:
+                if "folder" in item and item['name'] not in IGNORED_FOLDERS:
+                    universe_name = item['name']
+                    logger.info(f"Checking Universe: {universe_name}")
+                    files = service.list_drive_items(drive_id, folder_path=universe_name)
                 
-                for file in files:
-                    if "file" in file:
-                        file_id = file['id']
-                        file_name = file['name']
-                        last_modified = file.get('lastModifiedDateTime', '')
+                    for file in files:
+                        if "file" in file:
+                            file_id = file['id']
+                            file_name = file['name']
+                            last_modified = file.get('lastModifiedDateTime', '')
                         
-                        # INCREMENTAL CHECK
-                        if self.sync_state.get(file_id) == last_modified:
-                            continue
+                            # INCREMENTAL CHECK
+                            if self.sync_state.get(file_id) == last_modified:
+                                continue
                             
-                        logger.info(f"  > Processing New/Modified File: {file_name}")
+                            logger.info(f"  > Processing New/Modified File: {file_name}")
                         
-                        # Process
-                        fields = file.get('fields', {})
-                        content = service.get_file_content(drive_id, file_id)
-                        if not content: continue
+                            # Process
+                            # Same fields as the service pipeline, so request
+                            # filters match these vectors too
+                            base_metadata = extract_sharepoint_metadata(file)
+                            content = service.get_file_content(drive_id, file_id)
+                            if not content: continue
                         
-                        text = self.extract_text(content, file_name)
-                        if not text: continue
+                            text = self.extract_text(content, file_name)
+                            if not text: continue
                         
-                        chunks = self.chunk_text(text)
-                        vectors = []
-                        for i, chunk_text in enumerate(chunks):
-                            embedding = embedding_service.embed_query(chunk_text)
-                            vector_id = f"{universe_name}_{file_name}_{i}"
-                            vector_id = "".join([c if c.isalnum() else "_" for c in vector_id])
+                            chunks = self.chunk_text(text)
+                            for i, chunk_text in enumerate(chunks):
+                                vector_id = f"{universe_name}_{file_name}_{i}"
+                                vector_id = "".join([c if c.isalnum() else "_" for c in vector_id])
                             
-                            metadata = {
-                                "text": chunk_text, 
-                                "source": file_name, 
-                                "universe": universe_name,
-                                "regulator": fields.get('Regulator', 'Unknown'),
-                                "authority": fields.get('AuthorityLevel', 'Unknown'),
-                                "last_modified": last_modified
-                            }
+                                metadata = {
+                                    **base_metadata,
+                                    "text": chunk_text, 
+                                    "source": file_name, 
+                                    "universe": universe_name
+                                }
                             
-                            vectors.append({"id": vector_id, "values": embedding, "metadata": metadata})
+                                self.pending_texts.append(chunk_text)
+                                self.pending_meta.append({"id": vector_id, "metadata": metadata})
                             
-                        if vectors:
-                            pinecone_client.upsert_chunks(vectors)
-                            processed_count += 1
-                            self.sync_state[file_id] = last_modified
-                            self._save_state()
-
+                            if chunks:
+                                self.pending_files[file_id] = last_modified
+                            if len(self.pending_texts) >= BATCH_SIZE:
+                                processed_count += await self.flush()
+        finally:
+            processed_count += await self.flush()
         logger.info(f"Ingestion Complete. Processed {processed_count} new files.")
 
 if __name__ == "__main__":
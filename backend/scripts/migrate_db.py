@@ -0,0 +1,53 @@
+"""
+Apply idempotent schema updates to an existing database.
+
+init_db()/create_all only creates missing tables; it never alters tables
+that already exist. Statements here bring older databases up to date with
+db_models.py and are safe to re-run.
+"""
+import asyncio
+import sys
+import os
+import asyncpg
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from config import settings
+
+MIGRATIONS = [
+    # Server-generated ids for high-write tables
+    "ALTER TABLE session_participants ALTER COLUMN id SET DEFAULT gen_random_uuid()",
+    "ALTER TABLE transcripts ALTER COLUMN id SET DEFAULT gen_random_uuid()",
+    "ALTER TABLE ai_responses ALTER COLUMN id SET DEFAULT gen_random_uuid()",
+    # SMS delivery tracking for leads
+    "ALTER TABLE leads ADD COLUMN IF NOT EXISTS sms_sid VARCHAR(64)",
+    "ALTER TABLE leads ADD COLUMN IF NOT EXISTS sms_status VARCHAR(20)",
+    "CREATE INDEX IF NOT EXISTS ix_leads_sms_sid ON leads (sms_sid)",
+    # Booking list / reminder queries
+    "CREATE INDEX IF NOT EXISTS ix_bookings_status_scheduled ON bookings (status, scheduled_time DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_bookings_scheduled ON bookings (scheduled_time DESC)",
+]
+
+
+async def migrate():
+    print("Applying schema migrations...")
+
+    # Extract DSN from SQLAlchemy URL (remove 'postgresql+asyncpg://')
+    dsn = settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    try:
+        conn = await asyncpg.connect(dsn, statement_cache_size=0)
+    except Exception as e:
+        print(f"❌ Connection failed: {e}")
+        return
+
+    try:
+        for statement in MIGRATIONS:
+            await conn.execute(statement)
+            print(f"✅ {statement}")
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -43,11 +43,13 @@ async def test_dry_run():
     
     # Mock Pinecone
     mock_pc = MagicMock()
-    mock_pc.upsert_chunks.return_value = 1
+    mock_pc.upsert_chunks_async = AsyncMock(return_value=1)
     ingestion_service.pinecone = mock_pc
     
     # Mock Embeddings
     mock_emb = MagicMock()
+    mock_emb.model_name = "mock-embedding-model"
+    mock_emb.embed_batch_async = AsyncMock(return_value=[])
     ingestion_service.embeddings = mock_emb
     
     # Run Pipeline
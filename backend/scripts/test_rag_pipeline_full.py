@@ -83,7 +83,9 @@ async def test_full_rag_pipeline():
     print("[3/5] Running Ingestion Pipeline...")
     
     # Mock Embedding returning dummy vector
-    mock_emb.embed_batch.side_effect = lambda texts: [[0.1] * 768] * len(texts)
+    mock_emb.model_name = "mock-embedding-model"
+    mock_emb.embed_batch_async = AsyncMock(side_effect=lambda texts: [[0.1] * 768] * len(texts))
+    mock_pc.upsert_chunks_async = AsyncMock(side_effect=lambda vectors: len(vectors))
     
     # Run
     await service.run_pipeline(site_name="KB-DEV")
@@ -92,8 +94,8 @@ async def test_full_rag_pipeline():
     print("\n[4/5] Verifying Metadata & Chunking...")
     
     # Verify Upsert Call
-    if mock_pc.upsert_chunks.called:
-        call_args = mock_pc.upsert_chunks.call_args[0][0] # First arg is list of vectors
+    if mock_pc.upsert_chunks_async.called:
+        call_args = mock_pc.upsert_chunks_async.call_args[0][0] # First arg is list of vectors
         print(f"✅ Upsert called with {len(call_args)} chunks.")
         
         first_chunk = call_args[0]
@@ -2,38 +2,42 @@
 from config import settings
 from services.openai_service import OpenAIService
 from services.gemini_service import GeminiService
+from functools import lru_cache
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
-class AIFactory:
-    """
-    Factory to return the configured AI Service (OpenAI or Gemini).
-    """
-    _instance = None
+# lru_cache alone can run the constructor twice when two threads miss at
+# once; the lock makes creation happen exactly once
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _create_ai_service():
+    """Build the AI service for settings.ai_provider."""
+    provider = settings.ai_provider.lower()
+    
+    if provider == "openai":
+        logger.info("AI service: Initializing OpenAI Service")
+        return OpenAIService()
+    if provider == "gemini":
+        logger.info("AI service: Initializing Gemini Service")
+        return GeminiService()
     
-    @classmethod
-    def get_service(cls):
-        """
-        Get the AI service instance based on configuration.
-        """
-        if cls._instance:
-            return cls._instance
-            
-        provider = settings.ai_provider.lower()
-        
-        if provider == "openai":
-            logger.info("AIFactory: Initializing OpenAI Service")
-            cls._instance = OpenAIService()
-        elif provider == "gemini":
-            logger.info("AIFactory: Initializing Gemini Service")
-            cls._instance = GeminiService()
-        else:
-            logger.warning(f"Unknown AI_PROVIDER '{provider}'. Defaulting to OpenAI.")
-            cls._instance = OpenAIService()
-            
-        return cls._instance
-
-# Global helper
+    logger.warning(f"Unknown AI_PROVIDER '{provider}'. Defaulting to OpenAI.")
+    return OpenAIService()
+
+
 def get_ai_service():
-    return AIFactory.get_service()
+    """
+    Get the configured AI service (OpenAI or Gemini), created once per process.
+    """
+    with _lock:
+        return _create_ai_service()
+
+
+def reset_ai_service():
+    """Drop the cached service so the next call reads settings.ai_provider again."""
+    with _lock:
+        _create_ai_service.cache_clear()
@@ -0,0 +1,115 @@
+"""
+Semantic answer cache for AI query endpoints.
+
+Stores generated answers next to the normalized embedding of the question
+that produced them. A new question whose embedding has cosine similarity
+at or above the threshold with a stored one reuses that answer instead of
+running retrieval and generation again.
+"""
+
+from typing import Any, List, Optional
+import logging
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerCache:
+    """Fixed-size, TTL-bounded semantic cache backed by a NumPy matrix."""
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float = 0.95,
+        ttl_seconds: float = 3600,
+        max_entries: int = 512,
+        dtype=np.float16
+    ):
+        """
+        Args:
+            dtype: Storage type of the embedding matrix. float16 halves the
+                memory but is upcast to float32 on every lookup, so large
+                caches should use float32
+        """
+        self.name = name
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.dtype = dtype
+        # Ring buffer; the matrix is allocated on first put once the
+        # embedding dimension is known
+        self._matrix: Optional[np.ndarray] = None
+        self._expires = np.zeros(max_entries, dtype=np.float64)
+        self._answers: List[Any] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+        # Lookups may run in worker threads while another thread stores
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, embedding: List[float]) -> Optional[Any]:
+        """
+        Look up an answer for a semantically equivalent question.
+
+        Args:
+            embedding: Query embedding
+
+        Returns:
+            Cached answer or None
+        """
+        query = self._normalize(embedding)
+
+        with self._lock:
+            if self._size == 0 or self._matrix.shape[1] != query.shape[0]:
+                return None
+
+            matrix = self._matrix[:self._size]
+            if matrix.dtype != np.float32:
+                matrix = matrix.astype(np.float32)
+            scores = matrix @ query
+            scores[self._expires[:self._size] <= time.time()] = -1.0
+
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            answer = self._answers[best]
+
+        logger.info(f"{self.name} answer cache hit (similarity {scores[best]:.3f})")
+        return answer
+
+    def put(self, embedding: List[float], answer: Any):
+        """
+        Store an answer, overwriting the oldest slot when full.
+
+        Args:
+            embedding: Query embedding
+            answer: Answer to return for similar queries
+        """
+        vector = self._normalize(embedding)
+
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                self._matrix = np.zeros((self.max_entries, vector.shape[0]), dtype=self.dtype)
+                self._size = 0
+                self._next = 0
+
+            slot = self._next
+            self._matrix[slot] = vector
+            self._expires[slot] = time.time() + self.ttl_seconds
+            self._answers[slot] = answer
+
+            self._next = (slot + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+
+
+# Global cache instances (RAG answers and plain chat answers differ)
+query_answer_cache = AnswerCache("query")
+chat_answer_cache = AnswerCache("chat")
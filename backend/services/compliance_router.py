@@ -1,12 +1,47 @@
 from services.ai_factory import get_ai_service
+from services.answer_cache import AnswerCache
+from rag.embeddings import embedding_service
+from rag.retriever import embed_query_cached
 from config import settings
-from typing import Optional
+from typing import List, Optional
+from functools import lru_cache
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
-# Initialize service
-ai_service = get_ai_service()
+# Paraphrases of an earlier question ("Medicare marketing rules?" vs
+# "Medicare marketing restrictions?") reuse its universe instead of another
+# LLM call
+ROUTE_SIMILARITY = 0.85
+ROUTE_CACHE_TTL = 24 * 3600  # seconds
+# Scanned in full on every lookup; float32 so no per-query conversion
+# (2048 x 1024 dims = 8 MB)
+ROUTE_CACHE_SIZE = 2048
+
+# Queries close to one universe description, and clearly closer to it than
+# to anything else, are routed locally; the LLM only sees the rest.
+# Similarity scales differ per embedding model (Gemini embedding-001 scores
+# unrelated short texts around 0.6-0.7), so the floor is per model
+UNIVERSE_MATCH = {
+    "text-embedding-3-small": 0.55,
+    "models/embedding-001": 0.8
+}
+DEFAULT_UNIVERSE_MATCH = 0.8
+UNIVERSE_MARGIN = 0.05  # over the runner-up (another universe or NONE)
+
+# Greetings, vague and off-topic questions: a query nearest to one of these
+# goes to the LLM, which answers NONE
+NONE_EXAMPLES = [
+    "Hello, how are you?",
+    "Thanks, that's all for today.",
+    "Can you help me with a question?",
+    "What's the weather like today?"
+]
+
+# AnswerCache.get returns None on a miss, so "no universe" is stored as NONE
+_NO_UNIVERSE = "NONE"
 
 class ComplianceRouter:
     """
@@ -21,44 +56,138 @@ class ComplianceRouter:
         "05_FL_Medicaid_Agency",
         "06_Carrier_FMO_Policies"
     ]
+    # Universe descriptions, used both in the LLM prompt and as the
+    # prototypes for local embedding classification
+    UNIVERSE_DESCRIPTIONS = {
+        "01_FL_State_Authority": "General Florida insurance laws, licensing, appointments.",
+        "02_CMS_Medicare_Authority": "Medicare Advantage, Part D, CMS marketing rules.",
+        "03_Federal_ACA_Authority": "Affordable Care Act, Marketplace, Subsidies.",
+        "04_ERISA_IRS_SelfFunded": "Employer group plans, Tax rules, Self-funded/ERISA.",
+        "05_FL_Medicaid_Agency": "Mixed eligibility, Medicaid specific rules.",
+        "06_Carrier_FMO_Policies": "Specific carrier rules (Aetna, UHC, Humana) or FMO policies."
+    }
     SYSTEM_PROMPT = """You are a Compliance Router for a health insurance agency.
 Your ONLY job is to classify the user's question into exactly ONE of the following Regulatory Universes.
 
 Universes:
-- 01_FL_State_Authority: General Florida insurance laws, licensing, appointments.
-- 02_CMS_Medicare_Authority: Medicare Advantage, Part D, CMS marketing rules.
-- 03_Federal_ACA_Authority: Affordable Care Act, Marketplace, Subsidies.
-- 04_ERISA_IRS_SelfFunded: Employer group plans, Tax rules, Self-funded/ERISA.
-- 05_FL_Medicaid_Agency: Mixed eligibility, Medicaid specific rules.
-- 06_Carrier_FMO_Policies: Specific carrier rules (Aetna, UHC, Humana) or FMO policies.
-
+""" + "".join(f"- {name}: {desc}\n" for name, desc in UNIVERSE_DESCRIPTIONS.items()) + """
 Output exactly ONE Universe name from the list above.
 If the question is greetings or vague, output "NONE".
 """
 
-    def determine_universe(self, query: str) -> Optional[str]:
+    def __init__(self):
+        self._cache = AnswerCache(
+            "universe",
+            threshold=ROUTE_SIMILARITY,
+            ttl_seconds=ROUTE_CACHE_TTL,
+            max_entries=ROUTE_CACHE_SIZE,
+            dtype=np.float32
+        )
+        # One label per prototype row; None for the NONE examples
+        self._labels = list(self.UNIVERSE_DESCRIPTIONS) + [None] * len(NONE_EXAMPLES)
+        self._prototypes: Optional[np.ndarray] = None
+
+    def _get_prototypes(self) -> np.ndarray:
+        """Normalized prototype embeddings, one row per label (built on first use)."""
+        if self._prototypes is None:
+            texts = list(self.UNIVERSE_DESCRIPTIONS.values()) + NONE_EXAMPLES
+            matrix = np.array([embed_query_cached(text) for text in texts], dtype=np.float32)
+            self._prototypes = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+        return self._prototypes
+
+    def _classify_local(self, embedding: List[float]) -> Optional[str]:
         """
-        Classify query using LLM.
+        Nearest universe description, or None when the query is nearest to
+        a NONE example, below the model's UNIVERSE_MATCH, or within
+        UNIVERSE_MARGIN of the runner-up.
         """
         try:
-            prompt = f"{self.SYSTEM_PROMPT}\n\nUSER QUESTION: {query}\n\nUNIVERSE:"
-            # Use AI Service
-            result = ai_service.complete(prompt)
-            
-            # Clean up result
-            result = result.strip().replace('"', '').replace("'", "")
-            
-            # Validation
-            if result in self.UNIVERSES:
-                logger.info(f"Routed query to universe: {result}")
-                return result
-            
-            logger.info(f"No specific universe match (Result: {result}).")
+            prototypes = self._get_prototypes()
+        except Exception as e:
+            logger.warning(f"Universe prototypes unavailable: {e}")
             return None
+
+        query = np.asarray(embedding, dtype=np.float32)
+        if query.shape[0] != prototypes.shape[1]:
+            return None
+        scores = prototypes @ (query / np.linalg.norm(query))
+
+        second, best = np.argsort(scores)[-2:]
+        universe = self._labels[best]
+        threshold = UNIVERSE_MATCH.get(embedding_service.model_name, DEFAULT_UNIVERSE_MATCH)
+        if (
+            universe is None
+            or scores[best] < threshold
+            or scores[best] - scores[second] < UNIVERSE_MARGIN
+        ):
+            return None
+        logger.info(f"Routed query to universe: {universe} (similarity {scores[best]:.3f})")
+        return universe
+
+    def determine_universe(self, query: str, embedding: Optional[List[float]] = None) -> Optional[str]:
+        """
+        Classify query by embedding similarity, falling back to the LLM.
+        
+        Queries close to a universe description are routed locally. The
+        rest go to the LLM classifier, whose results are cached per query
+        string and, by embedding similarity, for paraphrases of earlier
+        queries; failed classifications are not cached so the next call
+        retries.
+        
+        Args:
+            query: User question
+            embedding: Query embedding, if the caller already has it
+        
+        Returns:
+            Universe name, or None
+        """
+        try:
+            if embedding is None:
+                embedding = embed_query_cached(query)
+        except Exception as e:
+            logger.warning(f"Query embedding failed, routing without semantic cache: {e}")
+        
+        if embedding is not None:
+            universe = self._classify_local(embedding)
+            if universe is not None:
+                return universe
             
+            cached = self._cache.get(embedding)
+            if cached is not None:
+                return None if cached == _NO_UNIVERSE else cached
+        
+        try:
+            universe = _classify_cached(query)
         except Exception as e:
             logger.error(f"Routing failed: {e}")
             return None
+        
+        if embedding is not None:
+            self._cache.put(embedding, universe or _NO_UNIVERSE)
+        return universe
+
+
+@lru_cache(maxsize=2048)
+def _classify_cached(query: str) -> Optional[str]:
+    """Run the LLM classifier; raises (and so skips the cache) on failure."""
+    prompt = f"{ComplianceRouter.SYSTEM_PROMPT}\n\nUSER QUESTION: {query}\n\nUNIVERSE:"
+    # Use AI Service
+    result = get_ai_service().complete(prompt)
+    
+    # complete() swallows provider errors and returns ""
+    if not result:
+        raise RuntimeError("empty classifier response")
+    
+    # Clean up result
+    result = result.strip().replace('"', '').replace("'", "")
+    
+    # Validation
+    if result in ComplianceRouter.UNIVERSES:
+        logger.info(f"Routed query to universe: {result}")
+        return result
+    
+    logger.info(f"No specific universe match (Result: {result}).")
+    return None
 
 # Global Instance
 compliance_router = ComplianceRouter()
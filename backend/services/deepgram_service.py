@@ -35,14 +35,13 @@ class DeepgramService:
         """
         Start real-time transcription for a session.
         """
-        print(f"DEBUG: DeepgramService.start_transcription called for {session_id}")
+        logger.debug("start_transcription called for %s", session_id)
         try:
             # 1. Store callback and current loop for this session
             self._on_transcript_callbacks[session_id] = on_transcript
             loop = asyncio.get_running_loop() # Capture the main loop
 
             # ... (rest of configuration) ...
-            print("DEBUG: Configuring LiveOptions")
             options = LiveOptions(
                 model="nova-2",
                 language=language,
@@ -57,20 +56,16 @@ class DeepgramService:
             service = self  # Capture the DeepgramService instance
             
             # 4. Initialize Connection
-            print("DEBUG: Creating Deepgram connection object", flush=True)
             dg_connection = self.client.listen.live.v("1")
             
             # ... (register listeners) ...
             def on_message(_, result, **kwargs):
-                print(f"DEBUG: on_message callback triggered!", flush=True)
                 service._handle_transcript_event(session_id, result, loop)
             
             def on_error(_, error, **kwargs):
-                print(f"DEBUG: Deepgram Error: {error}", flush=True)
                 logger.error(f"Deepgram Error for session {session_id}: {error}")
             
             def on_close(_, close, **kwargs):
-                print(f"DEBUG: Deepgram Connection closed for session {session_id}", flush=True)
                 logger.info(f"Deepgram Connection closed for session {session_id}")
                 if session_id in service._connections:
                     del service._connections[session_id]
@@ -79,18 +74,14 @@ class DeepgramService:
             dg_connection.on(LiveTranscriptionEvents.Error, on_error)
             dg_connection.on(LiveTranscriptionEvents.Close, on_close)
             
-            print("DEBUG: Starting connection...")
             if dg_connection.start(options) is False:
-                print("DEBUG: dg_connection.start() returned False")
                 raise Exception("Failed to start Deepgram connection")
 
             # Store connection
             self._connections[session_id] = dg_connection
-            print(f"DEBUG: Deepgram connection started and stored for {session_id}")
             logger.info(f"Started Deepgram v3 transcription for session: {session_id}")
 
         except Exception as e:
-            print(f"DEBUG: Exception in start_transcription: {e}")
             logger.error(f"Failed to start transcription: {str(e)}")
             if session_id in self._connections:
                 del self._connections[session_id]
@@ -101,16 +92,12 @@ class DeepgramService:
         try:
             callback = self._on_transcript_callbacks.get(session_id)
             if not callback:
-                print(f"DEBUG: No callback registered for session {session_id}", flush=True)
+                logger.debug("No callback registered for session %s", session_id)
                 return
 
-            print(f"DEBUG: Transcript event received for {session_id}", flush=True)
-            print(f"DEBUG: Result type: {type(result)}, has channel: {hasattr(result, 'channel')}", flush=True)
-
             # Only process FINAL transcripts to avoid duplicates
             is_final = getattr(result, 'is_final', False)
             if not is_final:
-                print(f"DEBUG: Skipping interim result", flush=True)
                 return
 
             if result.channel and result.channel.alternatives:
@@ -123,7 +110,6 @@ class DeepgramService:
                     speaker = "customer" # Default
                     
                     logging.info(f"Transcript [{session_id}] (final={is_final}): {transcript}")
-                    print(f"DEBUG: Dispatching FINAL transcript to WebSocket: {transcript[:50]}...", flush=True)
                     
                     # Run callback on the main loop
                     if loop and callback:
@@ -132,13 +118,10 @@ class DeepgramService:
                             loop
                         )
             else:
-                print(f"DEBUG: No channel or alternatives in result", flush=True)
+                logger.debug("No channel or alternatives in result for %s", session_id)
             
         except Exception as e:
-            logger.error(f"Error handling transcript event: {e}")
-            print(f"DEBUG Error handling transcript: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
+            logger.error(f"Error handling transcript event: {e}", exc_info=True)
 
     async def send_audio(self, session_id: str, audio_data: bytes):
         """Send audio bytes to Deepgram."""
@@ -1,7 +1,7 @@
 
 import google.generativeai as genai
 from config import settings
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,27 +41,21 @@ Rules:
 - IMPORTANT: Do not say "I cannot answer" just because documents are missing. Be a general chatbot.
 """
     
-    def generate_response(
+    def _build_prompt(
         self,
         query: str,
         context_chunks: List[Dict[str, any]],
         conversation_history: Optional[List[str]] = None
-    ) -> Dict[str, any]:
-        """
-        Generate AI response based on query and RAG context using Gemini.
-        """
-        try:
-            if not self.model:
-                raise ValueError("Google API Key not configured.")
-
-            # Build context from chunks
-            context_text = "\n\n".join([
-                f"Source: {chunk.get('metadata', {}).get('source', 'Unknown')}\n{chunk.get('text', '')}"
-                for chunk in context_chunks
-            ])
-            
-            # Construct Prompt
-            full_prompt = f"""{self.system_prompt}
+    ) -> str:
+        """Build the prompt for a RAG-grounded answer."""
+        # Build context from chunks
+        context_text = "\n\n".join([
+            f"Source: {chunk.get('metadata', {}).get('source', 'Unknown')}\n{chunk.get('text', '')}"
+            for chunk in context_chunks
+        ])
+        
+        # Construct Prompt
+        full_prompt = f"""{self.system_prompt}
 
 CONTEXT FROM INSURANCE DOCUMENTS:
 {context_text}
@@ -71,44 +65,66 @@ CUSTOMER QUESTION:
 
 Provide your response following the exact format specified above.
 """
-            # Add history if available
-            if conversation_history:
-                history_text = "\n".join(conversation_history[-5:])
-                full_prompt += f"\n\nRECENT CONVERSATION:\n{history_text}\n"
+        # Add history if available
+        if conversation_history:
+            history_text = "\n".join(conversation_history[-5:])
+            full_prompt += f"\n\nRECENT CONVERSATION:\n{history_text}\n"
+        
+        return full_prompt
+    
+    def parse_response(self, response_text: str) -> Dict[str, any]:
+        """
+        Parse the ANSWER/FOLLOW_UP/CONFIDENCE format into a result dict.
+        """
+        answer = ""
+        follow_up = ""
+        confidence = "MEDIUM"
+        
+        for line in response_text.split('\n'):
+            if line.startswith('ANSWER:'):
+                answer = line.replace('ANSWER:', '').strip()
+            elif line.startswith('FOLLOW_UP:'):
+                follow_up = line.replace('FOLLOW_UP:', '').strip()
+            elif line.startswith('CONFIDENCE:'):
+                confidence = line.replace('CONFIDENCE:', '').strip()
+        
+        # Fallback if parsing fails
+        if not answer:
+            answer = response_text
+        
+        # Map confidence to numeric
+        confidence_map = {"LOW": 0.5, "MEDIUM": 0.75, "HIGH": 0.95}
+        confidence_score = confidence_map.get(confidence, 0.75)
+        
+        return {
+            'answer': answer,
+            'follow_up_question': follow_up,
+            'confidence': confidence_score,
+            'raw_response': response_text
+        }
+    
+    def generate_response(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, any]],
+        conversation_history: Optional[List[str]] = None
+    ) -> Dict[str, any]:
+        """
+        Generate AI response based on query and RAG context using Gemini.
+        """
+        try:
+            if not self.model:
+                raise ValueError("Google API Key not configured.")
+
+            full_prompt = self._build_prompt(query, context_chunks, conversation_history)
 
             # Generate response
             response = self.model.generate_content(full_prompt)
             response_text = response.text
             
-            # Parse response
-            answer = ""
-            follow_up = ""
-            confidence = "MEDIUM"
-            
-            for line in response_text.split('\n'):
-                if line.startswith('ANSWER:'):
-                    answer = line.replace('ANSWER:', '').strip()
-                elif line.startswith('FOLLOW_UP:'):
-                    follow_up = line.replace('FOLLOW_UP:', '').strip()
-                elif line.startswith('CONFIDENCE:'):
-                    confidence = line.replace('CONFIDENCE:', '').strip()
-            
-            # Fallback if parsing fails
-            if not answer:
-                answer = response_text
-            
-            # Map confidence to numeric
-            confidence_map = {"LOW": 0.5, "MEDIUM": 0.75, "HIGH": 0.95}
-            confidence_score = confidence_map.get(confidence, 0.75)
-            
             logger.info(f"Generated Gemini response for query: {query[:50]}...")
             
-            return {
-                'answer': answer,
-                'follow_up_question': follow_up,
-                'confidence': confidence_score,
-                'raw_response': response_text
-            }
+            return self.parse_response(response_text)
             
         except Exception as e:
             logger.error(f"Failed to generate Gemini response: {str(e)}")
@@ -119,6 +135,30 @@ Provide your response following the exact format specified above.
                 'error': str(e)
             }
     
+    def stream_response(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, any]],
+        conversation_history: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Stream the raw response text as it is generated.
+        
+        Yields:
+            Text deltas in order; join them and pass to parse_response
+            for the structured result
+        """
+        if not self.model:
+            raise ValueError("Google API Key not configured.")
+        
+        response = self.model.generate_content(
+            self._build_prompt(query, context_chunks, conversation_history),
+            stream=True
+        )
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+    
     def generate_summary(
         self,
         conversation_transcript: str
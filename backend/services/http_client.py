@@ -0,0 +1,71 @@
+"""
+Shared async HTTP clients for outbound API calls (Zoom, Twilio, ...).
+
+Pooled httpx.AsyncClients per process keep TCP+TLS connections alive
+across requests instead of reconnecting per call. Hot API hosts get their
+own client with HTTP/2, so concurrent calls multiplex over one connection.
+"""
+
+from typing import Dict, Optional
+import importlib.util
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+_host_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_http_client(origin: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    Get or create a shared AsyncClient (lazy initialization).
+
+    Args:
+        origin: API origin (e.g. "https://api.zoom.us") for a dedicated
+            HTTP/2 client; None for the general-purpose client
+
+    Returns:
+        Shared client; requests still pass absolute URLs
+    """
+    global _client
+
+    if origin is None:
+        if _client is None or _client.is_closed:
+            _client = httpx.AsyncClient(
+                timeout=10,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+            logger.info("Shared HTTP client created")
+        return _client
+
+    client = _host_clients.get(origin)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=origin,
+            http2=HTTP2_AVAILABLE,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+        _host_clients[origin] = client
+        logger.info(f"HTTP client for {origin} created (http2={HTTP2_AVAILABLE})")
+    return client
+
+
+async def close_http_client():
+    """Close the shared clients (application shutdown)."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+    for client in _host_clients.values():
+        await client.aclose()
+    _host_clients.clear()
+
+    logger.info("Shared HTTP clients closed")
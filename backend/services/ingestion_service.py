@@ -7,15 +7,53 @@ from datetime import datetime
 
 # External libraries
 import docx
-import PyPDF2
 
 # Services
 from services.sharepoint_service import sharepoint_service
 from rag.embeddings import embedding_service
-from rag.pinecone_client import pinecone_client
+from rag.embed_cache import embed_cache
+from rag.pdf_text import extract_pdf_text
+from rag.pinecone_client import get_pinecone_client
 
 logger = logging.getLogger(__name__)
 
+
+def _to_timestamp(value: Optional[str]) -> float:
+    """Convert a Graph ISO-8601 datetime to epoch seconds (0 if missing)."""
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def extract_sharepoint_metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize SharePoint metadata fields.
+    
+    Shared by every ingestion path so vectors carry the fields the
+    retriever filters on (see build_metadata_filter).
+    """
+    # Graph API returns custom columns in 'fields' dict
+    fields = item.get('fields', {})
+    
+    metadata = {
+        "filename": item.get('name'),
+        "sharepoint_id": item.get('id'),
+        "web_url": item.get('webUrl'),
+        "last_modified": item.get('lastModifiedDateTime'),
+        "last_modified_ts": _to_timestamp(item.get('lastModifiedDateTime')),
+        "state": fields.get('State', 'General'),
+        "product_universe": fields.get('ProductUniverse', 'General'),
+        "regulator": fields.get('Regulator', 'General'),
+        "authority_level": fields.get('AuthorityLevel', 'Reference'),
+        "carrier": fields.get('Carrier', 'None')
+    }
+    # Pinecone rejects null metadata values (e.g. no webUrl in local mode)
+    return {key: value for key, value in metadata.items() if value is not None}
+
+
 class IngestionService:
     """
     Orchestrates the RAG ingestion pipeline:
@@ -35,7 +73,18 @@ class IngestionService:
     def __init__(self):
         self.sharepoint = sharepoint_service
         self.embeddings = embedding_service
-        self.pinecone = pinecone_client
+        self._pinecone = None
+    
+    @property
+    def pinecone(self):
+        """Pinecone client, connected on first use (tests may assign a mock)."""
+        if self._pinecone is None:
+            self._pinecone = get_pinecone_client()
+        return self._pinecone
+    
+    @pinecone.setter
+    def pinecone(self, client):
+        self._pinecone = client
         
     async def run_pipeline(self, site_name: str = "EliteDealBroker"):
         """Run the full ingestion pipeline."""
@@ -114,7 +163,7 @@ class IngestionService:
                     
                     # Parse & Chunk
                     # Pass folder_name as universe
-                    metadata = self._extract_metadata(item)
+                    metadata = extract_sharepoint_metadata(item)
                     metadata['universe'] = folder_name # Explicit Universe Tagging
                     
                     chunks = self._parse_and_chunk(filename, content, metadata)
@@ -124,7 +173,11 @@ class IngestionService:
                     # Embed & Upsert
                     vectors_to_upsert = []
                     texts_to_embed = [c['text'] for c in chunks]
-                    embeddings_list = self.embeddings.embed_batch(texts_to_embed)
+                    embeddings_list = await embed_cache.get_or_compute_many_async(
+                        texts_to_embed,
+                        self.embeddings.model_name,
+                        self.embeddings.embed_batch_async
+                    )
                     
                     for i, chunk in enumerate(chunks):
                         vector = {
@@ -134,7 +187,7 @@ class IngestionService:
                         }
                         vectors_to_upsert.append(vector)
                     
-                    count = self.pinecone.upsert_chunks(vectors_to_upsert)
+                    count = await self.pinecone.upsert_chunks_async(vectors_to_upsert)
                     chunks_upserted += count
                     docs_processed += 1
                     
@@ -143,23 +196,6 @@ class IngestionService:
                 
         logger.info(f"Pipeline Complete. Docs: {docs_processed}, Chunks: {chunks_upserted}")
 
-    def _extract_metadata(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize SharePoint metadata fields."""
-        # Graph API returns custom columns in 'fields' dict
-        fields = item.get('fields', {})
-        
-        return {
-            "filename": item.get('name'),
-            "sharepoint_id": item.get('id'),
-            "web_url": item.get('webUrl'),
-            "last_modified": item.get('lastModifiedDateTime'),
-            "state": fields.get('State', 'General'),
-            "product_universe": fields.get('ProductUniverse', 'General'),
-            "regulator": fields.get('Regulator', 'General'),
-            "authority_level": fields.get('AuthorityLevel', 'Reference'),
-            "carrier": fields.get('Carrier', 'None')
-        }
-
     def _parse_and_chunk(self, filename: str, content: bytes, base_metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parse file content and split into chunks."""
         text_chunks = []
@@ -246,10 +282,7 @@ class IngestionService:
         Since PDF structure is hard, we use sliding window of ~300 words.
         """
         try:
-            reader = PyPDF2.PdfReader(io.BytesIO(content))
-            full_text = ""
-            for page in reader.pages:
-                full_text += page.extract_text() + "\n"
+            full_text = extract_pdf_text(content)
                 
             # Simple text splitting
             words = full_text.split()
@@ -2,8 +2,8 @@
 Complete Microsoft Bookings OAuth integration.
 """
 
-from msal import ConfidentialClientApplication
 from config import settings
+from services.msal_service import msal_service
 from typing import Optional, Dict, Any
 import requests
 import logging
@@ -23,13 +23,11 @@ class MicrosoftBookingsService:
         self.authority = f"https://login.microsoftonline.com/{self.tenant_id}"
         self.scopes = ["https://graph.microsoft.com/.default"]
         self.graph_endpoint = "https://graph.microsoft.com/v1.0"
-        
-        # Create MSAL app
-        self.app = ConfidentialClientApplication(
-            client_id=self.client_id,
-            client_credential=self.client_secret,
-            authority=self.authority
-        )
+    
+    @property
+    def app(self):
+        """Shared MSAL app (created on first use)."""
+        return msal_service.app
     
     def get_auth_url(self, redirect_uri: str) -> str:
         """
@@ -83,21 +81,13 @@ class MicrosoftBookingsService:
         """
         Get access token using client credentials flow.
         
+        The token is shared with other Graph callers and refreshed ahead
+        of expiry.
+        
         Returns:
             Access token string
         """
-        try:
-            result = self.app.acquire_token_for_client(scopes=self.scopes)
-            
-            if "access_token" in result:
-                return result["access_token"]
-            else:
-                logger.error(f"Failed to get token: {result.get('error_description')}")
-                return None
-        
-        except Exception as e:
-            logger.error(f"Failed to get access token: {str(e)}")
-            return None
+        return msal_service.get_token()
     
     def create_booking(
         self,
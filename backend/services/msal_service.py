@@ -0,0 +1,139 @@
+"""
+Shared Microsoft identity (MSAL) client and Graph app-token cache.
+
+SharePoint ingestion, Microsoft Bookings and the Graph scripts all use the
+same App Registration. They share one ConfidentialClientApplication,
+created on first use (construction contacts Azure AD, so it must not
+happen at import time). One client-credentials token is reused until
+REFRESH_MARGIN before expiry, and a background task refreshes it ahead of
+time so Graph calls never wait on Azure AD.
+"""
+
+from config import settings
+from pathlib import Path
+from typing import Optional
+import asyncio
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+GRAPH_SCOPES = ["https://graph.microsoft.com/.default"]
+REFRESH_MARGIN = 300  # seconds before expiry
+RETRY_INTERVAL = 60  # seconds after a failed refresh
+
+
+class MSALService:
+    """Lazily-created MSAL app with a proactively refreshed app token."""
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Args:
+            cache_path: Optional file to persist the MSAL token cache in
+                (for short-lived scripts; the server keeps it in memory)
+        """
+        self.authority = f"https://login.microsoftonline.com/{settings.ms_tenant_id}"
+        self.cache_path = cache_path
+        self._app = None
+        self._cache = None
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def app(self):
+        """The ConfidentialClientApplication (created on first use)."""
+        if self._app is None:
+            with self._lock:
+                if self._app is None:
+                    from msal import ConfidentialClientApplication, SerializableTokenCache
+
+                    self._cache = SerializableTokenCache()
+                    if self.cache_path and self.cache_path.exists():
+                        self._cache.deserialize(self.cache_path.read_text())
+
+                    self._app = ConfidentialClientApplication(
+                        client_id=settings.ms_client_id,
+                        client_credential=settings.ms_client_secret,
+                        authority=self.authority,
+                        token_cache=self._cache
+                    )
+        return self._app
+
+    def _token_is_fresh(self) -> bool:
+        return self._token is not None and self._expires_at - time.time() > REFRESH_MARGIN
+
+    def _refresh(self) -> Optional[str]:
+        app = self.app
+        with self._lock:
+            if self._token_is_fresh():
+                return self._token
+
+            result = app.acquire_token_for_client(scopes=GRAPH_SCOPES)
+            self._save_cache()
+
+            if "access_token" not in result:
+                logger.error(f"Failed to get Graph token: {result.get('error_description')}")
+                return None
+
+            self._token = result["access_token"]
+            self._expires_at = time.time() + int(result.get("expires_in", 3600))
+            return self._token
+
+    def _save_cache(self):
+        if self.cache_path and self._cache.has_state_changed:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(self._cache.serialize())
+            os.chmod(self.cache_path, 0o600)
+
+    def get_token(self) -> Optional[str]:
+        """
+        Get a Graph app token, acquiring one only when near expiry.
+
+        Returns:
+            Access token, or None if acquisition failed
+        """
+        if self._token_is_fresh():
+            return self._token
+        try:
+            return self._refresh()
+        except Exception as e:
+            logger.error(f"Token acquisition failed: {str(e)}")
+            return None
+
+    async def aget_token(self) -> Optional[str]:
+        """Async variant of get_token (acquisition runs in a thread)."""
+        if self._token_is_fresh():
+            return self._token
+        return await asyncio.to_thread(self.get_token)
+
+    def start(self):
+        """Start proactive token refresh (application startup)."""
+        if self._task is None and settings.ms_client_id and settings.ms_client_secret:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """Stop proactive token refresh (application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self):
+        while True:
+            token = await self.aget_token()
+            if token:
+                delay = self._expires_at - time.time() - REFRESH_MARGIN
+            else:
+                delay = RETRY_INTERVAL
+            await asyncio.sleep(max(delay, RETRY_INTERVAL))
+
+
+# Global service instance
+msal_service = MSALService()
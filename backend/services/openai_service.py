@@ -1,7 +1,7 @@
 
 from openai import OpenAI
 from config import settings
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,31 +42,25 @@ Rules:
 - IMPORTANT: Do not say "I cannot answer" just because documents are missing. Be a general chatbot.
 """
     
-    def generate_response(
+    def _build_messages(
         self,
         query: str,
         context_chunks: List[Dict[str, any]],
         conversation_history: Optional[List[str]] = None
-    ) -> Dict[str, any]:
-        """
-        Generate AI response based on query and RAG context using OpenAI.
-        """
-        try:
-            if not self.client:
-                raise ValueError("OpenAI API Key not configured.")
-
-            # Build context from chunks
-            context_text = "\n\n".join([
-                f"Source: {chunk.get('metadata', {}).get('source', 'Unknown')}\n{chunk.get('text', '')}"
-                for chunk in context_chunks
-            ])
-            
-            # Build messages
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-            ]
-            
-            user_content = f"""CONTEXT FROM INSURANCE DOCUMENTS:
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a RAG-grounded answer."""
+        # Build context from chunks
+        context_text = "\n\n".join([
+            f"Source: {chunk.get('metadata', {}).get('source', 'Unknown')}\n{chunk.get('text', '')}"
+            for chunk in context_chunks
+        ])
+        
+        # Build messages
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+        ]
+        
+        user_content = f"""CONTEXT FROM INSURANCE DOCUMENTS:
 {context_text}
 
 CUSTOMER QUESTION:
@@ -75,12 +69,59 @@ CUSTOMER QUESTION:
 Provide your response following the exact format specified above.
 """
 
-            # Add conversation history if available
-            if conversation_history:
-                history_text = "\n".join(conversation_history[-5:])
-                user_content += f"\n\nRECENT CONVERSATION:\n{history_text}\n"
+        # Add conversation history if available
+        if conversation_history:
+            history_text = "\n".join(conversation_history[-5:])
+            user_content += f"\n\nRECENT CONVERSATION:\n{history_text}\n"
 
-            messages.append({"role": "user", "content": user_content})
+        messages.append({"role": "user", "content": user_content})
+        return messages
+    
+    def parse_response(self, response_text: str) -> Dict[str, any]:
+        """
+        Parse the ANSWER/FOLLOW_UP/CONFIDENCE format into a result dict.
+        """
+        answer = ""
+        follow_up = ""
+        confidence = "MEDIUM"
+        
+        for line in response_text.split('\n'):
+            if line.startswith('ANSWER:'):
+                answer = line.replace('ANSWER:', '').strip()
+            elif line.startswith('FOLLOW_UP:'):
+                follow_up = line.replace('FOLLOW_UP:', '').strip()
+            elif line.startswith('CONFIDENCE:'):
+                confidence = line.replace('CONFIDENCE:', '').strip()
+        
+        # Fallback if parsing fails
+        if not answer:
+            answer = response_text
+        
+        # Map confidence to numeric
+        confidence_map = {"LOW": 0.5, "MEDIUM": 0.75, "HIGH": 0.95}
+        confidence_score = confidence_map.get(confidence, 0.75)
+        
+        return {
+            'answer': answer,
+            'follow_up_question': follow_up,
+            'confidence': confidence_score,
+            'raw_response': response_text
+        }
+    
+    def generate_response(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, any]],
+        conversation_history: Optional[List[str]] = None
+    ) -> Dict[str, any]:
+        """
+        Generate AI response based on query and RAG context using OpenAI.
+        """
+        try:
+            if not self.client:
+                raise ValueError("OpenAI API Key not configured.")
+
+            messages = self._build_messages(query, context_chunks, conversation_history)
             
             # Generate response
             response = self.client.chat.completions.create(
@@ -91,35 +132,9 @@ Provide your response following the exact format specified above.
             
             response_text = response.choices[0].message.content
             
-            # Parse response
-            answer = ""
-            follow_up = ""
-            confidence = "MEDIUM"
-            
-            for line in response_text.split('\n'):
-                if line.startswith('ANSWER:'):
-                    answer = line.replace('ANSWER:', '').strip()
-                elif line.startswith('FOLLOW_UP:'):
-                    follow_up = line.replace('FOLLOW_UP:', '').strip()
-                elif line.startswith('CONFIDENCE:'):
-                    confidence = line.replace('CONFIDENCE:', '').strip()
-            
-            # Fallback if parsing fails
-            if not answer:
-                answer = response_text
-            
-            # Map confidence to numeric
-            confidence_map = {"LOW": 0.5, "MEDIUM": 0.75, "HIGH": 0.95}
-            confidence_score = confidence_map.get(confidence, 0.75)
-            
             logger.info(f"Generated OpenAI response for query: {query[:50]}...")
             
-            return {
-                'answer': answer,
-                'follow_up_question': follow_up,
-                'confidence': confidence_score,
-                'raw_response': response_text
-            }
+            return self.parse_response(response_text)
             
         except Exception as e:
             logger.error(f"Failed to generate OpenAI response: {str(e)}")
@@ -130,6 +145,34 @@ Provide your response following the exact format specified above.
                 'error': str(e)
             }
     
+    def stream_response(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, any]],
+        conversation_history: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Stream the raw response text as it is generated.
+        
+        Yields:
+            Text deltas in order; join them and pass to parse_response
+            for the structured result
+        """
+        if not self.client:
+            raise ValueError("OpenAI API Key not configured.")
+        
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(query, context_chunks, conversation_history),
+            temperature=0.7,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+    
     def generate_summary(
         self,
         conversation_transcript: str
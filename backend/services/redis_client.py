@@ -0,0 +1,39 @@
+"""
+Shared async Redis client (optional).
+
+Only available when REDIS_URL is configured; callers treat a None client
+as "no shared cache" and fall back to the database.
+"""
+
+from config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis():
+    """
+    Get or create the shared redis.asyncio client (lazy initialization).
+
+    Returns:
+        Redis client, or None when REDIS_URL is not set
+    """
+    global _client
+
+    if _client is None and settings.redis_url:
+        import redis.asyncio as redis
+        _client = redis.from_url(settings.redis_url)
+        logger.info("Redis client created")
+
+    return _client
+
+
+async def close_redis():
+    """Close the shared client (application shutdown)."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
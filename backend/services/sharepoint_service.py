@@ -1,6 +1,6 @@
 
-from msal import ConfidentialClientApplication
 from config import settings
+from services.msal_service import msal_service
 from typing import Optional, Dict, Any, List
 import requests
 import logging
@@ -22,31 +22,10 @@ class SharePointService:
         self.authority = f"https://login.microsoftonline.com/{self.tenant_id}"
         self.scopes = ["https://graph.microsoft.com/.default"]
         self.graph_endpoint = "https://graph.microsoft.com/v1.0"
-        
-        # Create MSAL app
-        self.app = ConfidentialClientApplication(
-            client_id=self.client_id,
-            client_credential=self.client_secret,
-            authority=self.authority
-        )
-        
-        # Cache token briefly
-        self._access_token = None
 
     def get_access_token(self) -> Optional[str]:
-        """Get valid access token."""
-        try:
-            # Check if token needs refresh (simplified, MSAL handles caching usually)
-            result = self.app.acquire_token_for_client(scopes=self.scopes)
-            
-            if "access_token" in result:
-                return result["access_token"]
-            else:
-                logger.error(f"Failed to get token: {result.get('error_description')}")
-                return None
-        except Exception as e:
-            logger.error(f"Token acquisition failed: {e}")
-            return None
+        """Get valid access token (shared, refreshed ahead of expiry)."""
+        return msal_service.get_token()
 
     def _get_headers(self) -> Optional[Dict[str, str]]:
         token = self.get_access_token()
@@ -0,0 +1,139 @@
+"""
+Background SMS dispatch with sender-rate pacing.
+
+Request handlers enqueue messages and return immediately; one worker task
+per process sends them through Twilio no faster than
+``settings.sms_rate_per_second`` and retries failures with exponential
+backoff. Lead rows are updated with the message SID and status, and the
+/api/twilio/sms-status webhook records final delivery.
+
+The queue lives in process memory: messages still queued at shutdown are
+dropped and their leads stay in the "queued" state (use resend-sms).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import update
+
+from config import settings
+from database import AsyncSessionLocal
+from db_models import Lead
+from services.sms_status import forward_status, invalidate_cached_leads, status_rank
+from services.twilio_service import twilio_service
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+BASE_BACKOFF = 2.0  # seconds; doubled per attempt
+
+
+@dataclass(slots=True)
+class SMSJob:
+    """One outbound message."""
+    to: str
+    body: str
+    lead_id: Optional[uuid.UUID] = None
+    attempt: int = 0
+
+
+class SMSDispatcher:
+    """Paced, retrying SMS sender running as a background task."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the worker task (application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"SMS dispatcher started ({settings.sms_rate_per_second}/s)")
+
+    async def stop(self):
+        """Stop the worker task (application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            if not self._queue.empty():
+                logger.warning(f"SMS dispatcher stopped with {self._queue.qsize()} messages unsent")
+
+    def enqueue(self, to: str, body: str, lead_id: Optional[uuid.UUID] = None):
+        """
+        Queue a message for sending (non-blocking).
+
+        Args:
+            to: Recipient phone number
+            body: Message text
+            lead_id: Lead whose SMS columns track this message
+        """
+        self._queue.put_nowait(SMSJob(to=to, body=body, lead_id=lead_id))
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / settings.sms_rate_per_second
+
+        while True:
+            job = await self._queue.get()
+            started = loop.time()
+
+            await self._send(job)
+
+            # Pace sends to the sender's rate limit
+            delay = interval - (loop.time() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _send(self, job: SMSJob):
+        job.attempt += 1
+        try:
+            sid = await twilio_service.asend_message(
+                job.to,
+                job.body,
+                status_callback=settings.twilio_status_callback_url
+            )
+        except Exception as e:
+            if job.attempt < MAX_ATTEMPTS:
+                backoff = BASE_BACKOFF * 2 ** (job.attempt - 1)
+                logger.warning(f"SMS to {job.to} failed (attempt {job.attempt}), retrying in {backoff:.0f}s: {str(e)}")
+                asyncio.get_running_loop().call_later(backoff, self._queue.put_nowait, job)
+            else:
+                logger.error(f"SMS to {job.to} failed after {job.attempt} attempts: {str(e)}")
+                await self._update_lead(job.lead_id, "failed")
+            return
+
+        logger.info(f"SMS sent to {job.to}: {sid}")
+        await self._update_lead(
+            job.lead_id,
+            "sent",
+            sms_sent=True,
+            sms_sent_at=datetime.utcnow(),
+            sms_sid=sid
+        )
+
+    @staticmethod
+    async def _update_lead(lead_id: Optional[uuid.UUID], status: str, **values):
+        if lead_id is None:
+            return
+        # A delivery callback may already have moved the status past this one
+        values["sms_status"] = forward_status(status, status_rank(status))
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(update(Lead).where(Lead.id == lead_id).values(**values))
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to update SMS status for lead {lead_id}: {str(e)}")
+            return
+        await invalidate_cached_leads([lead_id])
+
+
+# Global dispatcher instance
+sms_dispatcher = SMSDispatcher()
@@ -0,0 +1,77 @@
+"""
+Lead SMS status helpers shared by the dispatcher, the status-callback
+buffer and the lead routes.
+
+Twilio callbacks and the dispatcher's own writes can arrive in any order,
+so status updates only ever move a lead forward (queued -> sent ->
+delivered/failed). Every write also drops the lead's cached copy so
+GET /api/leads/{id} shows the new status.
+"""
+
+from typing import Iterable
+import logging
+import uuid
+
+from sqlalchemy import case
+
+from db_models import Lead
+from services.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Order of Twilio MessageStatus values; unknown statuses rank as queued
+SMS_STATUS_RANK = {
+    "queued": 0,
+    "accepted": 0,
+    "scheduled": 0,
+    "sending": 1,
+    "sent": 2,
+    "delivered": 3,
+    "undelivered": 3,
+    "failed": 3,
+    "canceled": 3,
+    "read": 4
+}
+
+_current_rank = case(SMS_STATUS_RANK, value=Lead.sms_status, else_=-1)
+
+
+def status_rank(status: str) -> int:
+    """Rank of a status (see SMS_STATUS_RANK)."""
+    return SMS_STATUS_RANK.get(status, 0)
+
+
+def forward_status(status, rank):
+    """
+    SET expression for sms_status that never moves a lead backwards.
+
+    Args:
+        status: New status (value or bindparam)
+        rank: Its rank (value or bindparam)
+
+    Returns:
+        CASE expression keeping the current status unless `status` is later
+    """
+    return case((_current_rank < rank, status), else_=Lead.sms_status)
+
+
+def lead_cache_key(lead_id) -> str:
+    """Redis key of a cached lead (see routes/leads.py)."""
+    return f"lead:{lead_id}"
+
+
+async def invalidate_cached_leads(lead_ids: Iterable[uuid.UUID]):
+    """
+    Drop cached copies of leads after their SMS columns changed.
+
+    Args:
+        lead_ids: Lead primary keys
+    """
+    redis = get_redis()
+    keys = [lead_cache_key(lead_id) for lead_id in lead_ids]
+    if redis is None or not keys:
+        return
+    try:
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate {len(keys)} cached leads: {str(e)}")
@@ -0,0 +1,119 @@
+"""
+Buffered writes of Twilio SMS delivery statuses.
+
+Twilio posts several status callbacks per message (queued, sent,
+delivered, ...). The /api/twilio/sms-status webhook only records them
+here; a background task writes the latest status per message SID to the
+leads table in one executemany UPDATE every FLUSH_INTERVAL seconds, then
+drops the affected leads from the Redis cache.
+"""
+
+from typing import Dict, Optional
+import asyncio
+import logging
+
+from sqlalchemy import Integer, String, bindparam, or_, select, update
+
+from database import AsyncSessionLocal
+from db_models import Lead
+from services.sms_status import forward_status, invalidate_cached_leads, status_rank
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 0.5  # seconds
+MAX_BATCH = 500
+
+# Final states win over in-flight ones that arrive late in the same batch
+_FINAL_STATUSES = {"delivered", "undelivered", "failed"}
+_SENT_STATUSES = {"sent", "delivered"}
+
+_leads = Lead.__table__
+_update_status = (
+    update(_leads)
+    .where(_leads.c.sms_sid == bindparam("sid"))
+    .values(
+        sms_status=forward_status(
+            bindparam("status", type_=String),
+            bindparam("rank", type_=Integer)
+        ),
+        sms_sent=or_(_leads.c.sms_sent, bindparam("sent"))
+    )
+)
+
+
+class SMSStatusBuffer:
+    """Coalesces status callbacks and flushes them periodically."""
+
+    def __init__(self):
+        self._pending: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the flush task (application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush task and write what is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def record(self, message_sid: str, status: str):
+        """
+        Buffer a status update (non-blocking).
+
+        Args:
+            message_sid: Twilio message SID
+            status: Twilio MessageStatus
+        """
+        if self._pending.get(message_sid) in _FINAL_STATUSES and status not in _FINAL_STATUSES:
+            return
+        self._pending[message_sid] = status
+
+    async def flush(self):
+        """Write buffered statuses to the database."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        rows = [
+            {
+                "sid": sid,
+                "status": status,
+                "rank": status_rank(status),
+                "sent": status in _SENT_STATUSES
+            }
+            for sid, status in pending.items()
+        ]
+        sids = list(pending)
+        lead_ids = []
+
+        try:
+            async with AsyncSessionLocal() as db:
+                for i in range(0, len(rows), MAX_BATCH):
+                    await db.execute(_update_status, rows[i:i + MAX_BATCH])
+                    result = await db.execute(
+                        select(Lead.id).where(Lead.sms_sid.in_(sids[i:i + MAX_BATCH]))
+                    )
+                    lead_ids.extend(result.scalars())
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} SMS statuses: {str(e)}")
+            return
+
+        await invalidate_cached_leads(lead_ids)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            await self.flush()
+
+
+# Global buffer instance
+sms_status_buffer = SMSStatusBuffer()
@@ -0,0 +1,133 @@
+"""
+Batched persistence of live transcripts.
+
+Transcription events arrive many times per second per session. Instead of a
+session.add + commit per line, TranscriptRow objects are queued per session
+and written by a single background task per session with one COPY every
+``batch_size`` rows or ``flush_interval`` seconds, whichever comes first.
+"""
+
+from database import engine
+from db_models import Transcript
+from db_models_light import TranscriptRow
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptWriter:
+    """Buffers transcript rows per session and flushes them in batches."""
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.25):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queues: Dict[str, Tuple[uuid.UUID, asyncio.Queue]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def add(
+        self,
+        session_id: str,
+        speaker: str,
+        text: str,
+        confidence: Optional[float] = None
+    ):
+        """
+        Queue a transcript line for persistence (non-blocking).
+
+        Args:
+            session_id: Session identifier
+            speaker: Speaker label (customer, staff, ...)
+            text: Transcribed text
+            confidence: Optional recognition confidence
+        """
+        entry = self._queues.get(session_id)
+        if entry is None:
+            try:
+                session_uuid = uuid.UUID(session_id)
+            except ValueError:
+                # Ad-hoc sessions without a DB row are not persisted
+                return
+            entry = (session_uuid, asyncio.Queue())
+            self._queues[session_id] = entry
+            self._tasks[session_id] = asyncio.create_task(
+                self._run(session_uuid, entry[1])
+            )
+        session_uuid, queue = entry
+
+        queue.put_nowait(TranscriptRow(
+            session_id=session_uuid,
+            speaker=speaker,
+            text=text,
+            confidence=confidence if confidence is not None else 1.0,
+            timestamp=datetime.utcnow()
+        ))
+
+    async def close(self, session_id: str):
+        """
+        Flush any buffered rows for a session and stop its writer task.
+
+        Args:
+            session_id: Session identifier
+        """
+        entry = self._queues.pop(session_id, None)
+        task = self._tasks.pop(session_id, None)
+        if entry is None or task is None:
+            return
+
+        entry[1].put_nowait(None)
+        await task
+
+    async def _run(self, session_uuid: uuid.UUID, queue: asyncio.Queue):
+        """Drain the queue into batches until the None sentinel arrives."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            row = await queue.get()
+            if row is None:
+                return
+
+            batch = [row]
+            stop = False
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stop = True
+                    break
+                batch.append(row)
+
+            await self._flush(session_uuid, batch)
+
+            if stop:
+                return
+
+    async def _flush(self, session_uuid: uuid.UUID, batch: List[TranscriptRow]):
+        """Write one batch with a single COPY into the transcripts table."""
+        records = [row.as_record() for row in batch]
+
+        try:
+            async with engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                await raw.driver_connection.copy_records_to_table(
+                    Transcript.__tablename__,
+                    records=records,
+                    columns=TranscriptRow.COLUMNS
+                )
+            logger.debug(f"Persisted {len(records)} transcript rows for session {session_uuid}")
+        except Exception as e:
+            logger.error(f"Failed to persist {len(records)} transcript rows for session {session_uuid}: {str(e)}")
+
+
+# Global writer instance
+transcript_writer = TranscriptWriter()
@@ -5,11 +5,14 @@ Twilio SMS service for sending booking links to customers.
 from twilio.rest import Client
 from config import settings
 from models import SMSRequest, SMSResponse
+from services.http_client import get_http_client
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+TWILIO_API_ORIGIN = "https://api.twilio.com"
+
 
 class TwilioService:
     """Handles SMS sending via Twilio."""
@@ -20,6 +23,42 @@ class TwilioService:
             settings.twilio_auth_token
         )
         self.from_number = settings.twilio_phone_number
+        self._messages_url = (
+            f"{TWILIO_API_ORIGIN}/2010-04-01/Accounts/"
+            f"{settings.twilio_account_sid}/Messages.json"
+        )
+    
+    @staticmethod
+    def booking_message(
+        booking_url: str,
+        customer_name: Optional[str],
+        description: Optional[str],
+        meeting_id: str,
+        passcode: str
+    ) -> str:
+        """Build the booking SMS body."""
+        # Construct message
+        greeting = f"Hi {customer_name}" if customer_name else "Hello"
+        
+        # Build message body
+        message_parts = [f"{greeting},\n"]
+        
+        # Add description if provided
+        if description:
+            message_parts.append(f"{description}\n\n")
+        else:
+            message_parts.append("Thank you for your interest in our insurance services.\n\n")
+        
+        # Add booking link and credentials
+        message_parts.append(
+            f"Please use the link below to schedule your consultation:\n\n"
+            f"{booking_url}\n\n"
+            f"Meeting ID: {meeting_id}\n"
+            f"Passcode: {passcode}\n\n"
+            f"We look forward to speaking with you!"
+        )
+        
+        return "".join(message_parts)
     
     def send_booking_sms(
         self,
@@ -43,29 +82,10 @@ class TwilioService:
             SMSResponse with success status and message SID
         """
         try:
-            # Construct message
-            greeting = f"Hi {customer_name}" if customer_name else "Hello"
-            
-            # Build message body
-            message_parts = [f"{greeting},\n"]
-            
-            # Add description if provided
-            if description:
-                message_parts.append(f"{description}\n\n")
-            else:
-                message_parts.append("Thank you for your interest in our insurance services.\n\n")
-            
-            # Add booking link and credentials
-            message_parts.append(
-                f"Please use the link below to schedule your consultation:\n\n"
-                f"{booking_url}\n\n"
-                f"Meeting ID: {meeting_id}\n"
-                f"Passcode: {passcode}\n\n"
-                f"We look forward to speaking with you!"
+            message_body = self.booking_message(
+                booking_url, customer_name, description, meeting_id, passcode
             )
             
-            message_body = "".join(message_parts)
-            
             # Send SMS
             message = self.client.messages.create(
                 body=message_body,
@@ -87,6 +107,88 @@ class TwilioService:
                 error=str(e)
             )
     
+    async def asend_message(
+        self,
+        to_phone_number: str,
+        body: str,
+        status_callback: Optional[str] = None
+    ) -> str:
+        """
+        Create a message through the Twilio REST API on the shared client.
+        
+        Args:
+            to_phone_number: Recipient phone number
+            body: Message text
+            status_callback: Optional URL for delivery status webhooks
+        
+        Returns:
+            Message SID
+        
+        Raises:
+            RuntimeError: If Twilio rejects the request
+        """
+        data = {"Body": body, "From": self.from_number, "To": to_phone_number}
+        if status_callback:
+            data["StatusCallback"] = status_callback
+        
+        response = await get_http_client(TWILIO_API_ORIGIN).post(
+            self._messages_url,
+            auth=(settings.twilio_account_sid, settings.twilio_auth_token),
+            data=data
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(f"Twilio API error {response.status_code}: {response.text}")
+        return response.json()["sid"]
+    
+    async def asend_booking_sms(
+        self,
+        to_phone_number: str,
+        booking_url: str,
+        customer_name: Optional[str] = None,
+        description: Optional[str] = None,
+        meeting_id: str = "",
+        passcode: str = ""
+    ) -> SMSResponse:
+        """
+        Send the booking SMS without blocking the event loop.
+        
+        Same message and result as send_booking_sms.
+        """
+        try:
+            message_body = self.booking_message(
+                booking_url, customer_name, description, meeting_id, passcode
+            )
+            message_sid = await self.asend_message(to_phone_number, message_body)
+            
+            logger.info(f"SMS sent to {to_phone_number}: {message_sid}")
+            
+            return SMSResponse(
+                success=True,
+                message_sid=message_sid
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to send SMS to {to_phone_number}: {str(e)}")
+            return SMSResponse(
+                success=False,
+                error=str(e)
+            )
+    
+    @staticmethod
+    def reminder_message(
+        meeting_time: str,
+        join_url: str,
+        customer_name: Optional[str] = None
+    ) -> str:
+        """Build the meeting reminder SMS body."""
+        greeting = f"Hi {customer_name}" if customer_name else "Hello"
+        return (
+            f"{greeting},\n\n"
+            f"Reminder: Your insurance consultation is scheduled for {meeting_time}.\n\n"
+            f"Join the meeting here:\n{join_url}\n\n"
+            f"See you soon!"
+        )
+    
     def send_reminder_sms(
         self,
         to_phone_number: str,
@@ -107,13 +209,7 @@ class TwilioService:
             SMSResponse with success status
         """
         try:
-            greeting = f"Hi {customer_name}" if customer_name else "Hello"
-            message_body = (
-                f"{greeting},\n\n"
-                f"Reminder: Your insurance consultation is scheduled for {meeting_time}.\n\n"
-                f"Join the meeting here:\n{join_url}\n\n"
-                f"See you soon!"
-            )
+            message_body = self.reminder_message(meeting_time, join_url, customer_name)
             
             message = self.client.messages.create(
                 body=message_body,
@@ -2,16 +2,26 @@
 Zoom service for meeting creation and SDK signature generation.
 """
 
+import asyncio
 import jwt
 import time
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from cachetools import TTLCache
 from config import settings
+from services.http_client import get_http_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Join-page refreshes re-request the same meeting and signature; keep them
+# briefly so repeated joins don't spend Zoom's per-account rate limit
+MEETING_CACHE_TTL = 300  # seconds
+SIGNATURE_CACHE_TTL = 60  # seconds (signatures are valid for 2 hours)
+
+ZOOM_API_ORIGIN = "https://api.zoom.us"
+
 
 class ZoomService:
     """Handles Zoom meeting creation and SDK operations."""
@@ -22,9 +32,26 @@ class ZoomService:
         self.client_secret = settings.zoom_client_secret
         self.sdk_key = settings.zoom_sdk_key
         self.sdk_secret = settings.zoom_sdk_secret
-        self.base_url = "https://api.zoom.us/v2"
+        self.base_url = f"{ZOOM_API_ORIGIN}/v2"
         self._oauth_token = None
         self._token_expires_at = 0
+        # Concurrent meeting creation (bulk bookings) shares one token fetch
+        self._token_lock = asyncio.Lock()
+        self._meetings = TTLCache(maxsize=1024, ttl=MEETING_CACHE_TTL)
+        self._signatures = TTLCache(maxsize=4096, ttl=SIGNATURE_CACHE_TTL)
+
+    @property
+    def _oauth_url(self) -> str:
+        return f"https://zoom.us/oauth/token?grant_type=account_credentials&account_id={self.account_id}"
+
+    def _store_oauth_token(self, data: Dict[str, Any]) -> str:
+        self._oauth_token = data['access_token']
+        # Expires in 1 hour usually, set buffer of 5 mins
+        self._token_expires_at = time.time() + data['expires_in'] - 300
+        return self._oauth_token
+
+    def _has_credentials(self) -> bool:
+        return bool(self.account_id and self.client_id and self.client_secret)
 
     def _get_oauth_token(self) -> Optional[str]:
         """Get or refresh Server-to-Server OAuth token."""
@@ -32,25 +59,80 @@ class ZoomService:
             return self._oauth_token
 
         try:
-            url = f"https://zoom.us/oauth/token?grant_type=account_credentials&account_id={self.account_id}"
             auth = (self.client_id, self.client_secret)
             
-            response = requests.post(url, auth=auth)
+            response = requests.post(self._oauth_url, auth=auth)
             
             if response.status_code != 200:
                 logger.error(f"Failed to get Zoom OAuth token: {response.text}")
                 return None
                 
-            data = response.json()
-            self._oauth_token = data['access_token']
-            # Expires in 1 hour usually, set buffer of 5 mins
-            self._token_expires_at = time.time() + data['expires_in'] - 300
-            
+            return self._store_oauth_token(response.json())
+        except Exception as e:
+            logger.error(f"Error getting Zoom OAuth token: {str(e)}")
+            return None
+
+    async def _aget_oauth_token(self) -> Optional[str]:
+        """Async variant of _get_oauth_token on the shared HTTP client."""
+        if self._oauth_token and time.time() < self._token_expires_at:
             return self._oauth_token
+
+        async with self._token_lock:
+            if self._oauth_token and time.time() < self._token_expires_at:
+                return self._oauth_token
+            return await self._afetch_oauth_token()
+
+    async def _afetch_oauth_token(self) -> Optional[str]:
+        try:
+            response = await get_http_client().post(
+                self._oauth_url,
+                auth=(self.client_id, self.client_secret)
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"Failed to get Zoom OAuth token: {response.text}")
+                return None
+            
+            return self._store_oauth_token(response.json())
         except Exception as e:
             logger.error(f"Error getting Zoom OAuth token: {str(e)}")
             return None
 
+    @staticmethod
+    def _meeting_payload(
+        topic: str,
+        duration_minutes: int,
+        start_time: Optional[datetime]
+    ) -> Dict[str, Any]:
+        payload = {
+            'topic': topic,
+            'type': 1 if start_time is None else 2,
+            'duration': duration_minutes,
+            'settings': {
+                'host_video': True,
+                'participant_video': True,
+                'join_before_host': True,
+                'mute_upon_entry': False,
+                'waiting_room': False,
+                'audio': 'both',
+                'auto_recording': 'cloud'
+            }
+        }
+        
+        if start_time:
+            payload['start_time'] = start_time.strftime('%Y-%m-%dT%H:%M:%S')
+        return payload
+
+    @staticmethod
+    def _meeting_result(meeting_data: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info(f"Created Zoom meeting: {meeting_data.get('id')}")
+        return {
+            'meeting_id': str(meeting_data['id']),
+            'meeting_password': meeting_data.get('password', ''),
+            'join_url': meeting_data['join_url'],
+            'start_url': meeting_data['start_url']
+        }
+
     def create_meeting(
         self,
         topic: str = "Insurance Consultation",
@@ -61,7 +143,7 @@ class ZoomService:
         Create a Zoom meeting.
         """
         # Check if Zoom S2S credentials are configured
-        if not self.account_id or not self.client_id or not self.client_secret:
+        if not self._has_credentials():
             logger.warning("Zoom S2S credentials not configured. Using mock meeting data.")
             return self._get_mock_meeting_data(topic, start_time, duration_minutes)
 
@@ -76,28 +158,10 @@ class ZoomService:
                 'Content-Type': 'application/json'
             }
             
-            payload = {
-                'topic': topic,
-                'type': 1 if start_time is None else 2,
-                'duration': duration_minutes,
-                'settings': {
-                    'host_video': True,
-                    'participant_video': True,
-                    'join_before_host': True,
-                    'mute_upon_entry': False,
-                    'waiting_room': False,
-                    'audio': 'both',
-                    'auto_recording': 'cloud'
-                }
-            }
-            
-            if start_time:
-                payload['start_time'] = start_time.strftime('%Y-%m-%dT%H:%M:%S')
-            
             response = requests.post(
                 f'{self.base_url}/users/me/meetings',
                 headers=headers,
-                json=payload
+                json=self._meeting_payload(topic, duration_minutes, start_time)
             )
             
             if response.status_code != 201:
@@ -105,18 +169,61 @@ class ZoomService:
                 logger.warning("Falling back to mock meeting data")
                 return self._get_mock_meeting_data(topic, start_time, duration_minutes)
             
-            meeting_data = response.json()
-            logger.info(f"Created Zoom meeting: {meeting_data.get('id')}")
+            return self._meeting_result(response.json())
             
-            return {
-                'meeting_id': str(meeting_data['id']),
-                'meeting_password': meeting_data.get('password', ''),
-                'join_url': meeting_data['join_url'],
-                'start_url': meeting_data['start_url']
-            }
+        except Exception as e:
+            logger.error(f"Failed to create Zoom meeting: {str(e)}")
+            logger.warning("Falling back to mock meeting data due to error")
+            return self._get_mock_meeting_data(topic, start_time, duration_minutes)
+
+    async def acreate_meeting(
+        self,
+        topic: str = "Insurance Consultation",
+        duration_minutes: int = 30,
+        start_time: Optional[datetime] = None,
+        fallback: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Create a Zoom meeting without blocking the event loop.
+        
+        Same behavior and fallbacks as create_meeting.
+        
+        Args:
+            fallback: Return mock meeting data when the Zoom call fails;
+                with False, failures return None (mock data is still used
+                when no credentials are configured)
+        """
+        if not self._has_credentials():
+            logger.warning("Zoom S2S credentials not configured. Using mock meeting data.")
+            return self._get_mock_meeting_data(topic, start_time, duration_minutes)
+
+        try:
+            token = await self._aget_oauth_token()
+            if not token:
+                if not fallback:
+                    return None
+                logger.warning("Could not get OAuth token. Using mock data.")
+                return self._get_mock_meeting_data(topic, start_time, duration_minutes)
+
+            response = await get_http_client(ZOOM_API_ORIGIN).post(
+                f'{self.base_url}/users/me/meetings',
+                headers={'Authorization': f'Bearer {token}'},
+                json=self._meeting_payload(topic, duration_minutes, start_time)
+            )
+            
+            if response.status_code != 201:
+                logger.error(f"Zoom API Error: {response.text}")
+                if not fallback:
+                    return None
+                logger.warning("Falling back to mock meeting data")
+                return self._get_mock_meeting_data(topic, start_time, duration_minutes)
+            
+            return self._meeting_result(response.json())
             
         except Exception as e:
             logger.error(f"Failed to create Zoom meeting: {str(e)}")
+            if not fallback:
+                return None
             logger.warning("Falling back to mock meeting data due to error")
             return self._get_mock_meeting_data(topic, start_time, duration_minutes)
 
@@ -139,7 +246,13 @@ class ZoomService:
         """
         Generate Zoom Meeting SDK JWT signature.
         For SDK v3.9.0+, the signature must include specific payload fields.
+        Signatures are reused for up to SIGNATURE_CACHE_TTL seconds.
         """
+        cache_key = (str(meeting_number), role)
+        signature = self._signatures.get(cache_key)
+        if signature is not None:
+            return signature
+
         # Current timestamp
         iat = int(time.time())
         # Token expires in 2 hours
@@ -164,12 +277,17 @@ class ZoomService:
 
         logger.info(f"Successfully generated SDK signature for meeting: {meeting_number}")
 
+        self._signatures[cache_key] = signature
         return signature
     
     def get_meeting_details(self, meeting_id: str) -> Optional[Dict[str, Any]]:
         """
         Get details of a Zoom meeting.
         """
+        cached = self._meetings.get(meeting_id)
+        if cached is not None:
+            return cached
+
         try:
             token = self._get_oauth_token()
             if not token:
@@ -185,7 +303,38 @@ class ZoomService:
             )
             response.raise_for_status()
             
-            return response.json()
+            details = response.json()
+            self._meetings[meeting_id] = details
+            return details
+            
+        except Exception as e:
+            logger.error(f"Failed to get meeting details: {str(e)}")
+            return None
+
+    async def aget_meeting_details(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of get_meeting_details on the shared HTTP client.
+        
+        Shares the same cache; failures are not cached.
+        """
+        cached = self._meetings.get(meeting_id)
+        if cached is not None:
+            return cached
+
+        try:
+            token = await self._aget_oauth_token()
+            if not token:
+                return None
+
+            response = await get_http_client(ZOOM_API_ORIGIN).get(
+                f'{self.base_url}/meetings/{meeting_id}',
+                headers={'Authorization': f'Bearer {token}'}
+            )
+            response.raise_for_status()
+            
+            details = response.json()
+            self._meetings[meeting_id] = details
+            return details
             
         except Exception as e:
             logger.error(f"Failed to get meeting details: {str(e)}")
@@ -16,11 +16,11 @@ def test_provider_switch():
     settings = Settings(_env_file='.env') # Force reload
     print(f"    AI API Configured: {settings.ai_provider}")
     
-    from services.ai_factory import AIFactory
+    from services.ai_factory import get_ai_service, reset_ai_service
     # Reset singleton/instance for test
-    AIFactory._instance = None
+    reset_ai_service()
     
-    service = AIFactory.get_service()
+    service = get_ai_service()
     print(f"    Service Class: {service.__class__.__name__}")
     
     if service.__class__.__name__ == 'OpenAIService':
@@ -52,8 +52,8 @@ def test_provider_switch():
     global_settings.ai_provider = 'gemini'
     
     # Reset Factory
-    AIFactory._instance = None
-    service_gemini = AIFactory.get_service()
+    reset_ai_service()
+    service_gemini = get_ai_service()
     print(f"    Service Class: {service_gemini.__class__.__name__}")
     
     if service_gemini.__class__.__name__ == 'GeminiService':
@@ -6,14 +6,14 @@ from typing import Dict, Any
 from websocket.manager import connection_manager
 from services.ai_factory import get_ai_service
 from rag.retriever import retriever_service
+from services.transcript_writer import transcript_writer
+from services.deepgram_service import deepgram_service
+from datetime import datetime
 import logging
 import asyncio
 
 logger = logging.getLogger(__name__)
 
-# Initialize AI Service
-ai_service = get_ai_service()
-
 
 async def handle_transcription_event(
     session_id: str,
@@ -39,6 +39,15 @@ async def handle_transcription_event(
             staff_only=True
         )
         
+        # Persist final transcript lines (batched, non-blocking)
+        if text.strip() and transcript_data.get('is_final', True):
+            transcript_writer.add(
+                session_id,
+                speaker,
+                text,
+                transcript_data.get('confidence')
+            )
+        
         # Trigger AI on valid text (Relaxed speaker check for testing)
         if len(text.strip()) > 10:
             # Process in background
@@ -71,7 +80,7 @@ async def process_customer_query(
         # 2. RAG Retrieval (Optional / Try-Except)
         context_chunks = []
         try:
-            rag_result = retriever_service.retrieve(query, top_k=3)
+            rag_result = await retriever_service.retrieve(query, top_k=3)
             context_chunks = rag_result.get('chunks', [])
             
             # Send RAG context to staff
@@ -89,7 +98,7 @@ async def process_customer_query(
             logger.warning(f"RAG Retrieval failed (skipping): {e}")
 
         # 3. Generate AI Response
-        ai_response = ai_service.generate_response(
+        ai_response = get_ai_service().generate_response(
             query=query,
             context_chunks=context_chunks
         )
@@ -182,15 +191,12 @@ async def handle_start_transcription(session_id: str):
     Start transcription for a session (Idempotent).
     """
     try:
-        from services.deepgram_service import deepgram_service
-        
         # Check if already connected
-        print(f"DEBUG: Checking if already connected for {session_id}", flush=True)
         if deepgram_service.is_connected(session_id):
-            print(f"DEBUG: Already connected, skipping startup for {session_id}", flush=True)
+            logger.debug("Already connected, skipping startup for %s", session_id)
             return
 
-        print(f"DEBUG: Not connected, starting new connection for {session_id}", flush=True)
+        logger.debug("Not connected, starting new connection for %s", session_id)
         
         # Callback to handle new transcripts
         async def on_transcript(text, speaker, confidence):
@@ -3,13 +3,18 @@ WebSocket connection manager for real-time communication.
 """
 
 from fastapi import WebSocket
-from typing import Dict, Set, Optional
+from typing import Dict, Set, Optional, Tuple
 from datetime import datetime
-import json
+import asyncio
+import base64
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Outbound messages buffered per connection before new ones are dropped
+OUTBOUND_QUEUE_SIZE = 256
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time events."""
@@ -18,6 +23,9 @@ class ConnectionManager:
         # Store connections by session_id and role
         # Format: {session_id: {role: {websocket_objects}}}
         self._connections: Dict[str, Dict[str, Set[WebSocket]]] = {}
+        # One outbound queue + writer task per connection, so a broadcast is
+        # a put_nowait per recipient and a slow client never stalls the rest
+        self._writers: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
     
     async def connect(
         self,
@@ -43,6 +51,10 @@ class ConnectionManager:
         
         self._connections[session_id][role].add(websocket)
         
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        task = asyncio.create_task(self._writer(websocket, queue, session_id, role))
+        self._writers[websocket] = (queue, task)
+        
         logger.info(f"Client connected: session={session_id}, role={role}")
     
     def disconnect(
@@ -59,6 +71,19 @@ class ConnectionManager:
             session_id: Session identifier
             role: User role
         """
+        writer = self._unregister(websocket, session_id, role)
+        if writer:
+            writer[1].cancel()
+        
+        logger.info(f"Client disconnected: session={session_id}, role={role}")
+    
+    def _unregister(
+        self,
+        websocket: WebSocket,
+        session_id: str,
+        role: str
+    ) -> Optional[Tuple[asyncio.Queue, asyncio.Task]]:
+        """Remove a connection from its session and return its writer (idempotent)."""
         if session_id in self._connections:
             if role in self._connections[session_id]:
                 self._connections[session_id][role].discard(websocket)
@@ -71,7 +96,35 @@ class ConnectionManager:
                 if not self._connections[session_id]:
                     del self._connections[session_id]
         
-        logger.info(f"Client disconnected: session={session_id}, role={role}")
+        return self._writers.pop(websocket, None)
+    
+    async def _writer(
+        self,
+        websocket: WebSocket,
+        queue: asyncio.Queue,
+        session_id: str,
+        role: str
+    ):
+        """
+        Send queued messages to one connection in order.
+        
+        On a send failure the connection is unregistered, so broadcasts stop
+        queueing messages that nobody will send.
+        
+        Args:
+            websocket: WebSocket connection
+            queue: Outbound queue of serialized messages
+            session_id: Session identifier
+            role: User role
+        """
+        while True:
+            message_json = await queue.get()
+            try:
+                await websocket.send_text(message_json)
+            except Exception as e:
+                logger.error(f"Failed to send message: {str(e)}")
+                self._unregister(websocket, session_id, role)
+                return
     
     async def send_to_session(
         self,
@@ -90,7 +143,9 @@ class ConnectionManager:
         if session_id not in self._connections:
             return
         
-        message_json = json.dumps(message)
+        # Serialize once for all recipients; sent as a text frame since the
+        # frontend parses event.data with JSON.parse
+        message_json = orjson.dumps(message).decode()
         
         # Get target connections
         if role:
@@ -102,12 +157,15 @@ class ConnectionManager:
             for role_connections in self._connections[session_id].values():
                 connections.update(role_connections)
         
-        # Send to all target connections
+        # Hand off to each connection's writer
         for connection in connections:
+            writer = self._writers.get(connection)
+            if writer is None:
+                continue
             try:
-                await connection.send_text(message_json)
-            except Exception as e:
-                logger.error(f"Failed to send message: {str(e)}")
+                writer[0].put_nowait(message_json)
+            except asyncio.QueueFull:
+                logger.warning(f"Outbound queue full, dropping message for session {session_id}")
     
     async def send_to_staff_only(
         self,
@@ -135,8 +193,6 @@ class ConnectionManager:
             session_id: Session identifier
             audio_data: Audio bytes (MP3 format)
         """
-        import base64
-        
         # Encode audio to base64 for JSON transmission
         audio_base64 = base64.b64encode(audio_data).decode('utf-8')
         